@@ -0,0 +1,3 @@
+"""
+Ferramentas de geração de documentos (propostas e relatórios) do sistema
+"""
@@ -0,0 +1,7 @@
+"""Permite rodar a linha de comando com python -m gerador"""
+
+import sys
+
+from gerador.cli import main
+
+sys.exit(main(prog='python -m gerador'))
@@ -0,0 +1,391 @@
+"""
+Acervo do histórico de documentos: partes guardadas por conteúdo
+
+Todo .docx é um zip com as mesmas partes fixas (styles.xml, tema, numeração,
+fontes...) e um document.xml quase igual ao das outras versões. No acervo cada
+parte vira um objeto endereçado pelo sha256 do conteúdo, gravado uma vez só,
+e cada documento tem um manifesto pequeno com a lista das partes de cada versão:
+
+    <acervo>/objetos/ab/abcdef...           parte (zlib, delta ou bruta)
+    <acervo>/documentos/<nome>.json.gz      manifesto com todas as versões
+    <acervo>/bases.json                     bases recentes de cada parte
+
+Partes que mudam pouco (document.xml, o gráfico, docProps/core.xml...) viram
+delta de uma base da mesma parte: o conteúdo é cortado em blocos de
+TAMANHO_BLOCO e cada bloco é comprimido com o zlib usando como dicionário
+(zdict) o trecho correspondente da base; blocos iguais aos da base custam 4
+bytes. Cada parte tem até BASES_POR_PARTE bases recentes (uma por idioma ou
+modelo, na prática) e vale a que der o menor delta. A base é sempre um objeto
+completo, então ler qualquer versão custa no máximo duas leituras por parte;
+quando nenhum delta fica abaixo de LIMITE_DELTA do tamanho da base no disco, a
+parte vira uma nova base.
+
+PNGs já vêm comprimidos e mudam inteiros quando uma barra do gráfico muda.
+Quando recomprimir os pixels reproduz o arquivo byte a byte (é o caso dos
+gráficos do matplotlib), o objeto guarda os pixels descomprimidos, que dão
+deltas pequenos, e o PNG é remontado na leitura.
+
+Ao restaurar, as partes são decodificadas em fluxo direto para o zip de saída,
+na ordem e com as datas do original, e conferidas pelo hash.
+
+    python gerar_proposta_word.py archive add propostas/*.docx --acervo historico
+    python gerar_proposta_word.py archive get PROPOSTA_COMERCIAL_IBVA.docx --versao 3 --acervo historico
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import struct
+import zipfile
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+
+PASTA_OBJETOS = 'objetos'
+PASTA_DOCUMENTOS = 'documentos'
+EXTENSAO_MANIFESTO = '.json.gz'
+NOME_BASES = 'bases.json'
+
+# Primeiro byte do objeto: como o conteúdo foi guardado
+BRUTO = b'R'      # como veio
+COMPLETO = b'Z'   # zlib
+DELTA = b'D'      # sha256 da base (32 bytes) e blocos comprimidos com a base como dicionário
+PNG = b'P'        # PNG com os pixels descomprimidos, seguido de um objeto R, Z ou D
+
+LIMITE_DELTA = 0.5
+NIVEL_ZLIB = 9
+TAMANHO_BLOCO = 16 * 1024  # bloco e meia janela do dicionário (o zlib enxerga 32 KB)
+TAMANHO_LEITURA = 64 * 1024
+BASES_POR_PARTE = 4
+MEMORIA_BASES = 64 * 1024 * 1024  # bases decodificadas mantidas na memória
+
+ASSINATURA_PNG = b'\x89PNG\r\n\x1a\n'
+# (nível, memLevel, estratégia) a tentar para reproduzir o IDAT; o matplotlib (libpng) usa o primeiro
+PARAMETROS_PNG = ((6, 9, zlib.Z_FILTERED), (6, 8, zlib.Z_FILTERED), (6, 8, zlib.Z_DEFAULT_STRATEGY),
+                  (9, 9, zlib.Z_FILTERED), (9, 8, zlib.Z_DEFAULT_STRATEGY))
+
+def _hash(dados):
+    return hashlib.sha256(dados).hexdigest()
+
+def _gravar_atomico(caminho, dados):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(dados)
+    os.replace(temporario, caminho)
+
+def _comprimir(dados, dicionario=None):
+    compressor = (zlib.compressobj(NIVEL_ZLIB, zdict=dicionario) if dicionario
+                  else zlib.compressobj(NIVEL_ZLIB))
+    return compressor.compress(dados) + compressor.flush()
+
+def _janela(base, inicio):
+    """Trecho da base usado como dicionário do bloco que começa em `inicio`"""
+    return base[max(0, inicio - TAMANHO_BLOCO):inicio + TAMANHO_BLOCO]
+
+# ==================== DELTA ====================
+
+def codificar_delta(dados, base):
+    """Blocos de `dados` comprimidos contra a base: [tamanho][zlib], tamanho 0 = igual à base"""
+    saida = []
+    for inicio in range(0, len(dados), TAMANHO_BLOCO):
+        bloco = dados[inicio:inicio + TAMANHO_BLOCO]
+        if bloco == base[inicio:inicio + TAMANHO_BLOCO]:
+            saida.append(struct.pack('>I', 0))
+        else:
+            comprimido = _comprimir(bloco, _janela(base, inicio))
+            saida.append(struct.pack('>I', len(comprimido)) + comprimido)
+    return b''.join(saida)
+
+def decodificar_delta(arquivo, base):
+    """Blocos originais de um delta lido de `arquivo`, um por vez"""
+    inicio = 0
+    while cabecalho := arquivo.read(4):
+        tamanho, = struct.unpack('>I', cabecalho)
+        if tamanho == 0:
+            bloco = base[inicio:inicio + TAMANHO_BLOCO]
+        else:
+            dicionario = _janela(base, inicio)
+            descompressor = zlib.decompressobj(zdict=dicionario) if dicionario else zlib.decompressobj()
+            bloco = descompressor.decompress(arquivo.read(tamanho)) + descompressor.flush()
+        inicio += len(bloco)
+        yield bloco
+
+# ==================== PNG ====================
+
+def _deflate(pixels, parametros):
+    nivel, memoria, estrategia = parametros
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, zlib.MAX_WBITS, memoria, estrategia)
+    return compressor.compress(pixels) + compressor.flush()
+
+def expandir_png(dados):
+    """PNG -> cabeçalho + pixels descomprimidos; None se a recompressão não reproduz o arquivo"""
+    if not dados.startswith(ASSINATURA_PNG):
+        return None
+    antes, depois, idat, tamanhos = [], [], [], []
+    posicao = len(ASSINATURA_PNG)
+    while posicao + 8 <= len(dados):
+        tamanho, tipo = struct.unpack('>I4s', dados[posicao:posicao + 8])
+        fim = posicao + 12 + tamanho
+        if tipo == b'IDAT':
+            if depois:
+                return None  # IDATs separados por outros chunks
+            idat.append(dados[posicao + 8:fim - 4])
+            tamanhos.append(tamanho)
+        else:
+            (depois if idat else antes).append(dados[posicao:fim])
+        posicao = fim
+    if not idat or posicao != len(dados):
+        return None
+
+    comprimido = b''.join(idat)
+    try:
+        pixels = zlib.decompress(comprimido)
+    except zlib.error:
+        return None
+    for parametros in PARAMETROS_PNG:
+        if _deflate(pixels, parametros) == comprimido:
+            antes, depois = b''.join(antes), b''.join(depois)
+            # Pixels no fim: o cabeçalho quase não muda de tamanho e os blocos do delta ficam alinhados
+            return (struct.pack('>3B3I', *parametros, len(antes), len(depois), len(tamanhos))
+                    + struct.pack(f'>{len(tamanhos)}I', *tamanhos) + antes + depois + pixels)
+    return None
+
+def recompor_png(expandido):
+    """Inverso de expandir_png"""
+    *parametros, tamanho_antes, tamanho_depois, quantos = struct.unpack_from('>3B3I', expandido)
+    posicao = struct.calcsize('>3B3I')
+    tamanhos = struct.unpack_from(f'>{quantos}I', expandido, posicao)
+    posicao += 4 * quantos
+    antes = expandido[posicao:posicao + tamanho_antes]
+    posicao += tamanho_antes
+    depois = expandido[posicao:posicao + tamanho_depois]
+    comprimido = _deflate(expandido[posicao + tamanho_depois:], parametros)
+
+    partes = [ASSINATURA_PNG, antes]
+    inicio = 0
+    for tamanho in tamanhos:
+        corpo = b'IDAT' + comprimido[inicio:inicio + tamanho]
+        partes += [struct.pack('>I', tamanho), corpo, struct.pack('>I', zlib.crc32(corpo))]
+        inicio += tamanho
+    partes.append(depois)
+    return b''.join(partes)
+
+class Acervo:
+    """Histórico de .docx com partes deduplicadas por conteúdo"""
+
+    def __init__(self, raiz):
+        self.raiz = raiz
+        self._bases_decodificadas = OrderedDict()
+        try:
+            with open(os.path.join(raiz, NOME_BASES), encoding='utf-8') as f:
+                self._bases = json.load(f)
+        except (OSError, ValueError):
+            self._bases = {}
+
+    # ==================== OBJETOS ====================
+
+    def _caminho_objeto(self, chave):
+        return os.path.join(self.raiz, PASTA_OBJETOS, chave[:2], chave)
+
+    def _base(self, chave):
+        """Forma guardada (PNG expandido) de um objeto completo, usada como dicionário"""
+        if chave in self._bases_decodificadas:
+            self._bases_decodificadas.move_to_end(chave)
+            return self._bases_decodificadas[chave]
+        with open(self._caminho_objeto(chave), 'rb') as f:
+            tipo = f.read(1)
+            if tipo == PNG:
+                tipo = f.read(1)
+            if tipo != COMPLETO:
+                raise ValueError(f'{chave}: base de delta deve ser um objeto completo')
+            return self._lembrar_base(chave, zlib.decompress(f.read()))
+
+    def _lembrar_base(self, chave, dados):
+        self._bases_decodificadas[chave] = dados
+        while (len(self._bases_decodificadas) > 1
+               and sum(map(len, self._bases_decodificadas.values())) > MEMORIA_BASES):
+            self._bases_decodificadas.popitem(last=False)
+        return dados
+
+    def guardar_parte(self, nome, dados):
+        """Grava a parte (se ainda não existe) e devolve o sha256 do conteúdo"""
+        chave = _hash(dados)
+        caminho = self._caminho_objeto(chave)
+        if os.path.exists(caminho):
+            return chave
+
+        prefixo = b''
+        if nome.lower().endswith('.png'):
+            expandido = expandir_png(dados)
+            if expandido is not None:
+                prefixo, dados = PNG, expandido
+
+        bases = self._bases.get(nome, [])
+        if bases:
+            delta, base = min(((codificar_delta(dados, self._base(base)), base) for base in bases),
+                              key=lambda candidato: len(candidato[0]))
+            if len(delta) + 32 < LIMITE_DELTA * os.path.getsize(self._caminho_objeto(base)):
+                _gravar_atomico(caminho, prefixo + DELTA + bytes.fromhex(base) + delta)
+                # A base usada sobe para o início: as que não servem mais vão saindo
+                self._bases[nome] = [base] + [outra for outra in bases if outra != base]
+                return chave
+        completo = _comprimir(dados)
+        if len(completo) >= len(dados):
+            _gravar_atomico(caminho, prefixo + BRUTO + dados)
+            return chave
+        _gravar_atomico(caminho, prefixo + COMPLETO + completo)
+        self._bases[nome] = [chave, *bases][:BASES_POR_PARTE]
+        self._lembrar_base(chave, dados)
+        return chave
+
+    def _decodificar(self, arquivo, tipo, chave):
+        if tipo == BRUTO:
+            yield from iter(lambda: arquivo.read(TAMANHO_LEITURA), b'')
+        elif tipo == COMPLETO:
+            descompressor = zlib.decompressobj()
+            for bloco in iter(lambda: arquivo.read(TAMANHO_LEITURA), b''):
+                yield descompressor.decompress(bloco)
+            yield descompressor.flush()
+        elif tipo == DELTA:
+            yield from decodificar_delta(arquivo, self._base(arquivo.read(32).hex()))
+        else:
+            raise ValueError(f'{chave}: objeto corrompido (tipo {tipo!r})')
+
+    def blocos_parte(self, chave):
+        """Conteúdo de um objeto em blocos, decodificado em fluxo"""
+        with open(self._caminho_objeto(chave), 'rb') as f:
+            tipo = f.read(1)
+            if tipo == PNG:
+                # O IDAT só pode ser refeito inteiro: o PNG (dezenas de KB) sai de uma vez
+                yield recompor_png(b''.join(self._decodificar(f, f.read(1), chave)))
+            else:
+                yield from self._decodificar(f, tipo, chave)
+
+    def ler_parte(self, chave):
+        dados = b''.join(self.blocos_parte(chave))
+        if _hash(dados) != chave:
+            raise ValueError(f'{chave}: conteúdo não confere com o hash')
+        return dados
+
+    # ==================== DOCUMENTOS ====================
+
+    def _caminho_manifesto(self, nome):
+        if not nome or nome != os.path.basename(nome) or nome.startswith('.'):
+            raise ValueError(f'Nome de documento inválido: {nome!r}')
+        return os.path.join(self.raiz, PASTA_DOCUMENTOS, nome + EXTENSAO_MANIFESTO)
+
+    def documentos(self):
+        """Nomes dos documentos do acervo, em ordem alfabética"""
+        try:
+            arquivos = os.listdir(os.path.join(self.raiz, PASTA_DOCUMENTOS))
+        except OSError:
+            return []
+        return sorted(arquivo[:-len(EXTENSAO_MANIFESTO)] for arquivo in arquivos
+                      if arquivo.endswith(EXTENSAO_MANIFESTO))
+
+    def versoes(self, nome):
+        """Manifestos das versões de um documento, da mais antiga à mais nova"""
+        try:
+            with gzip.open(self._caminho_manifesto(nome), 'rt', encoding='utf-8') as f:
+                return json.load(f)['versoes']
+        except FileNotFoundError:
+            return []
+
+    def manifesto(self, nome, versao=None):
+        """Manifesto de uma versão (a mais nova, sem `versao`)"""
+        versoes = self.versoes(nome)
+        if not versoes:
+            raise ValueError(f'{nome}: documento não está no acervo')
+        if versao is None:
+            return versoes[-1]
+        for manifesto in versoes:
+            if manifesto['versao'] == versao:
+                return manifesto
+        raise ValueError(f"{nome}: versão {versao} não existe "
+                         f"(disponíveis: {', '.join(str(m['versao']) for m in versoes)})")
+
+    def guardar(self, dados, nome):
+        """Guarda os bytes de um .docx como nova versão de `nome` e devolve o manifesto
+
+        Se as partes forem as mesmas da versão mais nova, nada é gravado e o
+        manifesto existente é devolvido.
+        """
+        caminho = self._caminho_manifesto(nome)
+        partes = []
+        with zipfile.ZipFile(io.BytesIO(dados)) as z:
+            for info in z.infolist():
+                conteudo = z.read(info)
+                partes.append([info.filename, self.guardar_parte(info.filename, conteudo), len(conteudo),
+                               list(info.date_time), info.compress_type])
+        self._salvar_bases()
+
+        versoes = self.versoes(nome)
+        if versoes and versoes[-1]['partes'] == partes:
+            return versoes[-1]
+        manifesto = {
+            'versao': versoes[-1]['versao'] + 1 if versoes else 1,
+            'guardado_em': datetime.now().isoformat(timespec='seconds'),
+            'bytes': len(dados),
+            'sha256': _hash(dados),
+            'partes': partes,
+        }
+        versoes.append(manifesto)
+        # Versões juntas num arquivo só: os hashes repetidos entre elas somem na compressão
+        texto = json.dumps({'documento': nome, 'versoes': versoes}, ensure_ascii=False, separators=(',', ':'))
+        _gravar_atomico(caminho, gzip.compress(texto.encode('utf-8'), NIVEL_ZLIB, mtime=0))
+        return manifesto
+
+    def guardar_arquivo(self, caminho, nome=None):
+        with open(caminho, 'rb') as f:
+            return self.guardar(f.read(), nome or os.path.basename(caminho))
+
+    def _salvar_bases(self):
+        _gravar_atomico(os.path.join(self.raiz, NOME_BASES),
+                        json.dumps(self._bases, sort_keys=True, indent=1).encode('utf-8'))
+
+    def restaurar(self, nome, destino, versao=None):
+        """Remonta o .docx de uma versão em `destino` (caminho ou arquivo aberto)
+
+        As partes vão para o zip em fluxo, sem montar o documento na memória,
+        e são conferidas pelo hash; o resultado tem as mesmas partes, na mesma
+        ordem, que o original (o zip em si pode sair com outro nível de
+        compressão).
+        """
+        manifesto = self.manifesto(nome, versao)
+        with zipfile.ZipFile(destino, 'w') as z:
+            for nome_parte, chave, _, data_hora, compressao in manifesto['partes']:
+                info = zipfile.ZipInfo(nome_parte, tuple(data_hora))
+                info.compress_type = compressao
+                conferencia = hashlib.sha256()
+                with z.open(info, 'w') as parte:
+                    for bloco in self.blocos_parte(chave):
+                        conferencia.update(bloco)
+                        parte.write(bloco)
+                if conferencia.hexdigest() != chave:
+                    raise ValueError(f'{nome}: parte {nome_parte} não confere com o hash')
+        return manifesto
+
+    def restaurar_bytes(self, nome, versao=None):
+        buffer = io.BytesIO()
+        self.restaurar(nome, buffer, versao)
+        return buffer.getvalue()
+
+    def estatisticas(self):
+        """Documentos, versões, bytes originais e bytes ocupados no disco"""
+        documentos = self.documentos()
+        versoes = originais = manifestos = 0
+        for nome in documentos:
+            for manifesto in self.versoes(nome):
+                originais += manifesto['bytes']
+                versoes += 1
+            manifestos += os.path.getsize(self._caminho_manifesto(nome))
+        objetos = tamanho_objetos = 0
+        for pasta, _, arquivos in os.walk(os.path.join(self.raiz, PASTA_OBJETOS)):
+            for arquivo in arquivos:
+                objetos += 1
+                tamanho_objetos += os.path.getsize(os.path.join(pasta, arquivo))
+        return {'documentos': len(documentos), 'versoes': versoes, 'objetos': objetos,
+                'bytes_originais': originais, 'bytes_objetos': tamanho_objetos, 'bytes_manifestos': manifestos}
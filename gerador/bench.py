@@ -0,0 +1,788 @@
+"""
+Benchmarks do gerador de documentos
+
+Uso: python -m gerador.bench [--docs N] [--max-workers N]
+     python -m gerador.bench --tabelas [--linhas 1000 10000]
+     python -m gerador.bench --streaming [--linhas 10000 100000]
+     python -m gerador.bench --relatorio [--linhas 500000]
+     python -m gerador.bench --incremental [--docs 300]
+     python -m gerador.bench --conflitos [--linhas 20000]
+     python -m gerador.bench --estatisticas [--linhas 500000]
+     python -m gerador.bench --graficos [--docs 100]
+     python -m gerador.bench --pdf [--docs 40] [--max-workers N]
+     python -m gerador.bench --tamanho [--docs 100]
+     python -m gerador.bench --acervo [--docs 100]
+     python -m gerador.bench --importtime [--salvar-baseline]
+     python -m gerador.bench --suite [--rapido] [--salvar-baseline] [--tolerancia 0.25]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+from gerador.lote import cpus_disponiveis, gerar_lote
+from gerador.manifesto import gerar_sigla
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline')
+ALVOS_IMPORTTIME = {'cli': 'import gerador.cli', 'proposta': 'import gerador.proposta'}
+LIMITE_PARTIDA_MS = 100
+
+def clientes_sinteticos(quantidade):
+    """Gera clientes fictícios, variando preços e módulos, para os benchmarks"""
+    modulos = [['financeiro', 'medico'], ['financeiro'], ['medico'], []]
+    clientes = []
+    for i in range(quantidade):
+        nome = f'Igreja Batista Exemplo {i + 1}'
+        clientes.append({
+            'nome': nome,
+            'sigla': f'{gerar_sigla(nome)}{i + 1}',
+            'data': date(2025, 10, 1) + timedelta(days=i % 60),
+            'valor_sistema': 3000 + 100 * (i % 5),
+            'valor_manutencao': 300 + 10 * (i % 5),
+            'meses_manutencao': 12,
+            'modulos': modulos[i % len(modulos)],
+        })
+    return clientes
+
+def bench_workers(total_docs=48, max_workers=None):
+    """Mede a escalabilidade do modo lote variando o número de processos"""
+    max_workers = max_workers or cpus_disponiveis()
+    niveis = sorted({1, *[2 ** i for i in range(1, max_workers.bit_length())], max_workers})
+    clientes = clientes_sinteticos(total_docs)
+    
+    print(f'📊 {total_docs} propostas | {cpus_disponiveis()} núcleo(s) disponível(is)')
+    print(f"{'workers':>8} {'tempo (s)':>10} {'docs/s':>8} {'speedup':>8} {'eficiência':>11}")
+
+    # Rodada fora da medição: esqueletos e gráficos já no cache em disco para todos os níveis,
+    # senão só workers=1 paga a montagem e o speedup sai inflado
+    with tempfile.TemporaryDirectory() as pasta:
+        gerar_lote(clientes, pasta, workers=max_workers, verboso=False)
+
+    linhas = []
+    base = None
+    for workers in niveis:
+        with tempfile.TemporaryDirectory() as pasta:
+            _, total = gerar_lote(clientes, pasta, workers=workers, verboso=False)
+        base = base or total
+        speedup = base / total
+        linhas.append({'workers': workers, 'segundos': total, 'docs_por_segundo': total_docs / total,
+                       'speedup': speedup})
+        print(f'{workers:>8} {total:>10.2f} {total_docs / total:>8.1f} {speedup:>7.2f}x {speedup / workers:>10.0%}')
+    return linhas
+
+def bench_incremental(total_docs=300, alterados=5):
+    """Rodada noturna: gera tudo, altera alguns clientes e gera de novo"""
+    clientes = clientes_sinteticos(total_docs)
+    with tempfile.TemporaryDirectory() as pasta:
+        _, completo = gerar_lote(clientes, pasta, verboso=False)
+        _, sem_mudancas = gerar_lote(clientes, pasta, verboso=False)
+        for cliente in clientes[:alterados]:
+            cliente['valor_sistema'] += 500
+        resultados, parcial = gerar_lote(clientes, pasta, verboso=False)
+    gerados = sum(1 for r in resultados if not r.get('pulado'))
+    print(f'📊 {total_docs} propostas')
+    print(f'   geração completa:        {completo:>7.2f} s')
+    print(f'   nenhuma mudança:         {sem_mudancas:>7.2f} s')
+    print(f'   {alterados} cliente(s) alterado(s): {parcial:>7.2f} s ({gerados} documento(s) gerado(s))')
+    return {'completo': completo, 'sem_mudancas': sem_mudancas, 'parcial': parcial, 'gerados': gerados}
+
+def iterar_linhas_sinteticas(quantidade):
+    """Linhas fictícias (item, detalhe, valor) geradas sob demanda"""
+    for i in range(quantidade):
+        yield f'Item {i}', f'Detalhe do item {i}', f'R$ {i * 10:,}'.replace(',', '.')
+
+def linhas_sinteticas(quantidade):
+    """Linhas fictícias (item, detalhe, valor) para os benchmarks de tabela"""
+    return list(iterar_linhas_sinteticas(quantidade))
+
+def _tabela_python_docx(doc, linhas):
+    """Caminho antigo: add_table + row.cells por linha + w:shd via OxmlElement"""
+    from gerador.proposta import set_cell_background, set_paragraph_style, set_table_style
+    table = doc.add_table(rows=len(linhas) + 1, cols=3)
+    set_table_style(table, 'Light Grid Accent 1')
+    for cell, titulo in zip(table.rows[0].cells, ('Item', 'Detalhe', 'Valor')):
+        cell.text = titulo
+        set_cell_background(cell, '174ea6')
+        set_paragraph_style(cell.paragraphs[0], 'TableHeader')
+    for i, (item, detalhe, valor) in enumerate(linhas, start=1):
+        row = table.rows[i]
+        row.cells[0].text = item
+        row.cells[1].text = detalhe
+        row.cells[2].text = valor
+
+def _tabela_xml(doc, linhas):
+    """Caminho novo: tabela inteira montada como XML e inserida de uma vez"""
+    from gerador.tabelas import add_table_xml
+    from gerador.proposta import ESPEC_TABELA
+    add_table_xml(doc, linhas, {**ESPEC_TABELA, 'cabecalho': ('Item', 'Detalhe', 'Valor')})
+
+def bench_tabelas(tamanhos=(1000, 10000)):
+    """Compara a montagem de tabelas pelo python-docx e direto em XML"""
+    from gerador.proposta import novo_documento
+
+    print(f"{'linhas':>8} {'python-docx (s)':>16} {'xml (s)':>9} {'ganho':>8}")
+    resultados = []
+    for tamanho in tamanhos:
+        linhas = linhas_sinteticas(tamanho)
+        tempos = {}
+        for nome, montar in (('python_docx', _tabela_python_docx), ('xml', _tabela_xml)):
+            doc = novo_documento()
+            inicio = time.perf_counter()
+            montar(doc, linhas)
+            tempos[nome] = time.perf_counter() - inicio
+        resultados.append({'linhas': tamanho, **tempos})
+        print(f"{tamanho:>8} {tempos['python_docx']:>16.3f} {tempos['xml']:>9.3f} "
+              f"{tempos['python_docx'] / tempos['xml']:>7.1f}x")
+    return resultados
+
+ESPEC_RELATORIO = {'estilo': 'Light Grid Accent 1', 'cabecalho': ('Item', 'Detalhe', 'Valor'),
+                   'fundo_cabecalho': '174ea6', 'estilo_cabecalho': 'TableHeader'}
+
+def _relatorio_em_memoria(caminho, tamanho):
+    from gerador.tabelas import add_table_xml
+    from gerador.proposta import add_styled_paragraph, novo_documento
+    doc = novo_documento()
+    add_styled_paragraph(doc, f'Relatório com {tamanho} linhas', 'SectionTitle')
+    add_table_xml(doc, linhas_sinteticas(tamanho), ESPEC_RELATORIO)
+    doc.save(caminho)
+
+def _relatorio_streaming(caminho, tamanho):
+    from gerador.streaming import DocumentoStream
+    with DocumentoStream(caminho) as doc:
+        doc.paragrafo(f'Relatório com {tamanho} linhas', 'SectionTitle')
+        doc.tabela(iterar_linhas_sinteticas(tamanho), ESPEC_RELATORIO)
+
+def _medir_relatorio(modo, tamanho):
+    """Roda num processo novo para que o pico de RSS seja só deste modo"""
+    from gerador.streaming import pico_memoria_mb
+    montar = _relatorio_streaming if modo == 'streaming' else _relatorio_em_memoria
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'relatorio.docx')
+        inicio = time.perf_counter()
+        montar(caminho, tamanho)
+        segundos = time.perf_counter() - inicio
+        tamanho_arquivo = os.path.getsize(caminho)
+    return {'modo': modo, 'linhas': tamanho, 'segundos': segundos,
+            'pico_rss_mb': pico_memoria_mb(), 'bytes': tamanho_arquivo}
+
+def bench_streaming(tamanhos=(10000, 100000)):
+    """Compara doc.save() com a escrita em streaming: tempo e pico de memória"""
+    print(f"{'linhas':>8} {'modo':>10} {'tempo (s)':>10} {'pico RSS (MB)':>14} {'arquivo (KB)':>13}")
+    resultados = []
+    for tamanho in tamanhos:
+        for modo in ('memoria', 'streaming'):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                r = pool.submit(_medir_relatorio, modo, tamanho).result()
+            resultados.append(r)
+            print(f"{tamanho:>8} {modo:>10} {r['segundos']:>10.2f} {r['pico_rss_mb'] or 0:>14.1f} "
+                  f"{r['bytes'] / 1024:>13.0f}")
+    return resultados
+
+LOCAIS = ['Templo', 'Anexo 1 - Salão', 'Anexo 1 - Sala 11', 'Anexo 1 - Sala 12', 'Anexo 2 - Salão',
+          'Anexo 2 - Sala 21', 'Estúdio', 'Copa']
+DEPARTAMENTOS = ['Diaconia', 'Serviços Gerais', 'Audiovisual', 'Segurança']
+STATUS = ['APTO', 'APTO', 'EXECUTADO', 'FINALIZADO', 'PENDENTE', 'REJEITADO']
+
+def exportacao_sintetica(caminho, requisicoes=100000, inicio=date(2023, 1, 1), dias=1095, semente=42):
+    """Cria um SQLite com requests/request_items/inventory/locations fictícios"""
+    aleatorio = random.Random(semente)
+    with sqlite3.connect(caminho) as conexao:
+        conexao.executescript('''
+            CREATE TABLE locations (id INTEGER PRIMARY KEY, name TEXT, description TEXT, is_active INTEGER);
+            CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, category TEXT,
+                                    quantity_available INTEGER, quantity_total INTEGER, location TEXT, status TEXT);
+            CREATE TABLE requests (id INTEGER PRIMARY KEY, requester_id TEXT, department TEXT, event_name TEXT,
+                                   location TEXT, date TEXT, start_datetime TEXT, end_datetime TEXT,
+                                   status TEXT, prioridade TEXT, expected_audience INTEGER,
+                                   created_at TEXT, approved_at TEXT);
+            CREATE TABLE request_items (id INTEGER PRIMARY KEY, request_id INTEGER, inventory_id INTEGER,
+                                        item_name TEXT, quantity_requested INTEGER);
+            CREATE INDEX idx_requests_date ON requests(date);
+            CREATE INDEX idx_items_request ON request_items(request_id);
+        ''')
+        conexao.executemany('INSERT INTO locations VALUES (?, ?, ?, 1)',
+                            [(i, nome, nome) for i, nome in enumerate(LOCAIS, start=1)])
+        itens = [(i, f'Item {i}', aleatorio.choice(['AUDIOVISUAL', 'SERVICO_GERAL', 'GERAL']))
+                 for i in range(1, 201)]
+        conexao.executemany('INSERT INTO inventory VALUES (?, ?, ?, ?, ?, ?, ?)',
+                            [(i, nome, categoria, aleatorio.randint(0, 50), 50, 'Depósito', 'DISPONIVEL')
+                             for i, nome, categoria in itens])
+
+        # Sorteio separado para as datas de criação/aprovação: o resto da exportação não muda
+        atrasos = random.Random(semente + 1)
+
+        def linhas_requisicoes():
+            for i in range(1, requisicoes + 1):
+                inicio_evento = datetime.combine(inicio + timedelta(days=aleatorio.randrange(dias)),
+                                                 datetime.min.time()) + timedelta(minutes=30 * aleatorio.randrange(14, 44))
+                fim_evento = inicio_evento + timedelta(minutes=30 * aleatorio.randint(1, 6))
+                departamento, local = aleatorio.choice(DEPARTAMENTOS), aleatorio.choice(LOCAIS)
+                status = aleatorio.choice(STATUS)
+                criada = inicio_evento - timedelta(hours=atrasos.randint(24, 24 * 30))
+                aprovada = (criada + timedelta(minutes=atrasos.expovariate(1 / 600))
+                            if status in ('APTO', 'EXECUTADO', 'FINALIZADO') else None)
+                yield (i, f'u{i % 50}', departamento, f'Evento {i}', local,
+                       inicio_evento.date().isoformat(), inicio_evento.isoformat(), fim_evento.isoformat(),
+                       status, 'Média', aleatorio.randint(5, 300), criada.isoformat(timespec='seconds'),
+                       aprovada and aprovada.isoformat(timespec='seconds'))
+
+        def linhas_itens():
+            for i in range(1, 2 * requisicoes + 1):
+                item = itens[aleatorio.randrange(len(itens))]
+                yield i, aleatorio.randint(1, requisicoes), item[0], item[1], aleatorio.randint(1, 10)
+
+        conexao.executemany('INSERT INTO requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                            linhas_requisicoes())
+        conexao.executemany('INSERT INTO request_items VALUES (?, ?, ?, ?, ?)', linhas_itens())
+    return caminho
+
+def bench_relatorio(requisicoes=500000):
+    """Gera o relatório mensal a partir de um histórico sintético em SQLite"""
+    from gerador.relatorios import gerar_relatorio_mensal
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.perf_counter()
+        banco = exportacao_sintetica(os.path.join(pasta, 'exportacao.db'), requisicoes)
+        print(f'🗄️ Exportação sintética com {requisicoes} requisições criada em '
+              f'{time.perf_counter() - inicio:.1f} s ({os.path.getsize(banco) / 2 ** 20:.0f} MB)')
+        return gerar_relatorio_mensal(banco, 2024, 6, pasta)
+
+def bench_estatisticas(requisicoes=500000):
+    """Indicadores (NumPy) sobre todo o histórico sintético: leitura em colunas e agrupamentos"""
+    from gerador.dados import abrir_fonte
+    from gerador.estatisticas import calcular_estatisticas
+    with tempfile.TemporaryDirectory() as pasta:
+        banco = exportacao_sintetica(os.path.join(pasta, 'exportacao.db'), requisicoes)
+        fonte = abrir_fonte(banco)
+        try:
+            inicio = time.perf_counter()
+            indicadores = calcular_estatisticas(fonte, date(2023, 1, 1), date(2026, 1, 1))
+            segundos = time.perf_counter() - inicio
+        finally:
+            fonte.fechar()
+    print(f"📈 {indicadores['requisicoes']} requisições e {indicadores['movimentacoes']} movimentações "
+          f"em {segundos:.2f} s | {len(indicadores['categorias'])} categoria(s) | "
+          f"{len(indicadores['latencias'])} departamento(s) com aprovação")
+    return indicadores
+
+def bench_graficos(documentos=100):
+    """Propostas com o gráfico mercado x proposta: cache por conteúdo x desenhar em todo documento"""
+    import shutil
+    from gerador import esqueleto, graficos
+    if not graficos.disponivel():
+        print('⚠️ matplotlib não instalado: as propostas saem sem gráfico')
+        return None
+    clientes = clientes_sinteticos(documentos)
+    anterior = os.environ.get('GERADOR_CACHE')
+    with tempfile.TemporaryDirectory() as pasta:
+        os.environ['GERADOR_CACHE'] = pasta
+        try:
+            esqueleto.renderizar(clientes[0])  # esqueleto e template fora da medição
+            graficos._memoria.clear()
+            shutil.rmtree(graficos.pasta_graficos(), ignore_errors=True)
+            graficos.estatisticas.update(renderizados=0, memoria=0, disco=0)
+
+            inicio = time.perf_counter()
+            tamanho = sum(len(esqueleto.renderizar(cliente)) for cliente in clientes)
+            com_cache = time.perf_counter() - inicio
+            contagem = dict(graficos.estatisticas)
+
+            inicio = time.perf_counter()
+            for cliente in clientes:
+                graficos._memoria.clear()
+                shutil.rmtree(graficos.pasta_graficos(), ignore_errors=True)
+                esqueleto.renderizar(cliente)
+            sem_cache = time.perf_counter() - inicio
+        finally:
+            if anterior is None:
+                os.environ.pop('GERADOR_CACHE', None)
+            else:
+                os.environ['GERADOR_CACHE'] = anterior
+
+    print(f'📊 {documentos} propostas com gráfico ({tamanho / documentos / 1024:.0f} KB cada)')
+    print(f"⚡ Com cache: {com_cache:.2f} s | {contagem['renderizados']} gráfico(s) desenhado(s), "
+          f"{contagem['memoria']} reaproveitado(s) da memória")
+    print(f'🐢 Desenhando em todo documento: {sem_cache:.2f} s ({sem_cache / com_cache:.1f}x)')
+    return {'com_cache': com_cache, 'sem_cache': sem_cache, **contagem}
+
+def bench_tamanho(documentos=100, niveis=(0, 1, 6, 9)):
+    """Bytes por proposta: doc.save() do python-docx x otimizado, em cada nível de compressão"""
+    from gerador import esqueleto, proposta
+    from gerador.otimizacao import otimizar_docx
+    clientes = clientes_sinteticos(documentos)
+    esqueleto.renderizar(clientes[0])  # esqueleto e template fora da medição
+
+    amostra = clientes[:min(10, documentos)]
+    inicio = time.perf_counter()
+    originais = [_salvar_bytes(proposta.montar_proposta(cliente)) for cliente in amostra]
+    tempo_original = (time.perf_counter() - inicio) / len(amostra)
+    original = sum(len(dados) for dados in originais) / len(amostra)
+    estatisticas = {}
+    otimizar_docx(originais[0], estatisticas=estatisticas)
+
+    print(f'📦 {documentos} propostas, tamanho médio por documento')
+    print(f"{'versão':<28} {'KB':>8} {'redução':>9} {'ms/doc':>8} {'total (MB)':>11}")
+    print(f"{'doc.save() (python-docx)':<28} {original / 1024:>8.1f} {'—':>9} {tempo_original * 1000:>8.1f} "
+          f'{original * documentos / 1024 ** 2:>11.2f}')
+    resultados = {'original': original}
+    for nivel in niveis:
+        inicio = time.perf_counter()
+        tamanho = sum(len(esqueleto.renderizar(cliente, nivel)) for cliente in clientes) / documentos
+        tempo = (time.perf_counter() - inicio) / documentos
+        resultados[nivel] = tamanho
+        print(f"{f'otimizado, compressão {nivel}':<28} {tamanho / 1024:>8.1f} {1 - tamanho / original:>9.0%} "
+              f'{tempo * 1000:>8.1f} {tamanho * documentos / 1024 ** 2:>11.2f}')
+    print(f"🧹 Estilos {estatisticas['estilos'][0]} -> {estatisticas['estilos'][1]} | "
+          f"partes removidas: {', '.join(estatisticas['partes_removidas'])} | "
+          f"{estatisticas['runs_juntados']} run(s) juntado(s)")
+    return resultados
+
+def bench_acervo(documentos=100, revisoes=3, idiomas=('pt_BR', 'en')):
+    """Histórico no acervo: cada proposta em cada idioma, revisada alternando preço e data"""
+    from gerador import esqueleto
+    from gerador.acervo import Acervo
+    versoes = []
+    for revisao in range(revisoes):
+        for cliente in clientes_sinteticos(documentos):
+            # Revisões ímpares mudam o preço (e o gráfico); as pares, só a data
+            cliente['valor_sistema'] += 50 * ((revisao + 1) // 2)
+            cliente['data'] += timedelta(days=7 * revisao)
+            for idioma in idiomas:
+                versoes.append((f"{cliente['sigla']}_{idioma}.docx",
+                                esqueleto.renderizar({**cliente, 'idioma': idioma})))
+
+    with tempfile.TemporaryDirectory() as pasta:
+        acervo = Acervo(pasta)
+        inicio = time.perf_counter()
+        for nome, dados in versoes:
+            acervo.guardar(dados, nome)
+        tempo_guardar = (time.perf_counter() - inicio) / len(versoes)
+        e = acervo.estatisticas()
+
+        amostra = random.Random(42).sample(versoes, min(100, len(versoes)))
+        inicio = time.perf_counter()
+        for nome, _ in amostra:
+            acervo.restaurar_bytes(nome, random.Random(nome).randint(1, revisoes))
+        tempo_restaurar = (time.perf_counter() - inicio) / len(amostra)
+
+    ocupados = e['bytes_objetos'] + e['bytes_manifestos']
+    print(f"🗄️  {e['documentos']} documentos x {revisoes} revisões = {e['versoes']} versões, {e['objetos']} objetos")
+    print(f"📦 .docx: {e['bytes_originais'] / 1024 ** 2:.2f} MB | acervo: {ocupados / 1024 ** 2:.2f} MB "
+          f"(objetos {e['bytes_objetos'] / 1024 ** 2:.2f} MB + manifestos {e['bytes_manifestos'] / 1024:.0f} KB) "
+          f"| {e['bytes_originais'] / ocupados:.1f}x menor")
+    print(f'⏱️  guardar {tempo_guardar * 1000:.1f} ms/versão | restaurar {tempo_restaurar * 1000:.1f} ms/versão')
+    return {'razao': e['bytes_originais'] / ocupados, 'guardar': tempo_guardar, 'restaurar': tempo_restaurar}
+
+def _conflitos_forca_bruta(requisicoes):
+    """Todos os pares comparados entre si (O(n²)); só para conferir a varredura"""
+    from gerador.conflitos import INTERVALO_MINIMO, reservas_por_local
+    conflitos = quase = 0
+    for reservas in reservas_por_local(requisicoes).values():
+        for i, a in enumerate(reservas):
+            for b in reservas[i + 1:]:
+                if a['start_datetime'] < b['end_datetime'] and b['start_datetime'] < a['end_datetime']:
+                    conflitos += 1
+                elif (timedelta(0) <= b['start_datetime'] - a['end_datetime'] < INTERVALO_MINIMO
+                      or timedelta(0) <= a['start_datetime'] - b['end_datetime'] < INTERVALO_MINIMO):
+                    quase += 1
+    return conflitos, quase
+
+def bench_conflitos(requisicoes=20000):
+    """Conflitos e quase-conflitos de um ano inteiro de reservas, em todos os locais"""
+    from gerador.conflitos import analisar_conflitos
+    from gerador.dados import abrir_fonte
+    with tempfile.TemporaryDirectory() as pasta:
+        banco = exportacao_sintetica(os.path.join(pasta, 'exportacao.db'), requisicoes,
+                                     inicio=date(2024, 1, 1), dias=366)
+        fonte = abrir_fonte(banco)
+        try:
+            inicio = time.perf_counter()
+            reservas = list(fonte.requisicoes(date(2024, 1, 1), date(2025, 1, 1)))
+            leitura = time.perf_counter() - inicio
+        finally:
+            fonte.fechar()
+
+    tempos = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        resultado = analisar_conflitos(reservas)
+        tempos.append(time.perf_counter() - inicio)
+    print(f"📅 {len(reservas)} reservas de 2024 em {len(LOCAIS)} locais (leitura {leitura:.2f} s)")
+    print(f"⚡ Varredura: {min(tempos) * 1000:.0f} ms | {resultado['reservas']} confirmadas | "
+          f"{len(resultado['conflitos'])} conflito(s) | {len(resultado['quase'])} quase-conflito(s)")
+
+    amostra = reservas[:min(len(reservas), 5000)]
+    inicio = time.perf_counter()
+    esperado = _conflitos_forca_bruta(amostra)
+    bruta = time.perf_counter() - inicio
+    obtido = analisar_conflitos(amostra)
+    obtido = (len(obtido['conflitos']), len(obtido['quase']))
+    print(f"🔎 Conferência com todos os pares ({len(amostra)} reservas, {bruta * 1000:.0f} ms): "
+          f"{'ok' if obtido == esperado else f'DIVERGENTE {obtido} != {esperado}'}")
+    return resultado
+
+def bench_pdf(documentos=40, instancias=None):
+    """PDFs por minuto: reportlab, LibreOffice com um processo por arquivo e LibreOffice em pool"""
+    from gerador.pdf import PoolLibreOffice, converter_com_soffice, localizar_soffice, renderizar_pdf
+
+    clientes = clientes_sinteticos(documentos)
+    instancias = instancias or min(4, cpus_disponiveis())
+    medicoes = []
+
+    inicio = time.perf_counter()
+    for cliente in clientes:
+        renderizar_pdf(cliente)
+    medicoes.append(('reportlab', time.perf_counter() - inicio))
+
+    soffice = localizar_soffice()
+    if soffice:
+        with tempfile.TemporaryDirectory() as pasta:
+            resultados, _ = gerar_lote(clientes, os.path.join(pasta, 'docx'), verboso=False)
+            documentos_docx = [r['arquivo'] for r in resultados]
+
+            inicio = time.perf_counter()
+            for caminho in documentos_docx:
+                converter_com_soffice([caminho], os.path.join(pasta, 'por_arquivo'), soffice)
+            medicoes.append(('LibreOffice, um soffice por arquivo', time.perf_counter() - inicio))
+
+            inicio = time.perf_counter()
+            with PoolLibreOffice(instancias, soffice=soffice) as pool:
+                futuros = [pool.converter(caminho, os.path.join(pasta, 'pool')) for caminho in documentos_docx]
+                for futuro in futuros:
+                    futuro.result()
+            medicoes.append((f'LibreOffice em pool ({instancias} instância(s))', time.perf_counter() - inicio))
+
+    print(f'📑 {documentos} propostas em PDF')
+    for nome, segundos in medicoes:
+        print(f'   {nome:<40} {segundos:>7.2f} s  {documentos / segundos * 60:>8.0f} documentos/min')
+    if not soffice:
+        print('⚠️ LibreOffice (soffice) não encontrado no PATH: modos por arquivo e em pool não medidos')
+    return medicoes
+
+def _importtime(codigo):
+    """Roda `python -X importtime -c codigo` e devolve {módulo de topo: ms acumulados} e a saída bruta"""
+    saida = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], capture_output=True,
+                           text=True, cwd=RAIZ, check=True).stderr
+    return ler_importtime(saida), saida
+
+def ler_importtime(saida):
+    """Tempo acumulado (ms) de cada import de topo numa saída do -X importtime"""
+    modulos = {}
+    for linha in saida.splitlines():
+        partes = linha.split('|')
+        if not linha.startswith('import time:') or len(partes) != 3 or not partes[1].strip().isdigit():
+            continue
+        nome = partes[2].rstrip()
+        if not nome.startswith('  '):  # só imports de primeiro nível
+            modulos[nome.strip()] = int(partes[1]) / 1000
+    return modulos
+
+def _tempo_comando(argumentos, repeticoes=5):
+    """Melhor tempo de parede (ms) de um comando da CLI"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(RAIZ, 'gerar_proposta_word.py'), *argumentos],
+                       capture_output=True, cwd=RAIZ, check=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return min(tempos)
+
+def bench_importtime(salvar_baseline=False):
+    """Custo de importação da CLI e do gerador, comparado com o baseline em gerador/baseline"""
+    os.makedirs(PASTA_BASELINE, exist_ok=True)
+    resultados = {}
+    for nome, codigo in ALVOS_IMPORTTIME.items():
+        modulos, saida = _importtime(codigo)
+        caminho = os.path.join(PASTA_BASELINE, f'importtime_{nome}.txt')
+        if salvar_baseline:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                f.write(saida)
+        base = {}
+        if os.path.exists(caminho):
+            with open(caminho, encoding='utf-8') as f:
+                base = ler_importtime(f.read())
+
+        total, total_base = sum(modulos.values()), sum(base.values())
+        print(f"📦 {codigo}: {total:.1f} ms em imports (baseline {total_base:.1f} ms)")
+        for modulo, ms in sorted(modulos.items(), key=lambda item: -item[1])[:8]:
+            print(f"   {modulo:<32} {ms:>8.1f} ms  (baseline {base.get(modulo, 0):>7.1f} ms)")
+        resultados[nome] = {'total_ms': total, 'baseline_ms': total_base, 'modulos': modulos}
+
+    for argumentos in (['--help'], ['validate']):
+        ms = _tempo_comando(argumentos)
+        situacao = '✅' if ms < LIMITE_PARTIDA_MS else '⚠️'
+        print(f"{situacao} gerar_proposta_word.py {' '.join(argumentos)}: {ms:.0f} ms "
+              f"(limite {LIMITE_PARTIDA_MS} ms)")
+        resultados[' '.join(argumentos)] = ms
+    if salvar_baseline:
+        print(f'💾 Baseline gravado em {PASTA_BASELINE}')
+    return resultados
+
+# ==================== SUÍTE COMPLETA ====================
+
+PASTA_RESULTADOS = os.path.join(RAIZ, 'bench_output')
+BASELINE_SUITE = os.path.join(PASTA_BASELINE, 'suite.json')
+TOLERANCIA = 0.25
+# Diferenças abaixo disso são ruído de medição, mesmo que passem da tolerância
+FOLGA_MS = 2.0
+CHAMADAS_HELPER = 100
+
+def medir(funcao, preparar=None, repeticoes=5):
+    """Mede uma função: melhor tempo e mediana, pico de alocação (tracemalloc) e tamanho da saída
+
+    `preparar` cria o argumento de cada execução (ex.: um documento novo) fora
+    da medição. O tempo é medido sem o tracemalloc ligado; as alocações são
+    medidas numa execução à parte e só enxergam objetos Python (a árvore XML
+    do lxml vive em memória C). O tamanho vem da saída: bytes/str ou um int.
+    """
+    def executar():
+        argumento = preparar() if preparar else None
+        inicio = time.perf_counter()
+        saida = funcao(argumento) if preparar else funcao()
+        return time.perf_counter() - inicio, saida
+
+    tempos = []
+    for _ in range(repeticoes):
+        segundos, saida = executar()
+        tempos.append(segundos)
+
+    argumento = preparar() if preparar else None
+    tracemalloc.start()
+    try:
+        funcao(argumento) if preparar else funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ms': min(tempos) * 1000,
+        'mediana_ms': statistics.median(tempos) * 1000,
+        'repeticoes': repeticoes,
+        'alocado_kb': pico / 1024,
+        'bytes': len(saida) if isinstance(saida, (bytes, str)) else saida if isinstance(saida, int) else None,
+    }
+
+def _salvar_bytes(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def _casos_helpers():
+    """Cada add_* isolado, CHAMADAS_HELPER vezes num documento novo"""
+    from gerador import proposta
+    from gerador.conteudo import carregar_conteudo
+
+    conteudo = carregar_conteudo()
+    campos = {**proposta.textos_cliente({}), 'valor_mercado': 'R$ 0', 'versao': conteudo.versao}
+    texto = conteudo.apresentacao['texto'].format_map(campos)
+
+    def repetir(chamada):
+        def funcao(doc):
+            for _ in range(CHAMADAS_HELPER):
+                chamada(doc)
+        return funcao
+
+    def run(doc):
+        paragrafo = proposta.add_styled_paragraph(doc, '', 'PriceBox')
+        for _ in range(CHAMADAS_HELPER):
+            proposta.add_styled_run(paragrafo, 'R$ 3.000', 'PriceBig')
+
+    return {
+        'add_styled_paragraph': repetir(lambda doc: proposta.add_styled_paragraph(doc, texto, 'BodyJustified')),
+        'add_styled_run': run,
+        'add_header': repetir(lambda doc: proposta.add_header(doc, conteudo.cabecalho, campos)),
+        'add_section_title': repetir(lambda doc: proposta.add_section_title(doc, '🎯', 'Apresentação')),
+        'add_subsection_title': repetir(lambda doc: proposta.add_subsection_title(doc, 'Funcionalidade')),
+        'add_info_box': repetir(lambda doc: proposta.add_info_box(doc, texto)),
+        'add_page_break': repetir(proposta.add_page_break),
+        'add_table_xml (10 linhas)': repetir(lambda doc: _tabela_xml(doc, linhas_sinteticas(10))),
+    }
+
+def _caso_lote(quantidade):
+    clientes = clientes_sinteticos(quantidade)
+
+    def funcao():
+        with tempfile.TemporaryDirectory() as pasta:
+            resultados, _ = gerar_lote(clientes, pasta, verboso=False, forcar=True)
+            return sum(os.path.getsize(r['arquivo']) for r in resultados)
+    return funcao
+
+def casos_suite(tamanhos_lote=(1, 10, 100, 1000)):
+    """Casos da suíte: {nome: (função, preparar, repetições)}"""
+    from gerador import proposta
+    from gerador.otimizacao import salvar_otimizado
+
+    casos = {'proposta completa (montar)': (proposta.montar_proposta, None, 5)}
+    documento = proposta.montar_proposta()
+    casos['doc.save'] = (lambda _: _salvar_bytes(documento), lambda: None, 5)
+    casos['proposta completa (montar + salvar)'] = (lambda: _salvar_bytes(proposta.montar_proposta()), None, 5)
+    casos['proposta otimizada (montar + otimizar + salvar)'] = (
+        lambda: salvar_otimizado(proposta.montar_proposta()), None, 5)
+    for nome, funcao in _casos_helpers().items():
+        casos[f'{nome} x{CHAMADAS_HELPER}'] = (funcao, proposta.novo_documento, 5)
+    for linhas in (10, 100, 1000):
+        dados = linhas_sinteticas(linhas)
+        casos[f'tabela xml {linhas} linhas'] = (lambda doc, dados=dados: _tabela_xml(doc, dados),
+                                                proposta.novo_documento, 3)
+        casos[f'tabela python-docx {linhas} linhas'] = (lambda doc, dados=dados: _tabela_python_docx(doc, dados),
+                                                        proposta.novo_documento, 1 if linhas >= 1000 else 3)
+    for quantidade in tamanhos_lote:
+        casos[f'lote {quantidade} documento(s)'] = (_caso_lote(quantidade), None, 1 if quantidade >= 100 else 3)
+    return casos
+
+def comparar(resultados, baseline, tolerancia=TOLERANCIA):
+    """Lista de regressões (tempo, alocação ou tamanho acima da tolerância) em relação ao baseline"""
+    regressoes = []
+    for nome, atual in resultados.items():
+        anterior = baseline.get(nome)
+        if not anterior:
+            continue
+        if atual['ms'] > anterior['ms'] * (1 + tolerancia) and atual['ms'] - anterior['ms'] > FOLGA_MS:
+            regressoes.append((nome, 'tempo', anterior['ms'], atual['ms']))
+        if atual['alocado_kb'] > anterior['alocado_kb'] * (1 + tolerancia) and \
+                atual['alocado_kb'] - anterior['alocado_kb'] > 64:
+            regressoes.append((nome, 'alocação', anterior['alocado_kb'], atual['alocado_kb']))
+        if atual['bytes'] and anterior.get('bytes') and atual['bytes'] > anterior['bytes'] * (1 + tolerancia):
+            regressoes.append((nome, 'tamanho', anterior['bytes'], atual['bytes']))
+    return regressoes
+
+def bench_suite(tamanhos_lote=(1, 10, 100, 1000), salvar_baseline=False, tolerancia=TOLERANCIA):
+    """Roda a suíte completa, grava o JSON em bench_output/ e compara com o baseline
+
+    Retorna 1 se houver regressão em relação ao baseline (para uso em CI).
+    """
+    import docx
+    from gerador import esqueleto, proposta
+
+    # Esqueletos e template prontos: medimos o regime, não a primeira execução
+    with tempfile.TemporaryDirectory() as pasta:
+        gerar_lote(clientes_sinteticos(4), pasta, verboso=False)
+    proposta.carregar_template()
+    esqueleto.versao_template()
+
+    resultados = {}
+    print(f"{'caso':<44} {'ms':>10} {'mediana':>10} {'alocado (KB)':>13} {'saída (KB)':>11}")
+    for nome, (funcao, preparar, repeticoes) in casos_suite(tamanhos_lote).items():
+        r = resultados[nome] = medir(funcao, preparar, repeticoes)
+        saida = f"{r['bytes'] / 1024:>11.1f}" if r['bytes'] else f"{'—':>11}"
+        print(f"{nome:<44} {r['ms']:>10.2f} {r['mediana_ms']:>10.2f} {r['alocado_kb']:>13.0f} {saida}")
+
+    relatorio = {
+        'quando': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'python_docx': docx.__version__,
+        'nucleos': cpus_disponiveis(),
+        'casos': resultados,
+    }
+    os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+    caminho = os.path.join(PASTA_RESULTADOS, f"suite-{datetime.now():%Y%m%d-%H%M%S}.json")
+    for destino in (caminho, os.path.join(PASTA_RESULTADOS, 'suite-ultima.json')):
+        with open(destino, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f'💾 Resultados em {caminho}')
+
+    if salvar_baseline:
+        with open(BASELINE_SUITE, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f'💾 Baseline gravado em {BASELINE_SUITE}')
+        return 0
+    if not os.path.exists(BASELINE_SUITE):
+        print('⚠️ Sem baseline para comparar (grave um com --salvar-baseline)')
+        return 0
+
+    with open(BASELINE_SUITE, encoding='utf-8') as f:
+        baseline = json.load(f)['casos']
+    sem_baseline = [nome for nome in resultados if nome not in baseline]
+    if sem_baseline:
+        print(f"⚠️ Caso(s) sem baseline, não comparados (grave com --salvar-baseline): {', '.join(sem_baseline)}")
+    regressoes = comparar(resultados, baseline, tolerancia)
+    if not regressoes:
+        print(f'✅ Nenhuma regressão acima de {tolerancia:.0%} em relação ao baseline')
+        return 0
+    print(f'❌ {len(regressoes)} regressão(ões) acima de {tolerancia:.0%} em relação ao baseline:')
+    for nome, medida, antes, depois in regressoes:
+        print(f'   {nome}: {medida} {antes:.1f} -> {depois:.1f} ({depois / antes - 1:+.0%})')
+    return 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m gerador.bench', description='Benchmarks do gerador de documentos')
+    parser.add_argument('--docs', type=int,
+                        help='propostas por rodada (padrão: 48; 300 no --incremental; 40 no --pdf; '
+                             '100 no --graficos e no --tamanho)')
+    parser.add_argument('--max-workers', type=int,
+                        help='máximo de processos (padrão: núcleos disponíveis; instâncias do LibreOffice no --pdf)')
+    parser.add_argument('--tabelas', action='store_true', help='mede a montagem de tabelas grandes')
+    parser.add_argument('--streaming', action='store_true',
+                        help='compara doc.save() com a escrita em streaming')
+    parser.add_argument('--relatorio', action='store_true',
+                        help='relatório mensal sobre um histórico sintético em SQLite')
+    parser.add_argument('--incremental', action='store_true',
+                        help='regeneração incremental: rodada completa e rodada com poucas mudanças')
+    parser.add_argument('--conflitos', action='store_true',
+                        help='conflitos e quase-conflitos de um ano de reservas (varredura por local)')
+    parser.add_argument('--estatisticas', action='store_true',
+                        help='indicadores com numpy sobre todo o histórico sintético')
+    parser.add_argument('--graficos', action='store_true',
+                        help='propostas com gráfico: cache de gráficos x desenhar em todo documento')
+    parser.add_argument('--pdf', action='store_true',
+                        help='PDFs por minuto com reportlab e com o LibreOffice (por arquivo e em pool)')
+    parser.add_argument('--tamanho', action='store_true',
+                        help='bytes por proposta: doc.save() x otimizado em cada nível de compressão')
+    parser.add_argument('--acervo', action='store_true',
+                        help='histórico de revisões no acervo: espaço ocupado x .docx e tempo de restauração')
+    parser.add_argument('--importtime', action='store_true',
+                        help='custo de importação e tempo de partida da CLI, comparado com o baseline')
+    parser.add_argument('--suite', action='store_true',
+                        help='suíte completa (proposta, helpers, tabelas, doc.save, lote) com JSON em bench_output/')
+    parser.add_argument('--rapido', action='store_true', help='na --suite, lote só até 100 documentos')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help=f'na --suite, piora aceita antes de acusar regressão (padrão: {TOLERANCIA})')
+    parser.add_argument('--salvar-baseline', action='store_true',
+                        help='com --importtime ou --suite, grava a medição atual como novo baseline')
+    parser.add_argument('--linhas', type=int, nargs='+',
+                        help='tamanhos de tabela (padrão: 1000 10000 no --tabelas, '
+                             '10000 100000 no --streaming, 500000 requisições no --relatorio, '
+                             '20000 reservas no --conflitos, 500000 requisições no --estatisticas)')
+    args = parser.parse_args(argv)
+    if args.tabelas:
+        bench_tabelas(args.linhas or (1000, 10000))
+    elif args.streaming:
+        bench_streaming(args.linhas or (10000, 100000))
+    elif args.incremental:
+        bench_incremental(args.docs or 300)
+    elif args.relatorio:
+        bench_relatorio(*(args.linhas or [500000])[:1])
+    elif args.conflitos:
+        bench_conflitos(*(args.linhas or [20000])[:1])
+    elif args.estatisticas:
+        bench_estatisticas(*(args.linhas or [500000])[:1])
+    elif args.graficos:
+        bench_graficos(args.docs or 100)
+    elif args.tamanho:
+        bench_tamanho(args.docs or 100)
+    elif args.acervo:
+        bench_acervo(args.docs or 100)
+    elif args.pdf:
+        bench_pdf(args.docs or 40, args.max_workers)
+    elif args.importtime:
+        bench_importtime(args.salvar_baseline)
+    elif args.suite:
+        return bench_suite((1, 10, 100) if args.rapido else (1, 10, 100, 1000), args.salvar_baseline,
+                           args.tolerancia)
+    else:
+        bench_workers(args.docs or 48, args.max_workers)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
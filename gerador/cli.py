@@ -0,0 +1,457 @@
+"""
+Linha de comando do gerador de documentos
+
+    gerar_proposta_word.py [render] [--arquivo CAMINHO|-] [--idioma pt_BR|es|en] [--compressao N] [--perfil JSON [--cprofile]]
+    gerar_proposta_word.py render --formatos docx html md pdf [--saida PASTA] [--idioma IDIOMA]
+    gerar_proposta_word.py render --watch [--formatos ...]
+    gerar_proposta_word.py batch MANIFESTO [--saida PASTA | --pacote ARQUIVO.zip|.tar] [--idiomas IDIOMA ...]
+                                           [--workers N] [--sem-cache] [--forcar] [--compressao N] [--watch]
+                                           [--acervo PASTA]
+    gerar_proposta_word.py validate [MANIFESTO ...] [--conteudo JSON]
+    gerar_proposta_word.py report EXPORTACAO [--mes AAAA-MM] [--saida PASTA] [--idioma pt_BR|es|en] [--sem-indicadores] [--sem-graficos]
+                                             [--compressao N] [--acervo PASTA]
+    gerar_proposta_word.py optimize DOCX ... (--saida PASTA | --no-lugar) [--compressao N]
+    gerar_proposta_word.py archive add DOCX ... | list [NOME] | get NOME [--versao N] [--saida CAMINHO] | stats
+                                   [--acervo PASTA]
+    gerar_proposta_word.py convert DOCX ... [--saida PASTA] [--instancias N] [--lote N]
+    gerar_proposta_word.py serve [--host H] [--porta P | --unix CAMINHO] [--workers N] [--fila N]
+                                 [--exportacoes PASTA]
+    gerar_proposta_word.py bench [opções de gerador.bench]
+
+No carregamento só o argparse é importado: python-docx, lxml e os módulos do
+gerador entram dentro de cada comando, então --help e validate respondem sem
+pagar o custo de importar a pilha de geração de .docx.
+"""
+
+import argparse
+import sys
+
+COMANDOS = ('render', 'batch', 'validate', 'report', 'optimize', 'archive', 'convert', 'serve', 'bench')
+
+# Cópias de gerador.idiomas.IDIOMAS e gerador.otimizacao.NIVEL_COMPRESSAO, para o --help não importar o gerador
+IDIOMAS = ('pt_BR', 'es', 'en')
+NIVEL_COMPRESSAO = 9
+AJUDA_COMPRESSAO = f'nível de compressão do zip dos .docx, de 0 (sem) a 9 (padrão: {NIVEL_COMPRESSAO})'
+ACERVO_PADRAO = 'acervo'
+
+ERROS = {
+    'render': 'Erro ao criar proposta',
+    'batch': 'Erro ao gerar o lote',
+    'validate': 'Erro na validação',
+    'report': 'Erro ao gerar o relatório',
+    'optimize': 'Erro ao otimizar',
+    'archive': 'Erro no acervo',
+    'convert': 'Erro ao converter',
+    'serve': 'Erro no serviço',
+    'bench': 'Erro no benchmark',
+}
+
+def _positivo(texto):
+    """Tipo do argparse: inteiro maior que zero"""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'inteiro inválido: {texto!r}') from None
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f'deve ser ao menos 1: {valor}')
+    return valor
+
+def cmd_render(args):
+    """Proposta do cliente padrão, em .docx ou em vários formatos"""
+    from gerador import proposta
+    cliente = {**proposta.CLIENTE_PADRAO, 'idioma': args.idioma}
+    if args.watch:
+        return _render_observando(args, cliente)
+    if not args.formatos:
+        perfil = None
+        if args.perfil:
+            from gerador.perfil import PerfilEtapas
+            perfil = PerfilEtapas(cprofile=args.cprofile)
+        try:
+            if args.arquivo == '-':
+                # Só os bytes do .docx na saída padrão, para encadear com outros programas
+                proposta.escrever_proposta(sys.stdout.buffer, cliente, perfil=perfil,
+                                           nivel_compressao=args.compressao)
+            else:
+                proposta.create_proposta(cliente, perfil=perfil, caminho=args.arquivo,
+                                         nivel_compressao=args.compressao)
+        finally:
+            if perfil:
+                perfil.encerrar()
+                perfil.salvar_json(args.perfil)
+                if args.perfil != '-':
+                    saida = sys.stderr if args.arquivo == '-' else sys.stdout
+                    perfil.imprimir(saida)
+                    print(f'⏱️  Perfil das etapas salvo em: {args.perfil}', file=saida)
+        return 0
+    from gerador.formatos import gerar_formatos
+    gerar_formatos(cliente, args.saida or 'propostas', args.formatos,
+                   paralelo=None if args.paralelo == 'nenhum' else args.paralelo)
+    return 0
+
+def _render_observando(args, cliente):
+    """render --watch: refaz a proposta a cada mudança do conteúdo ou das traduções"""
+    from gerador import proposta
+    from gerador.manifesto import nome_arquivo
+    from gerador.observador import observar
+
+    def gerar(idiomas):
+        if idiomas is not None and cliente['idioma'] not in idiomas:
+            return 0
+        if args.formatos:
+            from gerador.formatos import gerar_formatos
+            resultados, _ = gerar_formatos(cliente, args.saida or 'propostas', args.formatos,
+                                           paralelo=None if args.paralelo == 'nenhum' else args.paralelo)
+            return len(resultados)
+        caminho = args.arquivo or nome_arquivo(cliente)
+        proposta.escrever_proposta(caminho, cliente, nivel_compressao=args.compressao)
+        print(f'📄 {caminho}')
+        return 1
+
+    return observar(gerar)
+
+def cmd_batch(args):
+    """Propostas de todos os clientes de um manifesto"""
+    from gerador.lote import carregar_manifesto, gerar_lote, gerar_pacote
+    from gerador.manifesto import expandir_idiomas
+    if args.watch:
+        return _batch_observando(args)
+    clientes = carregar_manifesto(args.manifesto)
+    if args.idiomas:
+        clientes = expandir_idiomas(clientes, args.idiomas)
+    if args.pacote:
+        gerar_pacote(clientes, args.pacote, workers=args.workers, usar_cache=not args.sem_cache,
+                     nivel_compressao=args.compressao)
+        return 0
+    resultados, _ = gerar_lote(clientes, args.saida or 'propostas', workers=args.workers,
+                               usar_cache=not args.sem_cache, forcar=args.forcar,
+                               nivel_compressao=args.compressao)
+    if args.acervo:
+        _arquivar(args.acervo, [r['arquivo'] for r in resultados if not r.get('pulado')])
+    return 0
+
+def _batch_observando(args):
+    """batch --watch: relê o manifesto a cada mudança e refaz só as propostas afetadas
+
+    Quais documentos mudaram fica por conta da regeneração incremental
+    (gerador.incremental): o conteúdo muda a versão de todos os esqueletos,
+    um .po só a do seu idioma e uma linha do manifesto só aquele cliente.
+    """
+    from gerador.lote import carregar_manifesto, gerar_lote
+    from gerador.manifesto import expandir_idiomas
+    from gerador.observador import observar
+    forcar = args.forcar  # só na primeira geração
+
+    def gerar(idiomas):
+        nonlocal forcar
+        clientes = carregar_manifesto(args.manifesto)
+        if args.idiomas:
+            clientes = expandir_idiomas(clientes, args.idiomas)
+        resultados, _ = gerar_lote(clientes, args.saida or 'propostas', workers=args.workers, verboso=False,
+                                   usar_cache=not args.sem_cache, forcar=forcar,
+                                   nivel_compressao=args.compressao)
+        forcar = False
+        gerados = [r for r in resultados if not r.get('pulado')]
+        for r in gerados:
+            print(f"📄 {r['arquivo']} — {r['segundos'] * 1000:.1f} ms")
+        if args.acervo:
+            _arquivar(args.acervo, [r['arquivo'] for r in gerados])
+        return len(gerados)
+
+    return observar(gerar, manifesto=args.manifesto)
+
+def cmd_validate(args):
+    """Valida o arquivo de conteúdo e os manifestos, sem gerar documentos"""
+    from gerador.conteudo import CAMINHO_PADRAO, carregar_conteudo
+    from gerador.manifesto import carregar_manifesto
+
+    erros = 0
+    caminho = args.conteudo or CAMINHO_PADRAO
+    try:
+        conteudo = carregar_conteudo(caminho)
+        print(f'✅ {caminho}: conteúdo válido (versão {conteudo.versao}, '
+              f'{len(conteudo.modulos)} módulo(s) bônus)')
+    except (OSError, ValueError) as e:
+        print(f'❌ {e}')
+        return 1
+
+    for manifesto in args.manifestos:
+        try:
+            clientes = carregar_manifesto(manifesto)
+            print(f'✅ {manifesto}: {len(clientes)} cliente(s)')
+        except (OSError, ValueError) as e:
+            print(f'❌ {manifesto}: {e}')
+            erros += 1
+    return 1 if erros else 0
+
+def cmd_report(args):
+    """Relatório mensal a partir de uma exportação do banco"""
+    from datetime import date
+    from gerador.relatorios import gerar_relatorio_mensal
+    mes = args.mes or date.today().strftime('%Y-%m')
+    ano, mes = (int(parte) for parte in mes.split('-'))
+    totais = gerar_relatorio_mensal(args.exportacao, ano, mes, args.saida or 'relatorios',
+                                    estatisticas=False if args.sem_indicadores else None,
+                                    com_graficos=False if args.sem_graficos else None,
+                                    nivel_compressao=args.compressao, idioma=args.idioma)
+    if args.acervo:
+        _arquivar(args.acervo, [totais['arquivo']])
+    return 0
+
+def cmd_optimize(args):
+    """Otimiza .docx já gravados e mostra o tamanho antes e depois"""
+    import os
+    from gerador.otimizacao import otimizar_arquivo
+
+    if args.saida:
+        os.makedirs(args.saida, exist_ok=True)
+    antes = depois = erros = 0
+    for caminho in args.documentos:
+        destino = os.path.join(args.saida, os.path.basename(caminho)) if args.saida else None
+        try:
+            e = otimizar_arquivo(caminho, destino, args.compressao, no_lugar=args.no_lugar)
+        except Exception as erro:
+            print(f'❌ {caminho}: {erro}')
+            erros += 1
+            continue
+        antes += e['antes']
+        depois += e['depois']
+        print(f"📄 {destino or caminho}: {e['antes'] / 1024:.1f} KB -> {e['depois'] / 1024:.1f} KB "
+              f"(-{1 - e['depois'] / e['antes']:.0%}) | estilos {e['estilos'][0]} -> {e['estilos'][1]} | "
+              f"{len(e['partes_removidas'])} parte(s) removida(s) | {e['runs_juntados']} run(s) juntado(s)")
+    if antes:
+        print(f'✅ {len(args.documentos) - erros} documento(s): {antes / 1024:.0f} KB -> {depois / 1024:.0f} KB '
+              f'(-{1 - depois / antes:.0%})')
+    return 1 if erros else 0
+
+def _arquivar(pasta, caminhos):
+    """Guarda os .docx no acervo e mostra a versão de cada um"""
+    import os
+    from gerador.acervo import Acervo
+    acervo = Acervo(pasta)
+    for caminho in caminhos:
+        manifesto = acervo.guardar_arquivo(caminho)
+        print(f"🗄️  {os.path.basename(caminho)}: versão {manifesto['versao']} no acervo {pasta}")
+
+def cmd_archive(args):
+    """Acervo do histórico: guarda, lista e restaura versões de documentos"""
+    import os
+    from gerador.acervo import Acervo
+    acervo = Acervo(args.acervo)
+    if args.acao == 'add':
+        _arquivar(args.acervo, args.documentos)
+    elif args.acao == 'list':
+        for nome in [args.nome] if args.nome else acervo.documentos():
+            versoes = acervo.versoes(nome)
+            if not versoes:
+                raise ValueError(f'{nome}: documento não está no acervo')
+            print(f'📄 {nome}')
+            for manifesto in versoes:
+                print(f"   v{manifesto['versao']}  {manifesto['guardado_em']}  {manifesto['bytes'] / 1024:.1f} KB")
+    elif args.acao == 'get':
+        destino = args.saida or args.nome
+        if os.path.isdir(destino):
+            destino = os.path.join(destino, args.nome)
+        manifesto = acervo.restaurar(args.nome, destino, args.versao)
+        print(f"📄 {args.nome} v{manifesto['versao']} -> {destino}")
+    else:
+        e = acervo.estatisticas()
+        ocupados = e['bytes_objetos'] + e['bytes_manifestos']
+        print(f"🗄️  {e['documentos']} documento(s), {e['versoes']} versão(ões), {e['objetos']} objeto(s)")
+        print(f"📦 {e['bytes_originais'] / 1024:.0f} KB em .docx -> {ocupados / 1024:.0f} KB no acervo"
+              + (f" ({e['bytes_originais'] / ocupados:.1f}x menor)" if ocupados else ''))
+    return 0
+
+def cmd_convert(args):
+    """Converte .docx já gerados em PDF com instâncias do LibreOffice"""
+    import os
+    import time
+    from gerador.pdf import PoolLibreOffice
+    
+    inicio = time.perf_counter()
+    erros = 0
+    with PoolLibreOffice(args.instancias, args.lote) as pool:
+        futuros = [(docx, pool.converter(docx, args.saida or os.path.dirname(docx) or '.'))
+                   for docx in args.documentos]
+        for docx, futuro in futuros:
+            try:
+                print(f'📄 {futuro.result()}')
+            except Exception as e:
+                print(f'❌ {docx}: {e}')
+                erros += 1
+    total = time.perf_counter() - inicio
+    convertidos = len(futuros) - erros
+    print(f'✅ {convertidos} PDF(s) em {total:.1f} s ({convertidos / total * 60:.0f} documentos/min)')
+    return 1 if erros else 0
+
+def cmd_serve(args):
+    """Serviço HTTP que gera propostas e relatórios sob demanda"""
+    import asyncio
+    from gerador.servico import servir
+    try:
+        asyncio.run(servir(args.host, args.porta, args.unix, args.workers, args.fila, args.threads,
+                           args.exportacoes))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def cmd_bench(args):
+    """Repassa as opções para gerador.bench"""
+    from gerador import bench
+    return bench.main(args.opcoes) or 0
+
+def criar_parser(prog=None):
+    parser = argparse.ArgumentParser(
+        prog=prog, description='Gera a Proposta Comercial e os relatórios em formato Word (.docx)')
+    comandos = parser.add_subparsers(dest='comando', metavar='COMANDO')
+
+    render = comandos.add_parser('render', help='gera a proposta do cliente padrão (comando padrão)')
+    render.add_argument('--arquivo', metavar='CAMINHO',
+                        help='onde gravar o .docx ("-" para a saída padrão; padrão: '
+                             'PROPOSTA_COMERCIAL_<SIGLA>.docx na pasta atual)')
+    render.add_argument('--formatos', nargs='+', metavar='FORMATO',
+                        help='gera a proposta em vários formatos de uma vez: docx, html, md, pdf')
+    render.add_argument('--paralelo', choices=('threads', 'processos', 'nenhum'), default='threads',
+                        help='como os --formatos são gerados (padrão: threads, um por formato)')
+    render.add_argument('--saida', help='pasta dos --formatos (padrão: propostas)')
+    render.add_argument('--idioma', choices=IDIOMAS, default=IDIOMAS[0],
+                        help=f'idioma da proposta (padrão: {IDIOMAS[0]})')
+    render.add_argument('--compressao', type=int, choices=range(10), default=NIVEL_COMPRESSAO, metavar='N',
+                        help=AJUDA_COMPRESSAO)
+    render.add_argument('--watch', action='store_true',
+                        help='fica residente e gera de novo a cada mudança do conteúdo ou das traduções')
+    render.add_argument('--perfil', metavar='JSON',
+                        help='mede cada etapa da proposta e grava o perfil em JSON ("-" para a saída padrão)')
+    render.add_argument('--cprofile', action='store_true',
+                        help='com --perfil, inclui as funções mais caras de cada etapa (cProfile)')
+    render.set_defaults(executar=cmd_render)
+
+    batch = comandos.add_parser('batch', help='gera as propostas de um manifesto de clientes')
+    batch.add_argument('manifesto', metavar='MANIFESTO', help='CSV ou JSON com os clientes')
+    batch.add_argument('--saida', help='pasta onde os documentos são gravados (padrão: propostas)')
+    batch.add_argument('--pacote', metavar='ARQUIVO',
+                       help='grava todas as propostas num único .zip ou .tar, com índice (em vez de --saida)')
+    batch.add_argument('--workers', type=int, default=1, metavar='N',
+                       help='processos usados no lote (padrão: 1)')
+    batch.add_argument('--sem-cache', action='store_true',
+                       help='monta cada documento do zero, sem o esqueleto compilado em cache')
+    batch.add_argument('--forcar', action='store_true',
+                       help='gera de novo até as propostas que não mudaram')
+    batch.add_argument('--idiomas', nargs='+', choices=IDIOMAS, metavar='IDIOMA',
+                       help=f"gera cada cliente em todos estes idiomas ({', '.join(IDIOMAS)}), "
+                            'num só processo; sem a opção vale a coluna idioma do manifesto')
+    batch.add_argument('--compressao', type=int, choices=range(10), default=NIVEL_COMPRESSAO, metavar='N',
+                       help=AJUDA_COMPRESSAO)
+    batch.add_argument('--watch', action='store_true',
+                       help='fica residente e gera de novo só as propostas afetadas a cada mudança '
+                            'do manifesto, do conteúdo ou das traduções')
+    batch.add_argument('--acervo', metavar='PASTA',
+                       help='guarda cada proposta gerada como nova versão no acervo (veja archive)')
+    batch.set_defaults(executar=cmd_batch)
+
+    validate = comandos.add_parser('validate', help='valida o conteúdo e manifestos sem gerar documentos')
+    validate.add_argument('manifestos', nargs='*', metavar='MANIFESTO', help='manifestos de clientes')
+    validate.add_argument('--conteudo', metavar='JSON',
+                          help='arquivo de conteúdo (padrão: gerador/conteudo_proposta.json)')
+    validate.set_defaults(executar=cmd_validate)
+
+    report = comandos.add_parser('report', help='gera o relatório mensal a partir de uma exportação do banco')
+    report.add_argument('exportacao', metavar='EXPORTACAO', help='arquivo SQLite ou pasta com os CSVs')
+    report.add_argument('--mes', metavar='AAAA-MM', help='mês do relatório (padrão: mês atual)')
+    report.add_argument('--saida', help='pasta do relatório (padrão: relatorios)')
+    report.add_argument('--sem-indicadores', action='store_true',
+                        help='omite a seção de indicadores (calculada com numpy, se instalado)')
+    report.add_argument('--sem-graficos', action='store_true',
+                        help='omite o gráfico de uso diário (desenhado com matplotlib, se instalado)')
+    report.add_argument('--idioma', choices=IDIOMAS, default=IDIOMAS[0],
+                        help='números, meses e datas no padrão do idioma (padrão: pt_BR)')
+    report.add_argument('--compressao', type=int, choices=range(10), default=NIVEL_COMPRESSAO, metavar='N',
+                        help=AJUDA_COMPRESSAO)
+    report.add_argument('--acervo', metavar='PASTA',
+                        help='guarda o relatório como nova versão no acervo (veja archive)')
+    report.set_defaults(executar=cmd_report)
+
+    optimize = comandos.add_parser('optimize', help='reduz .docx já gerados e mostra o tamanho antes e depois')
+    optimize.add_argument('documentos', nargs='+', metavar='DOCX', help='arquivos .docx a otimizar')
+    destino_otimizados = optimize.add_mutually_exclusive_group(required=True)
+    destino_otimizados.add_argument('--saida', help='pasta dos arquivos otimizados')
+    destino_otimizados.add_argument('--no-lugar', action='store_true', help='substitui os originais')
+    optimize.add_argument('--compressao', type=int, choices=range(10), default=NIVEL_COMPRESSAO, metavar='N',
+                          help=AJUDA_COMPRESSAO)
+    optimize.set_defaults(executar=cmd_optimize)
+
+    archive = comandos.add_parser('archive', help='histórico de versões dos documentos, com partes deduplicadas')
+    acoes = archive.add_subparsers(dest='acao', metavar='ACAO', required=True)
+    archive_add = acoes.add_parser('add', help='guarda .docx como nova versão (o nome do arquivo é o documento)')
+    archive_add.add_argument('documentos', nargs='+', metavar='DOCX', help='arquivos .docx a guardar')
+    archive_list = acoes.add_parser('list', help='lista os documentos e suas versões')
+    archive_list.add_argument('nome', nargs='?', metavar='NOME', help='só as versões deste documento')
+    archive_get = acoes.add_parser('get', help='remonta o .docx de uma versão')
+    archive_get.add_argument('nome', metavar='NOME', help='documento (nome do arquivo guardado)')
+    archive_get.add_argument('--versao', type=int, metavar='N', help='versão a restaurar (padrão: a mais nova)')
+    archive_get.add_argument('--saida', metavar='CAMINHO', help='arquivo ou pasta de destino (padrão: NOME)')
+    acoes.add_parser('stats', help='espaço ocupado pelo acervo e redução em relação aos .docx')
+    for acao in (archive_add, archive_list, archive_get, acoes.choices['stats']):
+        acao.add_argument('--acervo', default=ACERVO_PADRAO, metavar='PASTA',
+                          help=f'pasta do acervo (padrão: {ACERVO_PADRAO})')
+    archive.set_defaults(executar=cmd_archive)
+
+    convert = comandos.add_parser('convert', help='converte .docx em PDF com o LibreOffice (pool de instâncias)')
+    convert.add_argument('documentos', nargs='+', metavar='DOCX', help='arquivos .docx a converter')
+    convert.add_argument('--saida', help='pasta dos PDFs (padrão: a pasta de cada .docx)')
+    convert.add_argument('--instancias', type=_positivo, default=2, metavar='N',
+                         help='instâncias do LibreOffice em paralelo (padrão: 2)')
+    convert.add_argument('--lote', type=_positivo, default=20, metavar='N',
+                         help='arquivos convertidos por execução do soffice (padrão: 20)')
+    convert.set_defaults(executar=cmd_convert)
+    
+    serve = comandos.add_parser('serve', help='serviço local que gera documentos sob demanda (HTTP)')
+    serve.add_argument('--host', default='127.0.0.1', help='endereço de escuta (padrão: 127.0.0.1)')
+    serve.add_argument('--porta', type=int, default=8765, help='porta TCP (padrão: 8765)')
+    serve.add_argument('--unix', metavar='CAMINHO', help='escuta num socket Unix em vez de TCP')
+    serve.add_argument('--workers', type=int, metavar='N',
+                       help='documentos gerados ao mesmo tempo (padrão: núcleos disponíveis)')
+    serve.add_argument('--fila', type=int, metavar='N',
+                       help='pedidos aguardando vaga antes de responder 503 (padrão: 4 × workers)')
+    serve.add_argument('--threads', action='store_true',
+                       help='usa threads em vez de processos (menos memória, sem paralelismo real)')
+    serve.add_argument('--exportacoes', metavar='PASTA',
+                       help='pasta das exportações que POST /relatorio pode ler (sem ela a rota fica desligada)')
+    serve.set_defaults(executar=cmd_serve)
+    
+    # Só para aparecer na ajuda: main() repassa tudo depois de "bench" para gerador.bench
+    comandos.add_parser('bench', help='benchmarks (veja bench --help)', add_help=False)
+    return parser
+
+def main(argv=None, prog=None):
+    """Executa a linha de comando e devolve o código de saída"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Sem comando explícito vale o render, como no script original
+    if not argv or (argv[0] not in COMANDOS and argv[0] not in ('-h', '--help')):
+        argv = ['render', *argv]
+    if argv[0] == 'bench':
+        # As opções (inclusive --help) são do parser do próprio gerador.bench
+        args = argparse.Namespace(comando='bench', executar=cmd_bench, opcoes=argv[1:])
+    else:
+        parser = criar_parser(prog)
+        args = parser.parse_args(argv)
+        if getattr(args, 'arquivo', None) == '-' and args.perfil == '-':
+            parser.error('--arquivo - e --perfil - não podem usar a saída padrão ao mesmo tempo')
+        if getattr(args, 'watch', False) and (getattr(args, 'arquivo', None) == '-' or getattr(args, 'perfil', None)
+                                              or getattr(args, 'pacote', None)):
+            parser.error('--watch não combina com --arquivo -, --perfil nem --pacote')
+        if getattr(args, 'acervo', None) and getattr(args, 'pacote', None):
+            parser.error('--acervo não combina com --pacote')
+
+    try:
+        return args.executar(args)
+    except ImportError as e:
+        if (e.name or '').split('.')[0] in ('docx', 'lxml'):
+            print('❌ Erro: Biblioteca python-docx não instalada')
+            print('📦 Instale com: pip install python-docx')
+        else:
+            print(f'❌ Erro: {e}')
+        return 1
+    except Exception as e:
+        print(f"❌ {ERROS.get(getattr(args, 'comando', None), 'Erro')}: {e}")
+        return 1
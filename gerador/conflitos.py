@@ -0,0 +1,80 @@
+"""
+Análise de conflitos de agenda por local (varredura sobre intervalos ordenados)
+
+Mesma regra do backend (checkRealTimeConflicts em
+backend/src/controllers/RequestsController.js), aplicada a todo o histórico de
+uma vez em vez de uma requisição por vez:
+
+- conflito: duas reservas confirmadas no mesmo local com horários sobrepostos;
+- quase-conflito: uma começa menos de 15 minutos depois de a outra terminar
+  (sem tempo para desmontar e montar o espaço).
+
+Por local, as reservas são ordenadas pelo início e varridas uma vez. As que
+ainda estão em andamento ficam num heap pelo fim; as que acabaram de terminar
+ficam numa janela de 15 minutos. O custo é O(n log n) mais o número de pares
+encontrados, em vez de comparar cada reserva com todas as outras.
+"""
+
+import heapq
+from collections import defaultdict, deque
+from datetime import timedelta
+
+INTERVALO_MINIMO = timedelta(minutes=15)
+
+# Mesmos status que o backend considera ao checar conflitos de horário
+STATUS_CONFIRMADOS = ('APTO', 'EXECUTADO', 'FINALIZADO')
+
+def reservas_por_local(requisicoes, status=STATUS_CONFIRMADOS):
+    """Agrupa as reservas válidas (com início < fim e status considerado) por local"""
+    locais = defaultdict(list)
+    for requisicao in requisicoes:
+        if (requisicao.get('status') or '').upper() not in status:
+            continue
+        inicio, fim = requisicao.get('start_datetime'), requisicao.get('end_datetime')
+        if inicio and fim and inicio < fim:
+            locais[requisicao.get('location') or 'Sem local'].append(requisicao)
+    return locais
+
+def varrer_local(reservas, intervalo_minimo=INTERVALO_MINIMO):
+    """Conflitos e quase-conflitos de um local
+
+    Retorna duas listas de (a, b, minutos): em conflitos, a começou antes e
+    os minutos são a sobreposição; em quase, a terminou antes de b começar e
+    os minutos são o intervalo entre as duas.
+    """
+    ordenadas = sorted(reservas, key=lambda r: (r['start_datetime'], r['end_datetime']))
+    conflitos = []
+    quase = []
+    ativas = []        # heap (fim, ordem, reserva) das reservas em andamento
+    encerradas = deque()  # reservas já terminadas, em ordem de fim
+    for ordem, reserva in enumerate(ordenadas):
+        inicio, fim = reserva['start_datetime'], reserva['end_datetime']
+        while ativas and ativas[0][0] <= inicio:
+            encerradas.append(heapq.heappop(ativas)[2])
+        while encerradas and inicio - encerradas[0]['end_datetime'] >= intervalo_minimo:
+            encerradas.popleft()
+
+        for anterior in encerradas:
+            intervalo = inicio - anterior['end_datetime']
+            quase.append((anterior, reserva, intervalo.total_seconds() / 60))
+        for _, _, outra in ativas:
+            sobreposicao = min(fim, outra['end_datetime']) - inicio
+            conflitos.append((outra, reserva, sobreposicao.total_seconds() / 60))
+        heapq.heappush(ativas, (fim, ordem, reserva))
+    return conflitos, quase
+
+def analisar_conflitos(requisicoes, intervalo_minimo=INTERVALO_MINIMO, status=STATUS_CONFIRMADOS):
+    """Conflitos e quase-conflitos de todas as reservas, por local
+
+    Retorna {'conflitos': [(local, a, b, minutos)], 'quase': [(local, a, b, minutos)],
+    'reservas': total analisado}, em ordem de local e horário.
+    """
+    conflitos = []
+    quase = []
+    total = 0
+    for local, reservas in sorted(reservas_por_local(requisicoes, status).items()):
+        total += len(reservas)
+        conflitos_local, quase_local = varrer_local(reservas, intervalo_minimo)
+        conflitos.extend((local, a, b, minutos) for a, b, minutos in conflitos_local)
+        quase.extend((local, a, b, minutos) for a, b, minutos in quase_local)
+    return {'conflitos': conflitos, 'quase': quase, 'reservas': total}
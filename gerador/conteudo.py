@@ -0,0 +1,279 @@
+"""
+Modelo de conteúdo da proposta
+
+Todo o texto da proposta fica em conteudo_proposta.json. Ele é lido uma vez por
+processo, validado e convertido em objetos compactos (__slots__, tuplas) que
+todos os renderizadores usam. Trechos como {nome} ou {valor_sistema} são
+preenchidos com os dados do cliente na hora de renderizar (str.format_map).
+Campos desconhecidos nos trechos são recusados na validação. Em outro idioma
+os textos passam pelo catálogo (gerador.idiomas) antes da validação, e o
+modelo traduzido também é guardado, um por idioma.
+"""
+
+import json
+import os
+import re
+import string
+from functools import lru_cache
+
+from gerador.idiomas import IDIOMA_PADRAO, traduzir_dados
+
+CAMINHO_PADRAO = os.path.join(os.path.dirname(__file__), 'conteudo_proposta.json')
+
+SECOES = (
+    'apresentacao', 'funcionalidades', 'beneficios', 'tecnologias', 'mercado', 'bonus',
+    'nota_pessoal', 'investimento', 'inclusos', 'cronograma', 'pagamento', 'agradecimento',
+    'contato'
+)
+
+# Campos variáveis da proposta; o restante do documento é igual para todo cliente
+CAMPOS_CLIENTE = (
+    'nome', 'sigla', 'data', 'mes_ano', 'valor_sistema', 'valor_manutencao', 'meses',
+    'total_manutencao', 'total_investimento', 'economia', 'periodo'
+)
+# Campos que todo trecho pode citar ({nome}, {valor_mercado}...)
+CAMPOS_TEXTO = (*CAMPOS_CLIENTE, 'valor_mercado', 'versao')
+# Campos a mais de trechos específicos (caminho sem os índices das listas)
+CAMPOS_EXTRAS = {
+    'conteudo.bonus.rotulo_valor': ('valor',),
+    'conteudo.investimento.inclui.varios': ('quantidade',),
+    'conteudo.cronograma.etapa_modulo.fase': ('n',),
+    'conteudo.cronograma.etapa_modulo.atividade': ('atividade',),
+    'conteudo.cronograma.etapa_final.fase': ('inicio',),
+}
+# O detalhe dos itens de mercado só é preenchido com a quantidade e o valor unitário (ver gerador.precos)
+CAMPOS_DETALHE_MERCADO = ('quantidade', 'valor_unitario')
+
+class ConteudoInvalido(ValueError):
+    """Erro de validação do arquivo de conteúdo, com o caminho do campo"""
+
+class Secao:
+    """Título de seção com ícone"""
+    __slots__ = ('icone', 'titulo')
+
+    def __init__(self, icone, titulo):
+        self.icone = icone
+        self.titulo = titulo
+
+class Topico:
+    """Grupo de itens sob um subtítulo (ex.: uma funcionalidade)"""
+    __slots__ = ('titulo', 'itens')
+
+    def __init__(self, titulo, itens):
+        self.titulo = titulo
+        self.itens = tuple(itens)
+
+class Tecnologia:
+    """Linha da seção de tecnologias (área e descrição)"""
+    __slots__ = ('area', 'descricao')
+
+    def __init__(self, area, descricao):
+        self.area = area
+        self.descricao = descricao
+
+class ItemMercado:
+    """Linha da tabela de comparação com valores de mercado
+
+    Com quantidade e valor_unitario o valor é o produto dos dois e o detalhe
+    pode citá-los ({quantidade}, {valor_unitario}); ver gerador.precos.
+    """
+    __slots__ = ('item', 'detalhe', 'valor', 'quantidade', 'valor_unitario')
+
+    def __init__(self, item, detalhe, valor, quantidade=None, valor_unitario=None):
+        self.item = item
+        self.detalhe = detalhe
+        self.valor = valor
+        self.quantidade = quantidade
+        self.valor_unitario = valor_unitario
+
+class ModuloBonus:
+    """Módulo bônus que pode ser oferecido ao cliente"""
+    __slots__ = ('chave', 'titulo', 'nome', 'atividade', 'valor_mercado', 'itens')
+
+    def __init__(self, chave, titulo, nome, atividade, valor_mercado, itens):
+        self.chave = chave
+        self.titulo = titulo
+        self.nome = nome
+        self.atividade = atividade
+        self.valor_mercado = valor_mercado
+        self.itens = tuple(itens)
+
+class Etapa:
+    """Linha do cronograma de implementação"""
+    __slots__ = ('fase', 'atividade', 'prazo')
+
+    def __init__(self, fase, atividade, prazo):
+        self.fase = fase
+        self.atividade = atividade
+        self.prazo = prazo
+
+class Conteudo:
+    """Conteúdo completo da proposta, já validado"""
+    __slots__ = (
+        'versao', 'cabecalho', 'secoes', 'apresentacao', 'funcionalidades', 'beneficios',
+        'tecnologias', 'mercado', 'rotulo_total_mercado', 'cabecalho_mercado', 'bonus',
+        'modulos', 'nota_pessoal', 'investimento', 'inclusos_sistema', 'incluso_modulo',
+        'inclusos_servicos', 'cabecalho_cronograma', 'etapas', 'etapa_modulo', 'etapa_final',
+        'pagamento', 'agradecimento', 'contato', 'rodape'
+    )
+
+    @property
+    def valor_mercado_total(self):
+        """Soma dos itens da tabela de mercado"""
+        return sum(item.valor for item in self.mercado)
+
+def _campo(dados, chave, tipo, caminho):
+    """Lê um campo obrigatório conferindo o tipo"""
+    if not isinstance(dados, dict):
+        raise ConteudoInvalido(f'{caminho}: esperado um objeto')
+    if chave not in dados:
+        raise ConteudoInvalido(f'{caminho}.{chave}: campo obrigatório ausente')
+    valor = dados[chave]
+    if not isinstance(valor, tipo) or isinstance(valor, bool):
+        nomes = ' ou '.join(t.__name__ for t in (tipo if isinstance(tipo, tuple) else (tipo,)))
+        raise ConteudoInvalido(f'{caminho}.{chave}: esperado {nomes}, encontrado {type(valor).__name__}')
+    return valor
+
+def _textos(dados, chave, caminho, minimo=1):
+    """Lê uma lista não vazia de textos"""
+    lista = _campo(dados, chave, list, caminho)
+    if len(lista) < minimo:
+        raise ConteudoInvalido(f'{caminho}.{chave}: esperado ao menos {minimo} item(ns)')
+    for i, item in enumerate(lista):
+        if not isinstance(item, str) or not item.strip():
+            raise ConteudoInvalido(f'{caminho}.{chave}[{i}]: esperado texto não vazio')
+    return tuple(lista)
+
+def _objetos(dados, chave, caminho, construtor):
+    """Lê uma lista de objetos, convertendo cada um com o construtor"""
+    return tuple(construtor(item, f'{caminho}.{chave}[{i}]')
+                 for i, item in enumerate(_campo(dados, chave, list, caminho)))
+
+def _dicionario_textos(dados, chave, caminho, chaves):
+    """Lê um objeto cujos campos são todos textos obrigatórios"""
+    objeto = _campo(dados, chave, dict, caminho)
+    return {nome: _campo(objeto, nome, str, f'{caminho}.{chave}') for nome in chaves}
+
+def _etapa(dados, caminho):
+    return Etapa(*(_campo(dados, nome, str, caminho) for nome in Etapa.__slots__))
+
+def _item_mercado(dados, caminho):
+    """Item de mercado com valor fixo ou calculado (quantidade × valor_unitario)"""
+    item = _campo(dados, 'item', str, caminho)
+    detalhe = _campo(dados, 'detalhe', str, caminho)
+    if 'quantidade' not in dados and 'valor_unitario' not in dados:
+        return ItemMercado(item, detalhe, _campo(dados, 'valor', (int, float), caminho))
+    quantidade = _campo(dados, 'quantidade', (int, float), caminho)
+    unitario = _campo(dados, 'valor_unitario', (int, float), caminho)
+    valor = quantidade * unitario
+    if 'valor' in dados and _campo(dados, 'valor', (int, float), caminho) != valor:
+        raise ConteudoInvalido(f'{caminho}.valor: {dados["valor"]} diferente de quantidade × '
+                               f'valor_unitario ({valor:g})')
+    return ItemMercado(item, detalhe, valor, quantidade, unitario)
+
+def _modulo(dados, caminho):
+    return ModuloBonus(
+        _campo(dados, 'chave', str, caminho),
+        _campo(dados, 'titulo', str, caminho),
+        _campo(dados, 'nome', str, caminho),
+        _campo(dados, 'atividade', str, caminho),
+        _campo(dados, 'valor_mercado', (int, float), caminho),
+        _textos(dados, 'itens', caminho),
+    )
+
+def _conferir_campos(valor, caminho):
+    """Recusa {campos} desconhecidos nos textos: erro aqui e não um KeyError ao renderizar"""
+    if isinstance(valor, dict):
+        for chave, item in valor.items():
+            _conferir_campos(item, f'{caminho}.{chave}')
+    elif isinstance(valor, list):
+        for i, item in enumerate(valor):
+            _conferir_campos(item, f'{caminho}[{i}]')
+    elif isinstance(valor, str):
+        secao = re.sub(r'\[\d+\]', '', caminho)
+        if secao == 'conteudo.mercado.itens.detalhe':
+            permitidos = CAMPOS_DETALHE_MERCADO
+        else:
+            permitidos = (*CAMPOS_TEXTO, *CAMPOS_EXTRAS.get(secao, ()))
+        try:
+            campos = [campo for _, campo, _, _ in string.Formatter().parse(valor) if campo is not None]
+        except ValueError as e:
+            raise ConteudoInvalido(f'{caminho}: chaves mal formadas ({e})') from None
+        for campo in campos:
+            nome = re.split(r'[.\[]', campo, maxsplit=1)[0]
+            if nome not in permitidos:
+                raise ConteudoInvalido(f"{caminho}: campo {{{campo}}} desconhecido "
+                                       f"(disponíveis: {', '.join(permitidos)})")
+
+def validar(dados):
+    """Valida o JSON de conteúdo e monta o modelo em memória"""
+    c = Conteudo()
+    c.versao = _campo(dados, 'versao', str, 'conteudo')
+    c.cabecalho = _dicionario_textos(dados, 'cabecalho', 'conteudo', ('titulo', 'subtitulo', 'data'))
+
+    secoes = _campo(dados, 'secoes', dict, 'conteudo')
+    c.secoes = {}
+    for nome in SECOES:
+        secao = _campo(secoes, nome, dict, 'conteudo.secoes')
+        caminho = f'conteudo.secoes.{nome}'
+        c.secoes[nome] = Secao(_campo(secao, 'icone', str, caminho), _campo(secao, 'titulo', str, caminho))
+
+    c.apresentacao = _dicionario_textos(dados, 'apresentacao', 'conteudo', ('texto', 'destaques'))
+    c.funcionalidades = _objetos(dados, 'funcionalidades', 'conteudo', lambda item, caminho: Topico(
+        _campo(item, 'titulo', str, caminho), _textos(item, 'itens', caminho)))
+    c.beneficios = _textos(dados, 'beneficios', 'conteudo')
+    c.tecnologias = _objetos(dados, 'tecnologias', 'conteudo', lambda item, caminho: Tecnologia(
+        _campo(item, 'area', str, caminho), _campo(item, 'descricao', str, caminho)))
+
+    mercado = _campo(dados, 'mercado', dict, 'conteudo')
+    c.cabecalho_mercado = _textos(mercado, 'cabecalho', 'conteudo.mercado', minimo=3)
+    c.mercado = _objetos(mercado, 'itens', 'conteudo.mercado', _item_mercado)
+    c.rotulo_total_mercado = _campo(mercado, 'rotulo_total', str, 'conteudo.mercado')
+
+    c.bonus = _dicionario_textos(dados, 'bonus', 'conteudo', ('chamada', 'rotulo_valor'))
+    modulos = _objetos(dados['bonus'], 'modulos', 'conteudo.bonus', _modulo)
+    c.modulos = {modulo.chave: modulo for modulo in modulos}
+    if len(c.modulos) != len(modulos):
+        raise ConteudoInvalido('conteudo.bonus.modulos: chaves de módulo repetidas')
+
+    c.nota_pessoal = _textos(dados, 'nota_pessoal', 'conteudo')
+    investimento = _campo(dados, 'investimento', dict, 'conteudo')
+    c.investimento = {
+        **_dicionario_textos(dados, 'investimento', 'conteudo', (
+            'titulo', 'pagamento_unico', 'manutencao', 'periodo', 'total_titulo',
+            'total_composicao', 'economia')),
+        'inclui': _dicionario_textos(investimento, 'inclui', 'conteudo.investimento',
+                                     ('nenhum', 'um', 'varios')),
+    }
+
+    inclusos = _campo(dados, 'inclusos', dict, 'conteudo')
+    c.inclusos_sistema = _textos(inclusos, 'sistema', 'conteudo.inclusos')
+    c.incluso_modulo = _campo(inclusos, 'modulo', str, 'conteudo.inclusos')
+    c.inclusos_servicos = _textos(inclusos, 'servicos', 'conteudo.inclusos')
+
+    cronograma = _campo(dados, 'cronograma', dict, 'conteudo')
+    c.cabecalho_cronograma = _textos(cronograma, 'cabecalho', 'conteudo.cronograma', minimo=3)
+    c.etapas = _objetos(cronograma, 'etapas', 'conteudo.cronograma', _etapa)
+    c.etapa_modulo = _etapa(_campo(cronograma, 'etapa_modulo', dict, 'conteudo.cronograma'),
+                            'conteudo.cronograma.etapa_modulo')
+    c.etapa_final = _etapa(_campo(cronograma, 'etapa_final', dict, 'conteudo.cronograma'),
+                           'conteudo.cronograma.etapa_final')
+
+    c.pagamento = _textos(dados, 'pagamento', 'conteudo')
+    c.agradecimento = _textos(dados, 'agradecimento', 'conteudo')
+    c.contato = _textos(dados, 'contato', 'conteudo')
+    c.rodape = _campo(dados, 'rodape', str, 'conteudo')
+    _conferir_campos(dados, 'conteudo')
+    return c
+
+@lru_cache(maxsize=None)
+def carregar_conteudo(caminho=CAMINHO_PADRAO, idioma=IDIOMA_PADRAO):
+    """Lê, traduz e valida o arquivo de conteúdo uma única vez por processo e idioma"""
+    with open(caminho, encoding='utf-8') as f:
+        try:
+            dados = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ConteudoInvalido(f'{caminho}: JSON inválido ({e})') from e
+    if idioma != IDIOMA_PADRAO:
+        dados = traduzir_dados(dados, idioma)
+    return validar(dados)
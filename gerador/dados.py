@@ -0,0 +1,202 @@
+"""
+Leitura das exportações do banco (requests, request_items, inventory, locations)
+
+Aceita um arquivo SQLite com as tabelas do Supabase ou uma pasta com um CSV por
+tabela (requests.csv, request_items.csv, inventory.csv, locations.csv). As
+linhas são lidas em lotes (cursor.fetchmany / csv.DictReader) e entregues por
+geradores, então a memória não cresce com o histórico: só o recorte pedido
+(ex.: as requisições de um mês) chega a ser materializado por quem chama.
+"""
+
+import csv
+import os
+import sqlite3
+from datetime import date, datetime, timezone
+from itertools import islice
+
+TAMANHO_LOTE = 2000
+
+# Colunas usadas pelos relatórios (ver backend/src/controllers e backend/database)
+COLUNAS = {
+    'requests': ('id', 'requester_id', 'department', 'event_name', 'location', 'date',
+                 'start_datetime', 'end_datetime', 'status', 'prioridade', 'expected_audience',
+                 'created_at', 'approved_at'),
+    'request_items': ('id', 'request_id', 'inventory_id', 'item_name', 'quantity_requested'),
+    'inventory': ('id', 'name', 'category', 'quantity_available', 'quantity_total', 'location',
+                  'status'),
+    'locations': ('id', 'name', 'description', 'is_active'),
+}
+
+EXTENSOES_SQLITE = ('.db', '.sqlite', '.sqlite3')
+
+def ler_data_hora(valor):
+    """Converte o texto do banco em datetime (UTC, sem fuso); vazio vira None"""
+    if not valor:
+        return None
+    if isinstance(valor, datetime):
+        momento = valor
+    else:
+        momento = datetime.fromisoformat(str(valor).strip().replace(' ', 'T', 1))
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(timezone.utc).replace(tzinfo=None)
+    return momento
+
+def ler_numero(valor, padrao=0):
+    """Quantidade numérica do CSV/SQLite; vazio vira `padrao`"""
+    if valor in (None, ''):
+        return padrao
+    numero = float(valor)
+    return int(numero) if numero.is_integer() else numero
+
+def _requisicao(linha):
+    """Normaliza uma linha de requests: datas como datetime e data do evento como date"""
+    linha['start_datetime'] = ler_data_hora(linha.get('start_datetime'))
+    linha['end_datetime'] = ler_data_hora(linha.get('end_datetime'))
+    dia = linha.get('date')
+    if dia and not isinstance(dia, date):
+        linha['date'] = date.fromisoformat(str(dia)[:10])
+    elif not dia and linha['start_datetime']:
+        linha['date'] = linha['start_datetime'].date()
+    return linha
+
+def _no_periodo(linha, inicio, fim):
+    dia = linha.get('date')
+    return dia is not None and inicio <= dia < fim
+
+class FonteSQLite:
+    """Exportação em SQLite; os filtros por período vão para o próprio SQL"""
+
+    def __init__(self, caminho, tamanho_lote=TAMANHO_LOTE):
+        self.caminho = caminho
+        self.tamanho_lote = tamanho_lote
+        self._conexao = sqlite3.connect(f'file:{caminho}?mode=ro', uri=True)
+        self._conexao.row_factory = sqlite3.Row
+
+    def fechar(self):
+        self._conexao.close()
+
+    def _colunas(self, tabela):
+        """Colunas esperadas que existem de fato na tabela exportada"""
+        existentes = {linha[1] for linha in self._conexao.execute(f'PRAGMA table_info({tabela})')}
+        if not existentes:
+            raise ValueError(f'{self.caminho}: tabela {tabela} não encontrada')
+        return [coluna for coluna in COLUNAS[tabela] if coluna in existentes]
+
+    def _consultar(self, sql, parametros=()):
+        cursor = self._conexao.execute(sql, parametros)
+        try:
+            while True:
+                lote = cursor.fetchmany(self.tamanho_lote)
+                if not lote:
+                    break
+                for linha in lote:
+                    yield dict(linha)
+        finally:
+            cursor.close()
+
+    def linhas(self, tabela):
+        """Todas as linhas de uma tabela, em lotes"""
+        colunas = ', '.join(self._colunas(tabela))
+        return self._consultar(f'SELECT {colunas} FROM {tabela}')
+
+    def requisicoes(self, inicio, fim):
+        """Requisições com data do evento em [inicio, fim), ordenadas por local e horário"""
+        colunas = ', '.join(self._colunas('requests'))
+        sql = (f'SELECT {colunas} FROM requests WHERE substr(date, 1, 10) >= ? AND substr(date, 1, 10) < ? '
+               'ORDER BY location, start_datetime')
+        return map(_requisicao, self._consultar(sql, (inicio.isoformat(), fim.isoformat())))
+
+    def itens_requisitados(self, inicio, fim):
+        """Itens das requisições do período (request_items junto com a requisição)"""
+        colunas = ', '.join(f'i.{coluna}' for coluna in self._colunas('request_items'))
+        sql = (f'SELECT {colunas}, r.status AS status_requisicao FROM request_items i '
+               'JOIN requests r ON r.id = i.request_id '
+               'WHERE substr(r.date, 1, 10) >= ? AND substr(r.date, 1, 10) < ?')
+        return self._consultar(sql, (inicio.isoformat(), fim.isoformat()))
+
+    def lotes(self, tabela, nomes, inicio=None, fim=None):
+        """Lotes de tuplas só com as colunas `nomes` (None nas que faltam), para leitura em colunas
+
+        Com inicio/fim, requests é filtrada pela data do evento e request_items
+        pela data da requisição, com o status dela em 'status_requisicao'.
+        """
+        existentes = set(self._colunas(tabela))
+        parametros = () if inicio is None else (inicio.isoformat(), fim.isoformat())
+        if tabela == 'request_items' and parametros:
+            campos = ', '.join('r.status' if nome == 'status_requisicao' else
+                               f'i.{nome}' if nome in existentes else 'NULL' for nome in nomes)
+            sql = (f'SELECT {campos} FROM request_items i JOIN requests r ON r.id = i.request_id '
+                   'WHERE substr(r.date, 1, 10) >= ? AND substr(r.date, 1, 10) < ?')
+        else:
+            campos = ', '.join(nome if nome in existentes else 'NULL' for nome in nomes)
+            filtro = ' WHERE substr(date, 1, 10) >= ? AND substr(date, 1, 10) < ?' if parametros else ''
+            sql = f'SELECT {campos} FROM {tabela}{filtro}'
+        cursor = self._conexao.execute(sql, parametros)
+        cursor.row_factory = None
+        try:
+            while True:
+                lote = cursor.fetchmany(self.tamanho_lote)
+                if not lote:
+                    break
+                yield lote
+        finally:
+            cursor.close()
+
+class FonteCSV:
+    """Pasta com um CSV por tabela; os filtros são aplicados linha a linha"""
+
+    def __init__(self, pasta, tamanho_lote=TAMANHO_LOTE):
+        self.pasta = pasta
+        self.tamanho_lote = tamanho_lote
+
+    def fechar(self):
+        pass
+
+    def linhas(self, tabela):
+        """Todas as linhas de uma tabela, lidas do CSV sob demanda"""
+        caminho = os.path.join(self.pasta, f'{tabela}.csv')
+        if not os.path.exists(caminho):
+            raise ValueError(f'{caminho}: arquivo não encontrado')
+        with open(caminho, encoding='utf-8-sig', newline='', buffering=self.tamanho_lote * 256) as f:
+            for linha in csv.DictReader(f):
+                yield {chave: valor for chave, valor in linha.items() if chave in COLUNAS[tabela]}
+
+    def requisicoes(self, inicio, fim):
+        """Requisições com data do evento em [inicio, fim), ordenadas por local e horário"""
+        selecionadas = [linha for linha in map(_requisicao, self.linhas('requests'))
+                        if _no_periodo(linha, inicio, fim)]
+        selecionadas.sort(key=lambda r: (r.get('location') or '', r['start_datetime'] or datetime.min))
+        return iter(selecionadas)
+
+    def itens_requisitados(self, inicio, fim):
+        """Itens das requisições do período (request_items junto com a requisição)"""
+        status = {r['id']: r.get('status') for r in self.requisicoes(inicio, fim)}
+        for item in self.linhas('request_items'):
+            if item.get('request_id') in status:
+                item['status_requisicao'] = status[item['request_id']]
+                yield item
+
+    def lotes(self, tabela, nomes, inicio=None, fim=None):
+        """Lotes de tuplas só com as colunas `nomes` (ver FonteSQLite.lotes)"""
+        if inicio is not None and tabela == 'requests':
+            linhas = self.requisicoes(inicio, fim)
+        elif inicio is not None and tabela == 'request_items':
+            linhas = self.itens_requisitados(inicio, fim)
+        else:
+            linhas = self.linhas(tabela)
+        while True:
+            lote = [tuple(linha.get(nome) for nome in nomes) for linha in islice(linhas, self.tamanho_lote)]
+            if not lote:
+                break
+            yield lote
+
+def abrir_fonte(caminho, tamanho_lote=TAMANHO_LOTE):
+    """Abre a exportação: arquivo SQLite (.db/.sqlite/.sqlite3) ou pasta de CSVs"""
+    if os.path.isdir(caminho):
+        return FonteCSV(caminho, tamanho_lote)
+    if caminho.lower().endswith(EXTENSOES_SQLITE):
+        if not os.path.exists(caminho):
+            raise ValueError(f'{caminho}: arquivo não encontrado')
+        return FonteSQLite(caminho, tamanho_lote)
+    raise ValueError(f'{caminho}: esperado um arquivo SQLite ({", ".join(EXTENSOES_SQLITE)}) '
+                     'ou uma pasta com os CSVs exportados')
@@ -0,0 +1,203 @@
+"""
+Cache de esqueletos compilados da proposta
+
+A parte estática do documento (funcionalidades, benefícios, tecnologias,
+inclusos, cronograma...) é montada uma única vez com marcadores {{campo}} no
+lugar dos dados do cliente e guardada em disco como .docx. Cada proposta passa
+a ser apenas a troca dos marcadores no word/document.xml, sem python-docx.
+
+O cache é invalidado sozinho: a chave inclui o hash de todo o código do gerador
+(gerador/*.py, a mesma lista que o lote incremental usa), do arquivo de
+conteúdo, do template base, dos catálogos de tradução e da versão do
+python-docx. Há um esqueleto por idioma, já traduzido.
+
+Antes de ser compilado o esqueleto passa por gerador.otimizacao (estilos e
+partes sem uso saem, runs iguais se juntam), uma vez só para todas as
+propostas que saem dele.
+
+O gráfico mercado x proposta depende dos preços do cliente: no esqueleto ele
+entra com os valores padrão e a parte da imagem (word/media/...) é trocada,
+por cliente, pelo PNG do cache de gerador.graficos.
+"""
+
+import hashlib
+import io
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import docx
+
+from gerador import graficos
+from gerador import idiomas
+from gerador import otimizacao
+from gerador import proposta
+from gerador import conteudo
+
+PARTE_DOCUMENTO = 'word/document.xml'
+MARCADOR = re.compile(r'\{\{(\w+)\}\}')
+# <w:t> com marcador e sem xml:space: o atributo depende do texto do cliente
+TEXTO_COM_MARCADOR = re.compile(r'<w:t>([^<]*\{\{\w+\}\}[^<]*)</w:t>')
+ESPACO_PRESERVADO = ' xml:space="preserve"'
+MARCADORES = {campo: '{{%s}}' % campo for campo in proposta.CAMPOS_CLIENTE}
+GRAFICO = object()  # parte da imagem que muda por cliente
+
+_versao_base = None
+_versoes = {}
+_esqueletos = {}
+
+def pasta_cache():
+    """Pasta dos esqueletos (GERADOR_CACHE ou ~/.cache/sistemaderequerimento)"""
+    padrao = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                          'sistemaderequerimento')
+    return os.environ.get('GERADOR_CACHE', padrao)
+
+def fontes_gerador():
+    """Módulos do gerador (gerador/*.py), a mesma lista para o esqueleto e para o lote incremental"""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.join(pasta, nome) for nome in sorted(os.listdir(pasta)) if nome.endswith('.py')]
+
+def _hash_fontes():
+    global _versao_base
+    if _versao_base is None:
+        h = hashlib.sha256()
+        for fonte in (*fontes_gerador(), conteudo.CAMINHO_PADRAO):
+            with open(fonte, 'rb') as f:
+                h.update(f.read())
+        # Só o conteúdo das partes: o zip do template carrega a hora em que foi salvo
+        with zipfile.ZipFile(io.BytesIO(proposta.carregar_template())) as z:
+            for info in z.infolist():
+                h.update(info.filename.encode())
+                h.update(z.read(info))
+        h.update(docx.__version__.encode())
+        h.update(graficos.versao_graficos().encode() if graficos.disponivel() else b'sem graficos')
+        _versao_base = h.hexdigest()
+    return _versao_base
+
+def versao_template(idioma=idiomas.IDIOMA_PADRAO):
+    """Hash das fontes do esqueleto e do catálogo do idioma; muda sempre que o
+    gerador, o template ou as traduções desse idioma mudam"""
+    if idioma not in _versoes:
+        h = hashlib.sha256(_hash_fontes().encode())
+        h.update(idiomas.versao_catalogo(idioma).encode())
+        _versoes[idioma] = h.hexdigest()[:16]
+    return _versoes[idioma]
+
+def recarregar(idioma=None):
+    """Esquece versões e esqueletos em memória (de um idioma ou de todos)
+
+    Para processos residentes (gerador.observador): a próxima proposta volta a
+    conferir as fontes e, se mudaram, compila o esqueleto de novo.
+    """
+    global _versao_base
+    if idioma is None:
+        _versao_base = None
+        _versoes.clear()
+        _esqueletos.clear()
+        return
+    _versoes.pop(idioma, None)
+    for chave in [chave for chave in _esqueletos if chave[2] == idioma]:
+        del _esqueletos[chave]
+
+def compilar(dados_docx, grafico=None):
+    """Separa o .docx em partes fixas e no document.xml fatiado nos marcadores
+
+    Os segmentos alternam texto literal (posições pares) e nome do campo
+    (posições ímpares), prontos para um único ''.join por cliente. Um <w:t>
+    com marcadores ganha também uma posição ímpar logo depois de '<w:t': a
+    tupla com os segmentos do seu texto, que vira xml:space="preserve"
+    quando o texto do cliente começa ou termina com espaço. A parte cujo
+    conteúdo é o PNG `grafico` fica marcada como GRAFICO.
+    """
+    partes = []
+    segmentos = None
+    with zipfile.ZipFile(io.BytesIO(dados_docx)) as z:
+        for info in z.infolist():
+            dados_parte = z.read(info)
+            if info.filename == PARTE_DOCUMENTO:
+                segmentos = _fatiar(dados_parte.decode('utf-8'))
+                dados_parte = None
+            elif grafico is not None and dados_parte == grafico:
+                dados_parte = GRAFICO
+            partes.append((info, dados_parte))
+    return partes, segmentos
+
+def _fatiar(xml):
+    segmentos = []
+    inicio = 0
+    for elemento in TEXTO_COM_MARCADOR.finditer(xml):
+        abertura = elemento.start() + len('<w:t')
+        # Cada split tem tamanho ímpar: a tupla cai numa posição ímpar
+        segmentos += MARCADOR.split(xml[inicio:abertura])
+        segmentos.append(tuple(MARCADOR.split(elemento.group(1))))
+        inicio = abertura
+    return segmentos + MARCADOR.split(xml[inicio:])
+
+def _espaco(texto, textos):
+    """Atributo do <w:t> cujo texto são os segmentos `texto` preenchidos"""
+    preenchido = ''.join(textos[s] if i % 2 else s for i, s in enumerate(texto))
+    return ESPACO_PRESERVADO if preenchido != preenchido.strip() else ''
+
+def _salvar_no_cache(caminho, dados, idioma):
+    """Grava o esqueleto de forma atômica e remove esqueletos de versões antigas do idioma"""
+    pasta = os.path.dirname(caminho)
+    os.makedirs(pasta, exist_ok=True)
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(dados)
+    os.replace(temporario, caminho)
+
+    versao = versao_template(idioma)
+    for nome in os.listdir(pasta):
+        partes = nome.split('-', 3)
+        if (len(partes) == 4 and partes[0] == 'esqueleto' and partes[2] == idioma
+                and partes[1] != versao and nome.endswith('.docx')):
+            try:
+                os.remove(os.path.join(pasta, nome))
+            except OSError:
+                pass
+
+def carregar_esqueleto(modulos, idioma=idiomas.IDIOMA_PADRAO):
+    """Retorna o esqueleto compilado para a combinação de módulos bônus e o idioma"""
+    chave = (versao_template(idioma), tuple(modulos), idioma)
+    if chave in _esqueletos:
+        return _esqueletos[chave]
+
+    nome = f"esqueleto-{versao_template(idioma)}-{idioma}-{'_'.join(modulos) or 'sem_modulos'}.docx"
+    caminho = os.path.join(pasta_cache(), nome)
+    if os.path.exists(caminho):
+        with open(caminho, 'rb') as f:
+            dados = f.read()
+    else:
+        doc = proposta.montar_proposta({'modulos': list(modulos), 'idioma': idioma}, textos=MARCADORES)
+        dados = otimizacao.salvar_otimizado(doc)
+        try:
+            _salvar_no_cache(caminho, dados, idioma)
+        except OSError:
+            pass  # Sem cache em disco o esqueleto ainda vale para este processo
+
+    grafico = None
+    if graficos.disponivel():
+        padrao = {**proposta.CLIENTE_PADRAO, 'idioma': idioma}
+        grafico = graficos.renderizar_grafico(*proposta.grafico_investimento(padrao))
+    _esqueletos[chave] = compilar(dados, grafico)
+    return _esqueletos[chave]
+
+def renderizar(cliente, nivel_compressao=otimizacao.NIVEL_COMPRESSAO):
+    """Gera a proposta de um cliente a partir do esqueleto e retorna os bytes do .docx"""
+    cliente = {**proposta.CLIENTE_PADRAO, **cliente}
+    partes, segmentos = carregar_esqueleto(cliente['modulos'], cliente['idioma'])
+    textos = proposta.textos_cliente(cliente)
+
+    xml = ''.join(s if not i % 2 else escape(textos[s]) if isinstance(s, str) else _espaco(s, textos)
+                  for i, s in enumerate(segmentos))
+    buffer = io.BytesIO()
+    with otimizacao.abrir_zip(buffer, nivel_compressao) as z:
+        for info, dados_parte in partes:
+            if dados_parte is None:
+                dados_parte = xml.encode('utf-8')
+            elif dados_parte is GRAFICO:
+                dados_parte = graficos.renderizar_grafico(*proposta.grafico_investimento(cliente))
+            otimizacao.gravar_parte(z, info, dados_parte)
+    return buffer.getvalue()
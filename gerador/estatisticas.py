@@ -0,0 +1,222 @@
+"""
+Indicadores do relatório calculados em colunas (NumPy)
+
+As exportações (requests, request_items, inventory) são lidas em lotes de
+tuplas (FonteSQLite.lotes) e cada lote vira um array por coluna; só as colunas
+usadas ficam na memória. Os
+agrupamentos são feitos com np.unique/np.bincount e as junções (item ->
+requisição, item -> inventário) com np.searchsorted, sem laços em Python por
+linha, para caber em históricos com milhões de movimentações:
+
+- uso por categoria: quantidade requisitada, giro de estoque e utilização
+  (horas-item reservadas sobre horas-item disponíveis no período);
+- horários de pico: reservas iniciadas e ocupação média por hora do dia;
+- tempo de aprovação: de created_at até approved_at, por departamento.
+
+NumPy é opcional: sem ele o relatório sai sem a seção de indicadores.
+"""
+
+import importlib.util
+import warnings
+
+from gerador.conflitos import STATUS_CONFIRMADOS
+from gerador.dados import ler_data_hora, ler_numero
+
+MINUTOS_DIA = 24 * 60
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('Indicadores do relatório requerem numpy (pip install numpy)', name='numpy') from e
+    return numpy
+
+def numpy_disponivel():
+    return importlib.util.find_spec('numpy') is not None
+
+def _textos(np, valores, padrao=''):
+    return np.array([padrao if valor in (None, '') else str(valor) for valor in valores], dtype=str)
+
+def _status(np, valores):
+    return np.char.upper(_textos(np, valores, 'SEM STATUS'))
+
+def _categorias(np, valores):
+    return _textos(np, valores, 'GERAL')
+
+def _departamentos(np, valores):
+    return _textos(np, valores, 'Sem departamento')
+
+def _numeros(np, valores):
+    """Quantidades em float64; vazios viram 0"""
+    try:
+        numeros = np.array(valores, dtype=np.float64)
+    except (TypeError, ValueError):
+        numeros = np.array([ler_numero(valor) for valor in valores], dtype=np.float64)
+    return np.nan_to_num(numeros)
+
+def _datas(np, valores):
+    """Datas em datetime64[s] (UTC, sem fuso); o NumPy converte o ISO em C e os
+    textos com fuso horário passam por ler_data_hora"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            return np.array(valores, dtype='datetime64[s]')
+        except (ValueError, TypeError, Warning):
+            return np.array([ler_data_hora(valor) for valor in valores], dtype='datetime64[s]')
+
+COLUNAS_REQUISICOES = {
+    'id': _textos,
+    'department': _departamentos,
+    'start_datetime': _datas,
+    'end_datetime': _datas,
+    'created_at': _datas,
+    'approved_at': _datas,
+}
+COLUNAS_ITENS = {
+    'request_id': _textos,
+    'inventory_id': _textos,
+    'quantity_requested': _numeros,
+    'status_requisicao': _status,
+}
+COLUNAS_INVENTARIO = {
+    'id': _textos,
+    'category': _categorias,
+    'quantity_total': _numeros,
+}
+
+def colunar(fonte, tabela, colunas, inicio=None, fim=None):
+    """Arrays por coluna de uma tabela da exportação, convertidos um lote por vez
+
+    `colunas` é {nome: conversor(np, valores)}; colunas ausentes na exportação
+    chegam como None (datas viram NaT). Ver FonteSQLite.lotes para o filtro
+    por período.
+    """
+    np = _numpy()
+    nomes = list(colunas)
+    partes = {nome: [] for nome in nomes}
+    for lote in fonte.lotes(tabela, nomes, inicio, fim):
+        for nome, valores in zip(nomes, zip(*lote)):
+            partes[nome].append(colunas[nome](np, valores))
+    return {nome: np.concatenate(partes[nome]) if partes[nome] else colunas[nome](np, ())
+            for nome in nomes}
+
+def juntar(chaves, procuradas):
+    """Posição de cada valor de `procuradas` em `chaves` e a máscara dos encontrados"""
+    np = _numpy()
+    if not len(chaves):
+        return np.zeros(len(procuradas), dtype=np.intp), np.zeros(len(procuradas), dtype=bool)
+    ordem = np.argsort(chaves, kind='stable')
+    ordenadas = chaves[ordem]
+    posicoes = np.minimum(np.searchsorted(ordenadas, procuradas), len(ordenadas) - 1)
+    return ordem[posicoes], ordenadas[posicoes] == procuradas
+
+def _horas(inicio, fim):
+    """Duração em horas (0 quando falta uma das pontas ou o fim vem antes do início)"""
+    np = _numpy()
+    horas = (fim - inicio) / np.timedelta64(1, 'h')
+    return np.where(np.isnan(horas) | (horas < 0), 0.0, horas)
+
+def uso_por_categoria(requisicoes, itens, inventario, horas_periodo):
+    """Linhas (categoria, itens, total, requisitado, giro, utilização) do inventário
+
+    Giro: quantidade requisitada sobre a quantidade total da categoria.
+    Utilização: soma de quantidade × horas da reserva sobre quantidade total ×
+    horas do período. Só contam itens de requisições confirmadas.
+    """
+    np = _numpy()
+    categorias, grupo = np.unique(inventario['category'], return_inverse=True)
+    contagem = np.bincount(grupo, minlength=len(categorias))
+    total = np.bincount(grupo, weights=inventario['quantity_total'], minlength=len(categorias))
+
+    confirmados = np.isin(itens['status_requisicao'], STATUS_CONFIRMADOS)
+    no_inventario, achou_inventario = juntar(inventario['id'], itens['inventory_id'])
+    na_requisicao, achou_requisicao = juntar(requisicoes['id'], itens['request_id'])
+    validos = confirmados & achou_inventario
+    grupo_item = grupo[no_inventario[validos]]
+    quantidade = itens['quantity_requested'][validos]
+
+    horas = _horas(requisicoes['start_datetime'], requisicoes['end_datetime'])
+    com_requisicao = achou_requisicao[validos]
+    horas_item = np.zeros(len(quantidade))
+    horas_item[com_requisicao] = horas[na_requisicao[validos][com_requisicao]]
+    requisitado = np.bincount(grupo_item, weights=quantidade, minlength=len(categorias))
+    reservado = np.bincount(grupo_item, weights=quantidade * horas_item, minlength=len(categorias))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        giro = np.where(total > 0, requisitado / total, 0.0)
+        utilizacao = np.where(total > 0, reservado / (total * horas_periodo), 0.0)
+    return [(str(categoria), int(n), float(t), float(r), float(g), float(u))
+            for categoria, n, t, r, g, u in zip(categorias, contagem, total, requisitado, giro, utilizacao)]
+
+def horarios_de_pico(requisicoes, dias):
+    """Por hora do dia: reservas iniciadas e média de reservas simultâneas por dia
+
+    A ocupação é montada minuto a minuto com um vetor de diferenças (+1 no
+    início, -1 no fim) e np.cumsum; reservas que passam da meia-noite
+    continuam no começo do dia.
+    """
+    np = _numpy()
+    inicio, fim = requisicoes['start_datetime'], requisicoes['end_datetime']
+    validos = ~np.isnat(inicio) & ~np.isnat(fim) & (fim > inicio)
+    inicio, fim = inicio[validos], fim[validos]
+    minuto = ((inicio - inicio.astype('datetime64[D]')) // np.timedelta64(1, 'm')).astype(np.int64)
+    duracao = np.minimum((fim - inicio) // np.timedelta64(1, 'm'), MINUTOS_DIA).astype(np.int64)
+    termino = minuto + duracao
+
+    diferencas = np.bincount(minuto, minlength=MINUTOS_DIA + 1)
+    diferencas -= np.bincount(np.minimum(termino, MINUTOS_DIA), minlength=MINUTOS_DIA + 1)
+    virada = termino > MINUTOS_DIA
+    diferencas[0] += np.count_nonzero(virada)
+    diferencas -= np.bincount(termino[virada] - MINUTOS_DIA, minlength=MINUTOS_DIA + 1)
+    ocupacao = np.cumsum(diferencas[:MINUTOS_DIA]).reshape(24, 60).mean(axis=1) / max(dias, 1)
+
+    iniciadas = np.bincount(minuto // 60, minlength=24)
+    return [(hora, int(iniciadas[hora]), float(ocupacao[hora])) for hora in range(24)]
+
+def _percentil_ordenado(valores, inicios, contagem, fracao):
+    """Percentil por nearest-rank de cada grupo, com os valores já ordenados dentro do grupo"""
+    np = _numpy()
+    posicao = np.maximum(np.ceil(fracao * contagem).astype(np.int64) - 1, 0)
+    return valores[inicios + posicao]
+
+def latencia_aprovacao(requisicoes):
+    """Linhas (departamento, aprovadas, média, mediana, p90) em horas, e a linha total"""
+    np = _numpy()
+    criada, aprovada = requisicoes['created_at'], requisicoes['approved_at']
+    validas = ~np.isnat(criada) & ~np.isnat(aprovada) & (aprovada >= criada)
+    if not validas.any():
+        return [], None
+    horas = (aprovada[validas] - criada[validas]) / np.timedelta64(1, 'h')
+    departamentos, grupo = np.unique(requisicoes['department'][validas], return_inverse=True)
+
+    ordem = np.lexsort((horas, grupo))
+    ordenadas = horas[ordem]
+    contagem = np.bincount(grupo, minlength=len(departamentos))
+    inicios = np.concatenate(([0], np.cumsum(contagem)[:-1]))
+    media = np.bincount(grupo, weights=horas, minlength=len(departamentos)) / contagem
+    mediana = _percentil_ordenado(ordenadas, inicios, contagem, 0.5)
+    p90 = _percentil_ordenado(ordenadas, inicios, contagem, 0.9)
+
+    linhas = [(str(departamento), int(n), float(m), float(p50), float(p))
+              for departamento, n, m, p50, p in zip(departamentos, contagem, media, mediana, p90)]
+    todas, inicio, n = np.sort(horas), np.zeros(1, np.int64), np.array([len(horas)])
+    total = ('TOTAL', len(horas), float(horas.mean()),
+             float(_percentil_ordenado(todas, inicio, n, 0.5)[0]),
+             float(_percentil_ordenado(todas, inicio, n, 0.9)[0]))
+    return linhas, total
+
+def calcular_estatisticas(fonte, inicio, fim):
+    """Indicadores de [inicio, fim) a partir de uma fonte de gerador.dados"""
+    requisicoes = colunar(fonte, 'requests', COLUNAS_REQUISICOES, inicio, fim)
+    itens = colunar(fonte, 'request_items', COLUNAS_ITENS, inicio, fim)
+    inventario = colunar(fonte, 'inventory', COLUNAS_INVENTARIO)
+    dias = (fim - inicio).days
+    latencias, latencia_total = latencia_aprovacao(requisicoes)
+    return {
+        'requisicoes': len(requisicoes['id']),
+        'movimentacoes': len(itens['request_id']),
+        'categorias': uso_por_categoria(requisicoes, itens, inventario, 24 * dias),
+        'horarios': horarios_de_pico(requisicoes, dias),
+        'latencias': latencias,
+        'latencia_total': latencia_total,
+    }
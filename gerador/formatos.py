@@ -0,0 +1,313 @@
+"""
+Renderizadores da proposta em outros formatos (HTML, Markdown e PDF)
+
+Todos partem do mesmo conteúdo resolvido por preparar_proposta, então o .docx,
+o .html e o .md saem sempre com o mesmo texto. gerar_formatos roda os
+renderizadores em paralelo (uma thread ou um processo por formato) e mede o
+tempo de cada um.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import escape
+
+from gerador import esqueleto, proposta
+from gerador.idiomas import FORMATOS as FORMATOS_IDIOMA
+
+FORMATOS = ('docx', 'html', 'md')
+
+# ==================== MARKDOWN ====================
+
+def _md(texto):
+    """Escapa o que o Markdown interpretaria dentro de células e listas"""
+    return texto.replace('|', '\\|')
+
+def _tabela_md(cabecalho, linhas, negrito_ultima=False):
+    saida = [f"| {' | '.join(map(_md, cabecalho))} |", f"|{'---|' * len(cabecalho)}"]
+    for i, linha in enumerate(linhas):
+        celulas = [_md(celula) for celula in linha]
+        if negrito_ultima and i == len(linhas) - 1:
+            celulas = [f'**{celula}**' if celula else '' for celula in celulas]
+        saida.append(f"| {' | '.join(celulas)} |")
+    return saida
+
+def renderizar_markdown(cliente=None):
+    """Proposta em Markdown"""
+    dados = proposta.preparar_proposta(cliente)
+    conteudo, campos, texto = dados['conteudo'], dados['campos'], dados['texto']
+    investimento = conteudo.investimento
+    linhas = []
+
+    def secao(chave):
+        linhas.extend(['', '---', '', f"## {conteudo.secoes[chave].icone} {texto(conteudo.secoes[chave].titulo)}", ''])
+
+    linhas.extend([
+        f"# 📄 {texto(conteudo.cabecalho['titulo'])}", '',
+        f"## {texto(conteudo.cabecalho['subtitulo'])}",
+        f"### {campos['nome']}", '',
+        f"**{texto(conteudo.cabecalho['data'])}**",
+    ])
+
+    secao('apresentacao')
+    linhas.extend([texto(conteudo.apresentacao['texto']), '', f"**{texto(conteudo.apresentacao['destaques'])}**"])
+
+    secao('funcionalidades')
+    for topico in conteudo.funcionalidades:
+        linhas.extend([f'### {topico.titulo}', *[f'- ✅ {_md(item)}' for item in topico.itens], ''])
+
+    secao('beneficios')
+    linhas.extend(f'- ✅ {_md(texto(beneficio))}' for beneficio in conteudo.beneficios)
+
+    secao('tecnologias')
+    linhas.extend(f'- **{tec.area}:** {_md(tec.descricao)}' for tec in conteudo.tecnologias)
+
+    secao('mercado')
+    linhas.extend(_tabela_md(conteudo.cabecalho_mercado, dados['mercado'], negrito_ultima=True))
+
+    if dados['modulos']:
+        secao('bonus')
+        linhas.extend([f"**{texto(conteudo.bonus['chamada'])}**", ''])
+        for modulo in dados['modulos']:
+            valor = proposta.formatar_moeda(modulo.valor_mercado, dados['idioma'])
+            linhas.extend([f'### {modulo.titulo}', *[f'- {_md(item)}' for item in modulo.itens], '',
+                           f"*{texto(conteudo.bonus['rotulo_valor'], valor=valor)}*", ''])
+
+    secao('nota_pessoal')
+    for paragrafo in conteudo.nota_pessoal:
+        linhas.extend([f'> {texto(paragrafo)}', '>'])
+    linhas.pop()
+
+    secao('investimento')
+    linhas.extend([
+        f"### {texto(investimento['titulo'])}", '',
+        f"# {campos['valor_sistema']}", '',
+        texto(investimento['pagamento_unico']), '',
+        f"*{dados['inclui']}*", '',
+        f"**{texto(investimento['manutencao'])}**  ",
+        texto(investimento['periodo']), '',
+        f"### {texto(investimento['total_titulo'])}", '',
+        f"# {campos['total_investimento']}", '',
+        texto(investimento['total_composicao']), '',
+        f"**{texto(investimento['economia'])}**",
+    ])
+
+    secao('inclusos')
+    linhas.extend(f'- ✅ {_md(item)}' for item in dados['inclusos'])
+
+    secao('cronograma')
+    linhas.extend(_tabela_md(conteudo.cabecalho_cronograma, dados['cronograma']))
+
+    secao('pagamento')
+    linhas.extend(f'- {texto(linha)}' for linha in conteudo.pagamento)
+
+    secao('agradecimento')
+    for paragrafo in conteudo.agradecimento:
+        linhas.extend([texto(paragrafo), ''])
+    linhas.pop()
+
+    secao('contato')
+    linhas.extend(f'{texto(linha)}  ' for linha in conteudo.contato)
+
+    linhas.extend(['', '---', '', f'*{texto(conteudo.rodape)}*', ''])
+    return '\n'.join(linhas)
+
+# ==================== HTML ====================
+
+CSS = '''
+body { font-family: 'Open Sans', Arial, sans-serif; line-height: 1.6; color: #333; background: #f8f9fa; margin: 0; }
+.container { max-width: 210mm; margin: 0 auto; background: #fff; box-shadow: 0 0 30px rgba(0,0,0,.1); }
+.header { background: linear-gradient(135deg, #174ea6 0%, #123a7b 100%); color: #fff; padding: 60px 50px; text-align: center; }
+.header h1 { font-size: 36px; font-weight: 800; margin: 0 0 10px; }
+.header .subtitle { font-size: 20px; font-weight: 300; }
+.header .client { font-size: 24px; font-weight: 600; margin-top: 20px; color: #ffd600; }
+.content { padding: 50px; }
+.section-title { color: #174ea6; font-size: 22px; border-bottom: 3px solid #ffd600; padding-bottom: 8px; margin-top: 40px; }
+.highlight { text-align: center; font-weight: 700; color: #174ea6; }
+ul.check { list-style: none; padding-left: 0; }
+ul.check li::before { content: '✅ '; }
+table { width: 100%; border-collapse: collapse; margin: 16px 0; }
+th { background: #174ea6; color: #fff; padding: 10px; text-align: left; }
+td { padding: 8px 10px; border-bottom: 1px solid #e0e0e0; }
+tr.total td { background: #ffd600; font-weight: 700; }
+.box { border-radius: 8px; padding: 24px; margin: 20px 0; }
+.note { background: #fff3cd; font-style: italic; }
+.price { background: #ffd600; text-align: center; }
+.price .big, .total .big { font-size: 40px; font-weight: 800; color: #174ea6; }
+.total { background: #e7f3ff; text-align: center; }
+.thanks { background: #174ea6; color: #fff; text-align: center; }
+.module-value { color: #2e7d32; font-weight: 600; }
+.footer { text-align: center; color: #808080; font-size: 12px; border-top: 1px solid #e0e0e0; padding: 20px; }
+'''
+
+def _tabela_html(cabecalho, linhas, destaque_ultima=False):
+    saida = ['<table>', '<tr>', *[f'<th>{escape(titulo)}</th>' for titulo in cabecalho], '</tr>']
+    for i, linha in enumerate(linhas):
+        classe = ' class="total"' if destaque_ultima and i == len(linhas) - 1 else ''
+        saida.append(f"<tr{classe}>{''.join(f'<td>{escape(celula)}</td>' for celula in linha)}</tr>")
+    saida.append('</table>')
+    return saida
+
+def renderizar_html(cliente=None):
+    """Proposta em HTML autocontido (CSS embutido)"""
+    dados = proposta.preparar_proposta(cliente)
+    conteudo, campos, texto = dados['conteudo'], dados['campos'], dados['texto']
+    investimento = conteudo.investimento
+    e = escape
+    partes = []
+
+    def secao(chave):
+        partes.append(f'<h2 class="section-title">{e(conteudo.secoes[chave].icone)} '
+                      f'{e(texto(conteudo.secoes[chave].titulo))}</h2>')
+
+    def lista(itens, classe='check'):
+        partes.append(f'<ul class="{classe}">' + ''.join(f'<li>{e(item)}</li>' for item in itens) + '</ul>')
+
+    def paragrafos(textos):
+        partes.extend(f'<p>{e(texto(paragrafo))}</p>' for paragrafo in textos)
+
+    partes.append(f'''<div class="header">
+<h1>{e(texto(conteudo.cabecalho['titulo']))}</h1>
+<div class="subtitle">{e(texto(conteudo.cabecalho['subtitulo']))}</div>
+<div class="client">{e(campos['nome'])}</div>
+<div class="date">{e(texto(conteudo.cabecalho['data']))}</div>
+</div>
+<div class="content">''')
+
+    secao('apresentacao')
+    partes.append(f"<p>{e(texto(conteudo.apresentacao['texto']))}</p>")
+    partes.append(f"<p class=\"highlight\">{e(texto(conteudo.apresentacao['destaques']))}</p>")
+
+    secao('funcionalidades')
+    for topico in conteudo.funcionalidades:
+        partes.append(f'<h3>{e(topico.titulo)}</h3>')
+        lista(topico.itens)
+
+    secao('beneficios')
+    lista(texto(beneficio) for beneficio in conteudo.beneficios)
+
+    secao('tecnologias')
+    partes.append('<ul>' + ''.join(f'<li><strong>{e(tec.area)}:</strong> {e(tec.descricao)}</li>'
+                                   for tec in conteudo.tecnologias) + '</ul>')
+
+    secao('mercado')
+    partes.extend(_tabela_html(conteudo.cabecalho_mercado, dados['mercado'], destaque_ultima=True))
+
+    if dados['modulos']:
+        secao('bonus')
+        partes.append(f"<p><strong>{e(texto(conteudo.bonus['chamada']))}</strong></p>")
+        for modulo in dados['modulos']:
+            partes.append(f'<h3>{e(modulo.titulo)}</h3>')
+            lista(modulo.itens, 'bullets')
+            valor = texto(conteudo.bonus['rotulo_valor'],
+                          valor=proposta.formatar_moeda(modulo.valor_mercado, dados['idioma']))
+            partes.append(f'<p class="module-value">{e(valor)}</p>')
+
+    secao('nota_pessoal')
+    partes.append('<div class="box note">')
+    paragrafos(conteudo.nota_pessoal)
+    partes.append('</div>')
+
+    secao('investimento')
+    partes.append(f'''<div class="box price">
+<div><strong>{e(texto(investimento['titulo']))}</strong></div>
+<div class="big">{e(campos['valor_sistema'])}</div>
+<div>{e(texto(investimento['pagamento_unico']))}</div>
+<div><small>{e(dados['inclui'])}</small></div>
+<hr>
+<div><strong>{e(texto(investimento['manutencao']))}</strong></div>
+<div>{e(texto(investimento['periodo']))}</div>
+</div>
+<div class="box total">
+<div><strong>{e(texto(investimento['total_titulo']))}</strong></div>
+<div class="big">{e(campos['total_investimento'])}</div>
+<div>{e(texto(investimento['total_composicao']))}</div>
+<div class="module-value">{e(texto(investimento['economia']))}</div>
+</div>''')
+
+    secao('inclusos')
+    lista(dados['inclusos'])
+
+    secao('cronograma')
+    partes.extend(_tabela_html(conteudo.cabecalho_cronograma, dados['cronograma']))
+
+    secao('pagamento')
+    lista((texto(linha) for linha in conteudo.pagamento), 'bullets')
+
+    secao('agradecimento')
+    partes.append('<div class="box thanks">')
+    paragrafos(conteudo.agradecimento)
+    partes.append('</div>')
+
+    secao('contato')
+    partes.append('<p>' + '<br>'.join(e(texto(linha)) for linha in conteudo.contato) + '</p>')
+    partes.append(f'</div>\n<div class="footer">{e(texto(conteudo.rodape))}</div>')
+
+    titulo = f"{texto(conteudo.cabecalho['titulo']).title()} - {campos['sigla']}"
+    lingua = FORMATOS_IDIOMA[dados['idioma']]['html']
+    return (f'<!DOCTYPE html>\n<html lang="{lingua}">\n<head>\n<meta charset="UTF-8">\n'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+            f'<title>{e(titulo)}</title>\n<style>{CSS}</style>\n</head>\n<body>\n'
+            f'<div class="container">\n' + '\n'.join(partes) + '\n</div>\n</body>\n</html>\n')
+
+# ==================== EXECUÇÃO EM PARALELO ====================
+
+def renderizar_docx(cliente=None):
+    """Proposta em .docx (pelo esqueleto compilado, como no modo lote)"""
+    return esqueleto.renderizar(cliente or {})
+
+def renderizar_pdf(cliente=None):
+    """Proposta em PDF (reportlab, ver gerador.pdf)"""
+    from gerador.pdf import renderizar_pdf
+    return renderizar_pdf(cliente)
+
+RENDERIZADORES = {
+    'docx': renderizar_docx,
+    'html': renderizar_html,
+    'md': renderizar_markdown,
+    'pdf': renderizar_pdf,
+}
+
+def renderizar_formato(tarefa):
+    """Renderiza e grava um formato; roda numa thread ou num processo do pool"""
+    formato, cliente, caminho = tarefa
+    inicio = time.perf_counter()
+    resultado = RENDERIZADORES[formato](cliente)
+    dados = resultado.encode('utf-8') if isinstance(resultado, str) else resultado
+    with open(caminho, 'wb') as f:
+        f.write(dados)
+    return {'formato': formato, 'arquivo': caminho, 'segundos': time.perf_counter() - inicio,
+            'bytes': len(dados)}
+
+def gerar_formatos(cliente, pasta_saida, formatos=FORMATOS, paralelo='threads', verboso=True):
+    """Gera a proposta de um cliente em vários formatos de uma vez
+
+    `paralelo` pode ser 'threads' (padrão), 'processos' ou None (em sequência).
+    Retorna os resultados na ordem de `formatos` e o tempo total.
+    """
+    from gerador.manifesto import nome_arquivo
+
+    cliente = {**proposta.CLIENTE_PADRAO, **(cliente or {})}
+    desconhecidos = [formato for formato in formatos if formato not in RENDERIZADORES]
+    if desconhecidos:
+        raise ValueError(f"Formatos desconhecidos: {', '.join(desconhecidos)} "
+                         f"(disponíveis: {', '.join(RENDERIZADORES)})")
+    os.makedirs(pasta_saida, exist_ok=True)
+    base = os.path.splitext(nome_arquivo(cliente))[0]
+    tarefas = [(formato, cliente, os.path.join(pasta_saida, f'{base}.{formato}')) for formato in formatos]
+
+    inicio = time.perf_counter()
+    if paralelo and len(tarefas) > 1:
+        executor = ProcessPoolExecutor if paralelo == 'processos' else ThreadPoolExecutor
+        with executor(max_workers=len(tarefas)) as pool:
+            resultados = list(pool.map(renderizar_formato, tarefas))
+    else:
+        resultados = [renderizar_formato(tarefa) for tarefa in tarefas]
+    total = time.perf_counter() - inicio
+
+    if verboso:
+        for r in resultados:
+            print(f"📄 {r['arquivo']} — {r['segundos'] * 1000:.1f} ms ({r['bytes'] / 1024:.0f} KB)")
+        print(f"✅ {len(resultados)} formato(s) gerado(s) em {total * 1000:.1f} ms "
+              f"({paralelo or 'em sequência'})")
+    return resultados, total
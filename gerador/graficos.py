@@ -0,0 +1,181 @@
+"""
+Gráficos (barras e linhas) renderizados com matplotlib e guardados por conteúdo
+
+Cada gráfico é descrito por um tipo ('barras' ou 'linha'), os dados e o estilo.
+O PNG fica num cache endereçado pelo hash dessa descrição (mais o código deste
+módulo e a versão do matplotlib): na memória do processo e em disco, em
+<pasta do cache>/graficos/grafico-<versão>-<hash>.png. Clientes com os mesmos
+valores, ou execuções seguidas, reaproveitam a mesma imagem sem renderizar de
+novo. Como os esqueletos, o cache em disco se limpa sozinho: na primeira
+gravação de cada processo (e de tempos em tempos depois dela) saem os PNGs de
+outras versões e, acima de MAXIMO_DISCO arquivos, os usados há mais tempo.
+
+A renderização usa o backend Agg direto (Figure + FigureCanvasAgg), sem
+pyplot e sem tela. O matplotlib é opcional: sem ele os documentos saem sem
+gráficos.
+"""
+
+import hashlib
+import importlib.util
+import io
+import json
+import os
+from collections import OrderedDict
+
+TIPOS = ('barras', 'linha')
+MAXIMO_MEMORIA = 256
+MAXIMO_DISCO = 2000
+
+ESTILO_PADRAO = {
+    'largura': 6.4,     # polegadas
+    'altura': 2.8,
+    'dpi': 150,
+    'fonte': 8,
+    'cor': '#174ea6',
+    'destaque': '#FFD600',
+    'cores_series': ('#174ea6', '#FFD600', '#2e7d32', '#c62828'),
+}
+
+_memoria = OrderedDict()
+_versao = None
+_gravados = 0  # PNGs gravados em disco por este processo
+estatisticas = {'renderizados': 0, 'memoria': 0, 'disco': 0}
+
+def _matplotlib():
+    try:
+        import matplotlib
+    except ImportError as e:
+        raise ImportError('Gráficos requerem matplotlib (pip install matplotlib)', name='matplotlib') from e
+    return matplotlib
+
+def disponivel():
+    return importlib.util.find_spec('matplotlib') is not None
+
+def versao_graficos():
+    """Hash deste módulo e da versão do matplotlib: muda o desenho, muda a chave"""
+    global _versao
+    if _versao is None:
+        h = hashlib.sha256()
+        with open(__file__, 'rb') as f:
+            h.update(f.read())
+        h.update(_matplotlib().__version__.encode())
+        _versao = h.hexdigest()[:16]
+    return _versao
+
+def chave_grafico(tipo, dados, estilo=None):
+    """Hash (sha256) dos dados, do estilo e da versão dos gráficos"""
+    descricao = {'tipo': tipo, 'dados': dados, 'estilo': {**ESTILO_PADRAO, **(estilo or {})},
+                 'versao': versao_graficos()}
+    return hashlib.sha256(json.dumps(descricao, sort_keys=True, ensure_ascii=False,
+                                     default=list).encode('utf-8')).hexdigest()
+
+def _desenhar(tipo, dados, estilo):
+    """PNG do gráfico; sem data nem versão nos metadados, para sair sempre igual"""
+    _matplotlib()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figura = Figure(figsize=(estilo['largura'], estilo['altura']), dpi=estilo['dpi'])
+    FigureCanvasAgg(figura)
+    eixo = figura.add_subplot()
+    if tipo == 'barras':
+        destaques = set(dados.get('destaques', ()))
+        cores = [estilo['destaque'] if i in destaques else estilo['cor'] for i in range(len(dados['valores']))]
+        barras = eixo.barh(dados['rotulos'], dados['valores'], color=cores)
+        eixo.invert_yaxis()
+        if dados.get('textos'):
+            eixo.bar_label(barras, labels=dados['textos'], padding=3, fontsize=estilo['fonte'])
+        eixo.set_xticks([])
+        eixo.margins(x=0.2)
+    elif tipo == 'linha':
+        for (nome, valores), cor in zip(dados['series'], estilo['cores_series']):
+            eixo.plot(dados['rotulos'], valores, label=nome, color=cor, marker='o', markersize=3)
+        if len(dados['series']) > 1:
+            eixo.legend(fontsize=estilo['fonte'], frameon=False)
+        passo = max(1, len(dados['rotulos']) // 10)
+        eixo.set_xticks(range(0, len(dados['rotulos']), passo),
+                        [dados['rotulos'][i] for i in range(0, len(dados['rotulos']), passo)])
+        eixo.grid(axis='y', alpha=0.3)
+    else:
+        raise ValueError(f"Tipo de gráfico desconhecido: {tipo} (disponíveis: {', '.join(TIPOS)})")
+
+    if dados.get('titulo'):
+        eixo.set_title(dados['titulo'], fontsize=estilo['fonte'] + 2, loc='left')
+    eixo.tick_params(labelsize=estilo['fonte'])
+    for lado in ('top', 'right'):
+        eixo.spines[lado].set_visible(False)
+    figura.tight_layout()
+
+    buffer = io.BytesIO()
+    figura.savefig(buffer, format='png', metadata={'Software': None})
+    return buffer.getvalue()
+
+def pasta_graficos():
+    from gerador.esqueleto import pasta_cache
+    return os.path.join(pasta_cache(), 'graficos')
+
+def _podar_disco(pasta):
+    """Remove PNGs de outras versões e, acima de MAXIMO_DISCO, os menos usados (mtime)"""
+    prefixo = f'grafico-{versao_graficos()}-'
+    atuais = []
+    for nome in os.listdir(pasta):
+        caminho = os.path.join(pasta, nome)
+        try:
+            if nome.startswith(prefixo) and nome.endswith('.png'):
+                atuais.append((os.path.getmtime(caminho), caminho))
+            elif nome.endswith('.png'):
+                os.remove(caminho)
+        except OSError:
+            pass
+    atuais.sort()
+    for _, caminho in atuais[:max(0, len(atuais) - MAXIMO_DISCO)]:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+def _guardar(chave, png):
+    _memoria[chave] = png
+    _memoria.move_to_end(chave)
+    while len(_memoria) > MAXIMO_MEMORIA:
+        _memoria.popitem(last=False)
+
+def renderizar_grafico(tipo, dados, estilo=None):
+    """PNG do gráfico, renderizado só na primeira vez que a mesma descrição aparece"""
+    global _gravados
+    chave = chave_grafico(tipo, dados, estilo)
+    if chave in _memoria:
+        estatisticas['memoria'] += 1
+        _memoria.move_to_end(chave)
+        return _memoria[chave]
+
+    caminho = os.path.join(pasta_graficos(), f'grafico-{versao_graficos()}-{chave}.png')
+    try:
+        with open(caminho, 'rb') as f:
+            png = f.read()
+        estatisticas['disco'] += 1
+        try:
+            os.utime(caminho)  # Usado agora: é dos últimos a sair na poda
+        except OSError:
+            pass
+    except OSError:
+        png = _desenhar(tipo, dados, {**ESTILO_PADRAO, **(estilo or {})})
+        estatisticas['renderizados'] += 1
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            temporario = f'{caminho}.{os.getpid()}.tmp'
+            with open(temporario, 'wb') as f:
+                f.write(png)
+            os.replace(temporario, caminho)
+            # Poda na primeira gravação e a cada quarto do limite, para processos longos (serviço, --watch)
+            if _gravados % (MAXIMO_DISCO // 4) == 0:
+                _podar_disco(os.path.dirname(caminho))
+            _gravados += 1
+        except OSError:
+            pass  # Sem cache em disco o gráfico ainda vale para este processo
+    _guardar(chave, png)
+    return png
+
+def tamanho_png(png):
+    """(largura, altura) em pixels, lidos do cabeçalho IHDR"""
+    return int.from_bytes(png[16:20], 'big'), int.from_bytes(png[20:24], 'big')
@@ -0,0 +1,266 @@
+"""
+Idiomas da proposta: catálogos gettext e formatação de números e datas
+
+O texto-fonte é o português de conteudo_proposta.json, mais os poucos rótulos
+do código listados em MENSAGENS_CODIGO. As traduções ficam em
+gerador/locale/<idioma>/LC_MESSAGES/gerador.po e são compiladas para .mo, que
+é o que o gerador lê: cada catálogo é aberto uma vez por processo. O conteúdo
+já traduzido também é memorizado por idioma (conteudo.carregar_conteudo) e o
+esqueleto compilado é um por idioma, então num lote com vários idiomas cada
+texto fixo é traduzido uma única vez.
+
+Depois de editar o conteúdo ou um .po:
+
+    python -m gerador.idiomas     (acrescenta as mensagens novas aos .po e recompila os .mo)
+"""
+
+import argparse
+import ast
+import gettext
+import hashlib
+import json
+import os
+import struct
+import sys
+from functools import lru_cache
+
+IDIOMA_PADRAO = 'pt_BR'
+DOMINIO = 'gerador'
+PASTA_LOCALE = os.path.join(os.path.dirname(__file__), 'locale')
+
+# Convenções de cada idioma; os valores continuam em reais em todos eles
+FORMATOS = {
+    'pt_BR': {
+        'milhar': '.', 'decimal': ',', 'moeda': 'R$ {}', 'percentual': '{}%', 'html': 'pt-BR',
+        'data': '{dia:02d} de {mes} de {ano}', 'mes_ano': '{mes} {ano}', 'dia_mes': '{dia:02d}/{mes:02d}',
+        'meses': ('Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+                  'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'),
+    },
+    'es': {
+        'milhar': '.', 'decimal': ',', 'moeda': 'R$ {}', 'percentual': '{} %', 'html': 'es',
+        'data': '{dia} de {mes} de {ano}', 'mes_ano': '{mes} de {ano}', 'dia_mes': '{dia:02d}/{mes:02d}',
+        'meses': ('enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+                  'julio', 'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre'),
+    },
+    'en': {
+        'milhar': ',', 'decimal': '.', 'moeda': 'R${}', 'percentual': '{}%', 'html': 'en',
+        'data': '{mes} {dia}, {ano}', 'mes_ano': '{mes} {ano}', 'dia_mes': '{mes:02d}/{dia:02d}',
+        'meses': ('January', 'February', 'March', 'April', 'May', 'June',
+                  'July', 'August', 'September', 'October', 'November', 'December'),
+    },
+}
+IDIOMAS = tuple(FORMATOS)
+
+# Campos do conteúdo que não são texto para o leitor
+CHAVES_FIXAS = ('versao', 'icone', 'chave')
+
+# Rótulos que saem do código (preços e gráfico), e não do arquivo de conteúdo
+MENSAGENS_CODIGO = (
+    '/ano',
+    'Mercado x proposta',
+    'Soluções de mercado',
+    'Esta proposta (sistema + {meses} meses)',
+)
+
+_versoes = {}
+
+def validar_idioma(idioma):
+    """Confere o código do idioma (pt_BR, es, en) e o devolve"""
+    if idioma not in FORMATOS:
+        raise ValueError(f"Idioma desconhecido: {idioma} (disponíveis: {', '.join(IDIOMAS)})")
+    return idioma
+
+def caminho_catalogo(idioma, extensao='mo'):
+    return os.path.join(PASTA_LOCALE, idioma, 'LC_MESSAGES', f'{DOMINIO}.{extensao}')
+
+@lru_cache(maxsize=None)
+def catalogo(idioma):
+    """Catálogo compilado (.mo) do idioma, aberto uma vez por processo"""
+    if validar_idioma(idioma) == IDIOMA_PADRAO:
+        return gettext.NullTranslations()
+    try:
+        with open(caminho_catalogo(idioma), 'rb') as f:
+            return gettext.GNUTranslations(f)
+    except FileNotFoundError as e:
+        raise ValueError(f'{caminho_catalogo(idioma)}: catálogo não compilado '
+                         '(rode python -m gerador.idiomas)') from e
+
+def traduzir(texto, idioma=IDIOMA_PADRAO):
+    return texto if idioma == IDIOMA_PADRAO else catalogo(idioma).gettext(texto)
+
+def traduzir_dados(dados, idioma):
+    """Cópia do JSON de conteúdo com todos os textos traduzidos (exceto CHAVES_FIXAS)"""
+    if isinstance(dados, str):
+        return traduzir(dados, idioma)
+    if isinstance(dados, list):
+        return [traduzir_dados(item, idioma) for item in dados]
+    if isinstance(dados, dict):
+        return {chave: valor if chave in CHAVES_FIXAS else traduzir_dados(valor, idioma)
+                for chave, valor in dados.items()}
+    return dados
+
+def versao_catalogo(idioma):
+    """Hash do .mo do idioma: traduções novas invalidam só os esqueletos desse idioma"""
+    if idioma not in _versoes:
+        h = hashlib.sha256(idioma.encode())
+        if idioma != IDIOMA_PADRAO and os.path.exists(caminho_catalogo(idioma)):
+            with open(caminho_catalogo(idioma), 'rb') as f:
+                h.update(f.read())
+        _versoes[idioma] = h.hexdigest()[:16]
+    return _versoes[idioma]
+
+def recarregar(idioma=None):
+    """Esquece o catálogo aberto (de um idioma ou de todos), para ler o .mo de novo"""
+    catalogo.cache_clear()
+    if idioma is None:
+        _versoes.clear()
+    else:
+        _versoes.pop(idioma, None)
+
+# ==================== NÚMEROS E DATAS ====================
+
+def formatar_numero(valor, idioma=IDIOMA_PADRAO, casas=0):
+    """Número com os separadores do idioma (3.000 / 3,000)"""
+    formato = FORMATOS[idioma]
+    texto = f'{valor:,.{casas}f}'
+    return texto.replace(',', '_').replace('.', formato['decimal']).replace('_', formato['milhar'])
+
+def formatar_moeda(valor, idioma=IDIOMA_PADRAO):
+    """Valor em reais no padrão do idioma (ex.: R$ 3.000, R$3,000); centavos só quando há (R$ 2.999,90)"""
+    valor = round(valor, 2)
+    return FORMATOS[idioma]['moeda'].format(formatar_numero(valor, idioma, 0 if float(valor).is_integer() else 2))
+
+def formatar_percentual(fracao, idioma=IDIOMA_PADRAO, casas=0):
+    """Fração como percentual (ex.: 0.87 -> 87%; com casas=1, 0.875 -> 87,5%)"""
+    return FORMATOS[idioma]['percentual'].format(formatar_numero(100 * fracao, idioma, casas))
+
+def formatar_data(data, idioma=IDIOMA_PADRAO):
+    """Data por extenso (03 de Outubro de 2025 / 3 de octubre de 2025 / October 3, 2025)"""
+    formato = FORMATOS[idioma]
+    return formato['data'].format(dia=data.day, mes=formato['meses'][data.month - 1], ano=data.year)
+
+def formatar_mes_ano(data, idioma=IDIOMA_PADRAO):
+    formato = FORMATOS[idioma]
+    return formato['mes_ano'].format(mes=formato['meses'][data.month - 1], ano=data.year)
+
+def formatar_dia_mes(data, idioma=IDIOMA_PADRAO):
+    """Dia e mês abreviados (03/10 / 10/03)"""
+    return FORMATOS[idioma]['dia_mes'].format(dia=data.day, mes=data.month)
+
+# ==================== CATÁLOGOS ====================
+
+def mensagens():
+    """Textos a traduzir: os do conteúdo (em ordem de aparição) e MENSAGENS_CODIGO"""
+    from gerador.conteudo import CAMINHO_PADRAO
+    with open(CAMINHO_PADRAO, encoding='utf-8') as f:
+        dados = json.load(f)
+    vistas = {}
+
+    def coletar(valor):
+        if isinstance(valor, str):
+            vistas.setdefault(valor, None)
+        elif isinstance(valor, list):
+            for item in valor:
+                coletar(item)
+        elif isinstance(valor, dict):
+            for chave, item in valor.items():
+                if chave not in CHAVES_FIXAS:
+                    coletar(item)
+
+    coletar(dados)
+    for mensagem in MENSAGENS_CODIGO:
+        vistas.setdefault(mensagem, None)
+    return list(vistas)
+
+def _po_texto(texto):
+    return '"' + texto.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+
+def ler_po(caminho):
+    """Traduções {msgid: msgstr} de um .po (sem plurais nem contexto)"""
+    traducoes = {}
+    atual = None
+    campos = {}
+
+    def fechar():
+        if 'msgid' in campos:
+            traducoes[campos['msgid']] = campos.get('msgstr', '')
+        campos.clear()
+
+    with open(caminho, encoding='utf-8') as f:
+        for linha in f:
+            linha = linha.strip()
+            if not linha or linha.startswith('#'):
+                continue
+            if linha.startswith('msgid '):
+                fechar()
+                atual, linha = 'msgid', linha[6:]
+            elif linha.startswith('msgstr '):
+                atual, linha = 'msgstr', linha[7:]
+            campos[atual] = campos.get(atual, '') + ast.literal_eval(linha)
+    fechar()
+    return traducoes
+
+def escrever_po(caminho, idioma, traducoes):
+    """Grava o .po com todas as mensagens atuais; as que faltam ficam com msgstr vazio"""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    linhas = ['msgid ""', 'msgstr ""',
+              _po_texto(f'Language: {idioma}\n'),
+              _po_texto('Content-Type: text/plain; charset=UTF-8\n'), '']
+    for mensagem in mensagens():
+        linhas.extend([f'msgid {_po_texto(mensagem)}', f'msgstr {_po_texto(traducoes.get(mensagem, ""))}', ''])
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(linhas))
+
+def compilar_mo(traducoes, caminho):
+    """Grava o .mo (formato GNU) com as traduções preenchidas"""
+    entradas = {'': 'Content-Type: text/plain; charset=UTF-8\n'}
+    entradas.update((original, traduzido) for original, traduzido in traducoes.items() if original and traduzido)
+    chaves = sorted(entradas, key=lambda texto: texto.encode('utf-8'))
+    ids = strs = b''
+    posicoes = []
+    for chave in chaves:
+        original, traduzido = chave.encode('utf-8'), entradas[chave].encode('utf-8')
+        posicoes.append((len(ids), len(original), len(strs), len(traduzido)))
+        ids += original + b'\0'
+        strs += traduzido + b'\0'
+
+    inicio_ids = 7 * 4 + 16 * len(chaves)
+    inicio_strs = inicio_ids + len(ids)
+    tabela_ids = []
+    tabela_strs = []
+    for pos_id, tam_id, pos_str, tam_str in posicoes:
+        tabela_ids += [tam_id, inicio_ids + pos_id]
+        tabela_strs += [tam_str, inicio_strs + pos_str]
+    cabecalho = struct.pack('<7I', 0x950412de, 0, len(chaves), 7 * 4, 7 * 4 + 8 * len(chaves), 0, 0)
+    with open(caminho, 'wb') as f:
+        f.write(cabecalho + struct.pack(f'<{len(tabela_ids)}I', *tabela_ids)
+                + struct.pack(f'<{len(tabela_strs)}I', *tabela_strs) + ids + strs)
+
+def atualizar_catalogos(idiomas=None, arquivo=sys.stdout):
+    """Sincroniza os .po com as mensagens atuais e recompila os .mo; retorna as pendências"""
+    pendentes = {}
+    for idioma in idiomas or IDIOMAS:
+        if idioma == IDIOMA_PADRAO:
+            continue
+        po = caminho_catalogo(idioma, 'po')
+        traducoes = ler_po(po) if os.path.exists(po) else {}
+        escrever_po(po, idioma, traducoes)
+        compilar_mo(traducoes, caminho_catalogo(idioma))
+        faltando = [mensagem for mensagem in mensagens() if not traducoes.get(mensagem)]
+        pendentes[idioma] = faltando
+        print(f'🌐 {idioma}: {len(mensagens()) - len(faltando)}/{len(mensagens())} mensagens traduzidas '
+              f'-> {caminho_catalogo(idioma)}', file=arquivo)
+    return pendentes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m gerador.idiomas',
+                                     description='Atualiza e compila os catálogos de tradução da proposta')
+    parser.add_argument('idiomas', nargs='*', metavar='IDIOMA', help=f"padrão: {', '.join(IDIOMAS[1:])}")
+    args = parser.parse_args(argv)
+    for idioma in args.idiomas:
+        validar_idioma(idioma)
+    pendentes = atualizar_catalogos(args.idiomas)
+    return 1 if any(pendentes.values()) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Regeneração incremental do modo lote
+
+Ao lado dos documentos gerados fica um manifesto (.manifesto_geracao.json) com,
+para cada arquivo, o hash dos dados do cliente, a versão do template e a versão
+do gerador. Numa nova rodada só são renderizados os documentos cujas entradas
+mudaram (ou cujo arquivo sumiu ou foi alterado fora do gerador).
+"""
+
+import hashlib
+import json
+import os
+
+import docx
+
+from gerador import esqueleto
+from gerador.idiomas import IDIOMA_PADRAO
+from gerador.otimizacao import NIVEL_COMPRESSAO
+
+NOME_MANIFESTO = '.manifesto_geracao.json'
+
+_versao_gerador = None
+
+def hash_entrada(cliente):
+    """Hash estável dos dados de um cliente (datas viram texto ISO)"""
+    texto = json.dumps(cliente, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+
+def versao_gerador():
+    """Hash do código dos módulos do gerador e da versão do python-docx"""
+    global _versao_gerador
+    if _versao_gerador is None:
+        h = hashlib.sha256()
+        for fonte in esqueleto.fontes_gerador():
+            with open(fonte, 'rb') as f:
+                h.update(f.read())
+        h.update(docx.__version__.encode())
+        _versao_gerador = h.hexdigest()[:16]
+    return _versao_gerador
+
+def assinatura(cliente, nivel_compressao=NIVEL_COMPRESSAO):
+    """O que precisa continuar igual para que o documento possa ser reaproveitado"""
+    return {
+        'entrada': hash_entrada(cliente),
+        'template': esqueleto.versao_template(cliente.get('idioma', IDIOMA_PADRAO)),
+        'gerador': versao_gerador(),
+        'compressao': nivel_compressao,
+    }
+
+def carregar(pasta_saida):
+    """Lê o manifesto da pasta de saída; manifesto ausente ou corrompido vale como vazio"""
+    try:
+        with open(os.path.join(pasta_saida, NOME_MANIFESTO), encoding='utf-8') as f:
+            dados = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return dados.get('documentos', {}) if isinstance(dados, dict) else {}
+
+def salvar(pasta_saida, documentos):
+    """Grava o manifesto de forma atômica"""
+    caminho = os.path.join(pasta_saida, NOME_MANIFESTO)
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump({'documentos': documentos}, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temporario, caminho)
+
+def atualizado(entrada, caminho, esperado):
+    """True se o arquivo existe, não foi mexido e foi gerado a partir das mesmas entradas"""
+    if not entrada:
+        return False
+    try:
+        estado = os.stat(caminho)
+    except OSError:
+        return False
+    return (all(entrada.get(chave) == valor for chave, valor in esperado.items())
+            and entrada.get('bytes') == estado.st_size
+            and entrada.get('mtime_ns') == estado.st_mtime_ns)
+
+def registrar(documentos, caminho, esperado):
+    """Anota no manifesto (em memória) um documento recém-gerado"""
+    estado = os.stat(caminho)
+    documentos[os.path.basename(caminho)] = {**esperado, 'bytes': estado.st_size,
+                                             'mtime_ns': estado.st_mtime_ns}
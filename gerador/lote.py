@@ -0,0 +1,172 @@
+"""
+Geração de propostas em lote a partir de um manifesto de clientes (CSV ou JSON)
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gerador import esqueleto, incremental, proposta
+from gerador.manifesto import carregar_manifesto, nome_arquivo, nomes_arquivos
+from gerador.otimizacao import NIVEL_COMPRESSAO, salvar_otimizado
+from gerador.streaming import pico_memoria_mb
+
+def cpus_disponiveis():
+    """Número de núcleos que este processo pode usar"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _iniciar_worker():
+    """Carrega python-docx e o template uma única vez em cada processo do pool"""
+    proposta.carregar_template()
+
+def renderizar_cliente(tarefa):
+    """Gera e salva a proposta de um cliente; roda no processo principal ou num worker"""
+    cliente, caminho, usar_cache, nivel_compressao = tarefa
+    t0 = time.perf_counter()
+    if usar_cache:
+        with open(caminho, 'wb') as f:
+            f.write(esqueleto.renderizar(cliente, nivel_compressao))
+    else:
+        salvar_otimizado(proposta.montar_proposta(cliente), caminho, nivel_compressao)
+    return {'cliente': cliente['nome'], 'arquivo': caminho, 'segundos': time.perf_counter() - t0}
+
+def renderizar_cliente_bytes(tarefa):
+    """Gera a proposta de um cliente em memória (para o modo pacote)"""
+    cliente, usar_cache, nivel_compressao = tarefa
+    t0 = time.perf_counter()
+    if usar_cache:
+        dados = esqueleto.renderizar(cliente, nivel_compressao)
+    else:
+        dados = salvar_otimizado(proposta.montar_proposta(cliente), nivel=nivel_compressao)
+    return {'cliente': cliente['nome'], 'arquivo': nome_arquivo(cliente), 'dados': dados,
+            'segundos': time.perf_counter() - t0}
+
+def gerar_lote(clientes, pasta_saida, workers=1, verboso=True, usar_cache=True, forcar=False,
+               nivel_compressao=NIVEL_COMPRESSAO):
+    """Gera todas as propostas do manifesto, reaproveitando o template carregado
+    
+    Com workers > 1 os documentos são distribuídos num pool de processos; os
+    resultados voltam sempre na ordem do manifesto. Clientes com o mesmo nome
+    de arquivo (mesma sigla) não se sobrescrevem: os seguintes ganham _2, _3... Com usar_cache os
+    documentos saem do esqueleto compilado (ver gerador.esqueleto). Documentos
+    cujas entradas não mudaram desde a última rodada são mantidos como estão
+    (ver gerador.incremental), a não ser com forcar. `nivel_compressao` é o
+    nível do zip de cada .docx (0 a 9).
+    """
+    inicio = time.perf_counter()
+    os.makedirs(pasta_saida, exist_ok=True)
+    documentos = incremental.carregar(pasta_saida)
+    
+    resultados = []
+    tarefas = []
+    assinaturas = {}
+    for cliente, nome in zip(clientes, nomes_arquivos(clientes)):
+        if verboso and nome != nome_arquivo(cliente):
+            print(f"⚠️  {cliente['nome']}: {nome_arquivo(cliente)} já é de outro cliente, gravando {nome}")
+        caminho = os.path.join(pasta_saida, nome)
+        assinaturas[caminho] = incremental.assinatura(cliente, nivel_compressao)
+        if not forcar and incremental.atualizado(documentos.get(os.path.basename(caminho)), caminho,
+                                                 assinaturas[caminho]):
+            resultados.append({'cliente': cliente['nome'], 'arquivo': caminho, 'segundos': 0.0,
+                               'pulado': True})
+        else:
+            resultados.append(None)
+            tarefas.append((cliente, caminho, usar_cache, nivel_compressao))
+    pendentes = [i for i, resultado in enumerate(resultados) if resultado is None]
+    
+    def concluir(i, resultado):
+        resultados[i] = resultado
+        incremental.registrar(documentos, resultado['arquivo'], assinaturas[resultado['arquivo']])
+        if verboso:
+            print(f"📄 {resultado['arquivo']} — {resultado['segundos'] * 1000:.1f} ms")
+    
+    try:
+        if workers > 1 and len(tarefas) > 1:
+            workers = min(workers, len(tarefas))
+            # Lotes pequenos por worker diluem o custo de IPC sem desbalancear a carga
+            chunksize = max(1, len(tarefas) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker) as pool:
+                for i, resultado in zip(pendentes, pool.map(renderizar_cliente, tarefas, chunksize=chunksize)):
+                    concluir(i, resultado)
+        else:
+            _iniciar_worker()
+            for i, tarefa in zip(pendentes, tarefas):
+                concluir(i, renderizar_cliente(tarefa))
+    finally:
+        # Mesmo se o lote parar no meio, o que já foi gerado não é refeito na próxima rodada
+        if tarefas:
+            incremental.salvar(pasta_saida, documentos)
+    total = time.perf_counter() - inicio
+    
+    if verboso:
+        imprimir_resumo(resultados, total, workers)
+    return resultados, total
+
+def gerar_pacote(clientes, destino, workers=1, verboso=True, usar_cache=True, formato=None,
+                 nivel_compressao=NIVEL_COMPRESSAO):
+    """Gera todas as propostas direto num pacote .zip/.tar (ver gerador.pacote)
+    
+    Os documentos entram no pacote na ordem do manifesto, à medida que os
+    workers os entregam, sem arquivos soltos no disco. Não há regeneração
+    incremental: o pacote é sempre refeito inteiro.
+    """
+    from gerador.pacote import NOME_INDICE, PacoteSaida
+    
+    inicio = time.perf_counter()
+    pasta = os.path.dirname(destino) if isinstance(destino, str) else ''
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    tarefas = [(cliente, usar_cache, nivel_compressao) for cliente in clientes]
+    resultados = []
+    
+    with PacoteSaida(destino, formato) as pacote:
+        def concluir(resultado):
+            dados = resultado.pop('dados')
+            resultado['arquivo'] = pacote.adicionar(resultado['arquivo'], dados, cliente=resultado['cliente'])
+            resultado['bytes'] = len(dados)
+            resultados.append(resultado)
+            if verboso:
+                print(f"📄 {resultado['arquivo']} — {resultado['segundos'] * 1000:.1f} ms")
+        
+        if workers > 1 and len(tarefas) > 1:
+            workers = min(workers, len(tarefas))
+            chunksize = max(1, len(tarefas) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker) as pool:
+                for resultado in pool.map(renderizar_cliente_bytes, tarefas, chunksize=chunksize):
+                    concluir(resultado)
+        else:
+            _iniciar_worker()
+            for tarefa in tarefas:
+                concluir(renderizar_cliente_bytes(tarefa))
+    total = time.perf_counter() - inicio
+    
+    if verboso:
+        imprimir_resumo(resultados, total, workers)
+        if isinstance(destino, str):
+            print(f'📦 Pacote: {destino} ({os.path.getsize(destino) / 1024:.0f} KB, '
+                  f'índice em {NOME_INDICE})')
+    return resultados, total
+
+def imprimir_resumo(resultados, total, workers=1):
+    """Imprime tempo total, tempos por documento e vazão do lote"""
+    if not resultados:
+        print('⚠️ Manifesto sem clientes, nada foi gerado')
+        return
+    pulados = sum(1 for r in resultados if r.get('pulado'))
+    resultados = [r for r in resultados if not r.get('pulado')]
+    if pulados:
+        print(f'♻️ {pulados} proposta(s) sem mudanças desde a última geração, mantida(s)')
+    if not resultados:
+        print(f'✅ Nada a gerar ({total:.2f} s)')
+        return
+    tempos = [r['segundos'] * 1000 for r in resultados]
+    print(f'✅ {len(resultados)} propostas geradas em {total:.2f} s ({workers} worker(s))')
+    print(f'⏱️ Por documento: média {sum(tempos) / len(tempos):.1f} ms | '
+          f'mín {min(tempos):.1f} ms | máx {max(tempos):.1f} ms')
+    print(f'🚀 Vazão: {len(resultados) / total:.1f} documentos/s')
+    memoria = pico_memoria_mb()
+    if memoria is not None:
+        filhos = f' | workers {pico_memoria_mb(filhos=True):.0f} MB' if workers > 1 else ''
+        print(f'🧠 Pico de memória (RSS): processo principal {memoria:.0f} MB{filhos}')
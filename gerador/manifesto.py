@@ -0,0 +1,141 @@
+"""
+Leitura e validação do manifesto de clientes (CSV ou JSON)
+
+Só depende da biblioteca padrão e do modelo de conteúdo, para que validar um
+manifesto não precise carregar python-docx.
+"""
+
+import csv
+import json
+import os
+import re
+from datetime import date
+
+from gerador.conteudo import carregar_conteudo
+from gerador.idiomas import IDIOMA_PADRAO, validar_idioma
+
+CAMPOS_NUMERICOS = ('valor_sistema', 'valor_manutencao', 'meses_manutencao')
+
+def _numero(valor):
+    """Converte texto do manifesto em int quando possível, senão float"""
+    if isinstance(valor, (int, float)):
+        return valor
+    valor = float(str(valor).replace(',', '.'))
+    return int(valor) if valor.is_integer() else valor
+
+def gerar_sigla(nome):
+    """Gera sigla a partir das iniciais maiúsculas do nome (de todas as palavras, se não houver nenhuma)"""
+    sigla = ''.join(parte[0] for parte in nome.split() if parte[0].isupper())
+    return sigla or ''.join(parte[0] for parte in nome.split() if parte[0].isalnum()).upper()
+
+def validar_arquivo(nome, origem=''):
+    """Confere um nome de arquivo de saída: sem pastas, '..' nem caracteres de controle"""
+    if (not isinstance(nome, str) or '/' in nome or '\\' in nome or '..' in nome
+            or any(ord(c) < 32 or ord(c) == 127 for c in nome)):
+        raise ValueError(f'Nome de arquivo inválido: {nome!r} {origem}'.strip())
+    return nome
+
+def normalizar_cliente(dados, origem=''):
+    """Converte uma entrada do manifesto no dicionário usado por montar_proposta"""
+    cliente = {chave: valor for chave, valor in dados.items() if valor not in (None, '')}
+    if not cliente.get('nome'):
+        raise ValueError(f'Cliente sem nome {origem}'.strip())
+    if not isinstance(cliente['nome'], str):
+        raise ValueError(f"nome deve ser texto: {cliente['nome']!r} {origem}".strip())
+    
+    cliente['sigla'] = str(cliente.get('sigla', '')).strip() or gerar_sigla(cliente['nome'])
+    if not cliente['sigla']:
+        raise ValueError(f"Não foi possível gerar a sigla de {cliente['nome']!r}; informe a coluna sigla {origem}".strip())
+    if 'arquivo' in cliente:
+        validar_arquivo(cliente['arquivo'], origem)
+    if 'idioma' in cliente:
+        try:
+            validar_idioma(cliente['idioma'])
+        except ValueError as e:
+            raise ValueError(f'{e} {origem}'.strip()) from None
+    if isinstance(cliente.get('data'), str):
+        cliente['data'] = date.fromisoformat(cliente['data'])
+    for campo in CAMPOS_NUMERICOS:
+        if campo in cliente:
+            try:
+                cliente[campo] = _numero(cliente[campo])
+            except ValueError:
+                raise ValueError(f'{campo} não é um número: {cliente[campo]!r} {origem}'.strip()) from None
+    if not isinstance(cliente.get('meses_manutencao', 0), int):
+        raise ValueError(f"meses_manutencao deve ser inteiro: {cliente['meses_manutencao']} {origem}".strip())
+    
+    # Coluna de módulos vazia significa "nenhum módulo bônus", não "usar o padrão"
+    modulos = dados.get('modulos')
+    if isinstance(modulos, str):
+        modulos = [m.strip() for m in re.split(r'[;,|]', modulos) if m.strip()]
+    if modulos is not None:
+        if not isinstance(modulos, list) or not all(isinstance(m, str) for m in modulos):
+            raise ValueError(f'modulos deve ser uma lista de textos: {modulos!r} {origem}'.strip())
+        desconhecidos = [m for m in modulos if m not in carregar_conteudo().modulos]
+        if desconhecidos:
+            raise ValueError(f"Módulos desconhecidos ({', '.join(desconhecidos)}) {origem}".strip())
+        cliente['modulos'] = modulos
+    return cliente
+
+def carregar_manifesto(caminho):
+    """Lê o manifesto de clientes (.csv ou .json) e retorna a lista normalizada"""
+    if caminho.lower().endswith('.json'):
+        with open(caminho, encoding='utf-8') as f:
+            dados = json.load(f)
+        if isinstance(dados, dict):
+            dados = dados.get('clientes', [])
+    else:
+        with open(caminho, encoding='utf-8-sig', newline='') as f:
+            dados = list(csv.DictReader(f))
+    
+    return [normalizar_cliente(item, f'(item {i})') for i, item in enumerate(dados, start=1)]
+
+def _sufixo_idioma(idioma):
+    return '' if idioma == IDIOMA_PADRAO else f'_{idioma.upper()}'
+
+def expandir_idiomas(clientes, idiomas):
+    """Uma entrada por cliente e idioma (substitui a coluna idioma do manifesto)
+
+    Um `arquivo` explícito ganha o sufixo do idioma, para as versões não se
+    sobrescreverem.
+    """
+    for idioma in idiomas:
+        validar_idioma(idioma)
+    expandidos = []
+    for cliente in clientes:
+        for idioma in idiomas:
+            variante = {**cliente, 'idioma': idioma}
+            if cliente.get('arquivo'):
+                base, extensao = os.path.splitext(cliente['arquivo'])
+                variante['arquivo'] = f'{base}{_sufixo_idioma(idioma)}{extensao}'
+            expandidos.append(variante)
+    return expandidos
+
+def nome_arquivo(cliente):
+    """Nome do arquivo de saída de um cliente"""
+    if cliente.get('arquivo'):
+        return validar_arquivo(cliente['arquivo'])
+    sigla = re.sub(r'[^A-Za-z0-9_-]+', '_', cliente.get('sigla') or cliente['nome']).strip('_')
+    return f"PROPOSTA_COMERCIAL_{sigla.upper()}{_sufixo_idioma(cliente.get('idioma', IDIOMA_PADRAO))}.docx"
+
+def nome_livre(nome, usados):
+    """`nome`, ou NOME_2.docx, NOME_3.docx... se ele já está em `usados`"""
+    if nome not in usados:
+        return nome
+    base, ponto, extensao = nome.rpartition('.')
+    if not ponto:
+        base, extensao = nome, ''
+    n = 2
+    while f'{base}_{n}{ponto}{extensao}' in usados:
+        n += 1
+    return f'{base}_{n}{ponto}{extensao}'
+
+def nomes_arquivos(clientes):
+    """Nome de saída de cada cliente; repetidos (mesma sigla) ganham _2, _3... na ordem do manifesto"""
+    usados = set()
+    nomes = []
+    for cliente in clientes:
+        nome = nome_livre(nome_arquivo(cliente), usados)
+        usados.add(nome)
+        nomes.append(nome)
+    return nomes
@@ -0,0 +1,148 @@
+"""
+Modo --watch: processo residente que refaz as propostas quando as fontes mudam
+
+python-docx, o template, o conteúdo, os catálogos e os esqueletos compilados
+ficam carregados entre uma edição e outra, então cada rodada paga só o que a
+mudança invalidou. As fontes são conferidas por polling (os.stat a cada
+INTERVALO, sem dependências nem limites de inotify) e cada mudança invalida só
+o que depende dela:
+
+- conteudo_proposta.json: conteúdo, preços e esqueletos de todos os idiomas;
+- locale/<idioma>/LC_MESSAGES/gerador.po: recompila o .mo e refaz só os
+  documentos desse idioma;
+- manifesto (batch --watch): relido; só os clientes cujas linhas mudaram são
+  gerados de novo (ver gerador.incremental);
+- código do gerador (gerador/*.py): o processo se reinicia, porque módulos já
+  importados não se recarregam com segurança.
+"""
+
+import os
+import sys
+import time
+
+from gerador import conteudo, esqueleto, idiomas, precos
+
+INTERVALO = 0.1  # segundos entre duas conferências das fontes
+
+CONTEUDO = 'conteudo'
+CATALOGO = 'catalogo'
+MANIFESTO = 'manifesto'
+CODIGO = 'codigo'
+
+def fontes_observadas(manifesto=None):
+    """{caminho: (tipo, idioma)} dos arquivos que mudam os documentos"""
+    fontes = {conteudo.CAMINHO_PADRAO: (CONTEUDO, None)}
+    for idioma in idiomas.IDIOMAS:
+        if idioma != idiomas.IDIOMA_PADRAO:
+            fontes[idiomas.caminho_catalogo(idioma, 'po')] = (CATALOGO, idioma)
+    for fonte in esqueleto.fontes_gerador():
+        fontes[fonte] = (CODIGO, None)
+    if manifesto:
+        fontes[os.path.abspath(manifesto)] = (MANIFESTO, None)
+    return fontes
+
+def _estado(caminho):
+    try:
+        estado = os.stat(caminho)
+    except OSError:
+        return None
+    return estado.st_mtime_ns, estado.st_size
+
+def _rotulo(caminho, tipo, idioma):
+    nome = os.path.basename(caminho)
+    return f'{nome} ({idioma})' if tipo == CATALOGO else nome
+
+def conferir(fontes, estados):
+    """Caminhos que mudaram desde a última conferência (atualiza `estados`)"""
+    mudaram = []
+    for caminho in fontes:
+        atual = _estado(caminho)
+        if estados.get(caminho) != atual:
+            estados[caminho] = atual
+            mudaram.append(caminho)
+    return mudaram
+
+def aguardar_mudancas(fontes, estados, intervalo=INTERVALO):
+    """Bloqueia até alguma fonte mudar e devolve os caminhos alterados
+
+    Depois da primeira mudança espera mais um intervalo, para juntar numa
+    rodada só os vários write() de um editor salvando o arquivo.
+    """
+    while True:
+        time.sleep(intervalo)
+        mudaram = conferir(fontes, estados)
+        if mudaram:
+            time.sleep(intervalo)
+            return mudaram + [caminho for caminho in conferir(fontes, estados) if caminho not in mudaram]
+
+def invalidar(tipos):
+    """Esquece os caches afetados e devolve os idiomas a refazer (None = todos)"""
+    if any(tipo == CONTEUDO for tipo, _ in tipos):
+        afetados = None
+        esqueleto.recarregar()
+    else:
+        afetados = set()
+        for tipo, idioma in tipos:
+            if tipo == CATALOGO:
+                po = idiomas.caminho_catalogo(idioma, 'po')
+                idiomas.compilar_mo(idiomas.ler_po(po), idiomas.caminho_catalogo(idioma))
+                idiomas.recarregar(idioma)
+                esqueleto.recarregar(idioma)
+                afetados.add(idioma)
+        if not afetados:
+            return afetados
+    # Conteúdo traduzido e preços formatados dependem dos dois
+    conteudo.carregar_conteudo.cache_clear()
+    precos.itens_mercado.cache_clear()
+    precos.calcular_precos.cache_clear()
+    return afetados
+
+def reiniciar():
+    """Troca o processo por um novo com os mesmos argumentos (código alterado)"""
+    argv = getattr(sys, 'orig_argv', [sys.executable, *sys.argv])
+    sys.stdout.flush()
+    os.execv(sys.executable, argv)
+
+def observar(gerar, manifesto=None, intervalo=INTERVALO, arquivo=sys.stdout):
+    """Gera uma vez e depois a cada mudança das fontes, até Ctrl+C
+
+    `gerar(idiomas)` recebe os idiomas afetados (None = todos) e devolve
+    quantos documentos refez. Erros (JSON inválido, manifesto com problema...)
+    são mostrados e o processo continua esperando a próxima edição.
+    """
+    fontes = fontes_observadas(manifesto)
+    estados = {}
+    conferir(fontes, estados)
+    motivo = 'primeira geração'
+    afetados = None
+    inicio = time.perf_counter()
+    try:
+        while True:
+            try:
+                documentos = gerar(afetados)
+            except Exception as e:
+                print(f'❌ {motivo}: {e}', file=arquivo)
+            else:
+                print(f'⚡ {motivo}: {documentos} documento(s) em '
+                      f'{(time.perf_counter() - inicio) * 1000:.0f} ms', file=arquivo)
+            print(f'👀 Observando {len(fontes)} arquivo(s)... (Ctrl+C para sair)', file=arquivo, flush=True)
+
+            while True:
+                mudaram = aguardar_mudancas(fontes, estados, intervalo)
+                tipos = [fontes[caminho] for caminho in mudaram]
+                motivo = ', '.join(_rotulo(caminho, *fontes[caminho]) for caminho in mudaram) + ' mudou'
+                if any(tipo == CODIGO for tipo, _ in tipos):
+                    print(f'🔁 {motivo}: reiniciando o processo', file=arquivo, flush=True)
+                    reiniciar()
+                inicio = time.perf_counter()
+                try:
+                    afetados = invalidar(tipos)
+                except (OSError, ValueError, SyntaxError) as e:
+                    print(f'❌ {motivo}: {e}', file=arquivo, flush=True)
+                    continue
+                if afetados is None or afetados or any(tipo == MANIFESTO for tipo, _ in tipos):
+                    break
+                print(f'⏭️  {motivo}: nenhum documento afetado', file=arquivo, flush=True)
+    except KeyboardInterrupt:
+        print('👋 Fim do modo --watch', file=arquivo)
+    return 0
@@ -0,0 +1,222 @@
+"""
+Redução do tamanho dos .docx gerados
+
+O Document() do python-docx parte do template padrão, que traz ~200 estilos
+(mais ~140 definições latentes), uma cópia dos estilos para o Word 2010
+(stylesWithEffects.xml), miniatura, customXml e webSettings que nenhum
+documento do gerador usa. Antes de gravar:
+
+- as partes descartáveis saem do pacote, junto com suas relações e tipos
+  (customXml fica quando algum controle de conteúdo tem w:dataBinding);
+- styles.xml fica só com os estilos referenciados em qualquer parte word/*.xml
+  (mais os padrões e os que eles herdam por basedOn/next/link), sem
+  w:latentStyles;
+- runs vizinhos com a mesma formatação (w:rPr idêntico) viram um só;
+- o zip é gravado com o nível de compressão escolhido (0 a 9).
+
+Na proposta isso roda uma vez por esqueleto compilado (ver gerador.esqueleto),
+não por documento.
+
+    python gerar_proposta_word.py optimize ARQUIVO.docx ... (--saida PASTA | --no-lugar) [--compressao N]
+"""
+
+import io
+import posixpath
+import re
+import zipfile
+
+from lxml import etree
+
+NIVEL_COMPRESSAO = 9
+
+PARTES_DESCARTAVEIS = ('word/stylesWithEffects.xml', 'word/webSettings.xml', 'docProps/thumbnail.jpeg')
+PREFIXOS_DESCARTAVEIS = ('customXml/',)
+
+PARTE_TIPOS = '[Content_Types].xml'
+PARTE_ESTILOS = 'word/styles.xml'
+# Partes com runs a juntar
+PARTES_CONTEUDO = re.compile(r'word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$')
+# Partes que podem citar estilos (comentários, glossário...): todo XML de word/
+PARTES_WORD = re.compile(r'word/.+\.xml$')
+VINCULO_DADOS = b'<w:dataBinding'
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+ESPACO_XML = '{http://www.w3.org/XML/1998/namespace}space'
+REFERENCIA_ESTILO = re.compile(rb'<w:(?:pStyle|rStyle|tblStyle|numStyleLink|styleLink)\b[^>]*?\bw:val="([^"]+)"')
+
+def descartavel(nome, manter_custom_xml=False):
+    if manter_custom_xml and nome.startswith('customXml/'):
+        return False
+    return nome in PARTES_DESCARTAVEIS or nome.startswith(PREFIXOS_DESCARTAVEIS)
+
+def abrir_zip(destino, nivel=NIVEL_COMPRESSAO):
+    """ZipFile para escrita com o nível de compressão pedido (0 = sem compressão)"""
+    if not 0 <= nivel <= 9:
+        raise ValueError(f'Nível de compressão inválido: {nivel} (use de 0 a 9)')
+    if nivel == 0:
+        return zipfile.ZipFile(destino, 'w', zipfile.ZIP_STORED)
+    return zipfile.ZipFile(destino, 'w', zipfile.ZIP_DEFLATED, compresslevel=nivel)
+
+def gravar_parte(z, info, dados):
+    """writestr com o método e o nível do zip (um ZipInfo pronto ignoraria os dois)"""
+    z.writestr(info, dados, compress_type=z.compression, compresslevel=z.compresslevel)
+
+def _serializar(arvore):
+    return etree.tostring(arvore, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+def limpar_referencias(nome, dados, removidas):
+    """Tira de um .rels ou do [Content_Types].xml as entradas das partes removidas"""
+    arvore = etree.fromstring(dados)
+    if nome == PARTE_TIPOS:
+        for override in list(arvore):
+            if override.get('PartName', '').lstrip('/') in removidas:
+                arvore.remove(override)
+        return _serializar(arvore)
+
+    # word/_rels/document.xml.rels -> alvos relativos a word/
+    base = posixpath.dirname(posixpath.dirname(nome))
+    for relacao in list(arvore):
+        if relacao.get('TargetMode') == 'External':
+            continue
+        alvo = relacao.get('Target', '')
+        alvo = alvo.lstrip('/') if alvo.startswith('/') else posixpath.normpath(posixpath.join(base, alvo))
+        if alvo in removidas:
+            arvore.remove(relacao)
+    return _serializar(arvore)
+
+def estilos_referenciados(*partes):
+    """Ids de estilo citados (pStyle, rStyle, tblStyle...) nos XMLs dados"""
+    return {valor.decode('utf-8') for dados in partes for valor in REFERENCIA_ESTILO.findall(dados)}
+
+def podar_estilos(dados, usados):
+    """styles.xml só com os estilos usados, os padrões e os que eles herdam; sem latentStyles"""
+    arvore = etree.fromstring(dados)
+    for latentes in arvore.findall(f'{W}latentStyles'):
+        arvore.remove(latentes)
+
+    estilos = {estilo.get(f'{W}styleId'): estilo for estilo in arvore.findall(f'{W}style')}
+    pendentes = [id_ for id_, estilo in estilos.items()
+                 if id_ in usados or estilo.get(f'{W}default') in ('1', 'true')]
+    manter = set()
+    while pendentes:
+        id_ = pendentes.pop()
+        if id_ in manter or id_ not in estilos:
+            continue
+        manter.add(id_)
+        for ligacao in ('basedOn', 'next', 'link'):
+            alvo = estilos[id_].find(f'{W}{ligacao}')
+            if alvo is not None:
+                pendentes.append(alvo.get(f'{W}val'))
+
+    for id_, estilo in estilos.items():
+        if id_ not in manter:
+            arvore.remove(estilo)
+    return _serializar(arvore)
+
+def _simples(run):
+    """(rPr, w:t) de um run que só tem formatação e texto; None nos demais"""
+    filhos = list(run)
+    if filhos and filhos[0].tag == f'{W}rPr':
+        rpr, filhos = filhos[0], filhos[1:]
+    else:
+        rpr = None
+    if len(filhos) != 1 or filhos[0].tag != f'{W}t' or len(filhos[0]):
+        return None
+    return rpr, filhos[0]
+
+def juntar_runs(dados):
+    """Junta runs vizinhos de mesma formatação; retorna o XML e quantos runs saíram"""
+    arvore = etree.fromstring(dados)
+    removidos = 0
+    for pai in arvore.iter(f'{W}p', f'{W}hyperlink'):
+        anterior = None  # (run, chave da formatação, w:t)
+        for filho in list(pai):
+            atual = _simples(filho) if filho.tag == f'{W}r' else None
+            if atual is None:
+                anterior = None
+                continue
+            rpr, texto = atual
+            chave = (tuple(sorted(filho.attrib.items())),
+                     etree.tostring(rpr, method='c14n') if rpr is not None else None)
+            if anterior is not None and anterior[1] == chave:
+                destino = anterior[2]
+                destino.text = (destino.text or '') + (texto.text or '')
+                if texto.get(ESPACO_XML) or destino.text != destino.text.strip():
+                    destino.set(ESPACO_XML, 'preserve')
+                pai.remove(filho)
+                removidos += 1
+            else:
+                anterior = (filho, chave, texto)
+    return _serializar(arvore), removidos
+
+def otimizar_docx(dados, nivel=NIVEL_COMPRESSAO, estatisticas=None):
+    """Bytes do .docx otimizado (ver o início do módulo)
+
+    Com `estatisticas` (dict), anota bytes antes/depois, partes removidas,
+    estilos mantidos/removidos e runs juntados.
+    """
+    with zipfile.ZipFile(io.BytesIO(dados)) as z:
+        infos = z.infolist()
+        partes = {info.filename: z.read(info) for info in infos}
+
+    # Controles de conteúdo ligados a dados leem os valores de customXml/
+    vinculado = any(VINCULO_DADOS in dados_parte for nome, dados_parte in partes.items() if PARTES_WORD.match(nome))
+    removidas = {nome for nome in partes if descartavel(nome, vinculado)}
+    runs = 0
+    for nome in partes:
+        if nome.endswith('.rels') or nome == PARTE_TIPOS:
+            partes[nome] = limpar_referencias(nome, partes[nome], removidas)
+        elif PARTES_CONTEUDO.match(nome):
+            partes[nome], juntados = juntar_runs(partes[nome])
+            runs += juntados
+
+    estilos_antes = estilos_depois = 0
+    if PARTE_ESTILOS in partes:
+        referencias = [dados_parte for nome, dados_parte in partes.items()
+                       if PARTES_WORD.match(nome) and nome != PARTE_ESTILOS]
+        estilos_antes = partes[PARTE_ESTILOS].count(b'<w:style ')
+        partes[PARTE_ESTILOS] = podar_estilos(partes[PARTE_ESTILOS], estilos_referenciados(*referencias))
+        estilos_depois = partes[PARTE_ESTILOS].count(b'<w:style ')
+
+    buffer = io.BytesIO()
+    with abrir_zip(buffer, nivel) as z:
+        for info in infos:
+            if info.filename not in removidas:
+                gravar_parte(z, zipfile.ZipInfo(info.filename, info.date_time), partes[info.filename])
+    resultado = buffer.getvalue()
+
+    if estatisticas is not None:
+        estatisticas.update({
+            'antes': len(dados), 'depois': len(resultado), 'partes_removidas': sorted(removidas),
+            'estilos': (estilos_antes, estilos_depois), 'runs_juntados': runs,
+        })
+    return resultado
+
+def salvar_otimizado(doc, destino=None, nivel=NIVEL_COMPRESSAO):
+    """Grava um Document do python-docx já otimizado; sem destino retorna os bytes"""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    dados = otimizar_docx(buffer.getvalue(), nivel)
+    if destino is None:
+        return dados
+    if hasattr(destino, 'write'):
+        destino.write(dados)
+    else:
+        with open(destino, 'wb') as f:
+            f.write(dados)
+    return dados
+
+def otimizar_arquivo(caminho, destino=None, nivel=NIVEL_COMPRESSAO, no_lugar=False):
+    """Otimiza um .docx já gravado e retorna as estatísticas
+
+    Sem `destino` o original só é substituído com no_lugar=True.
+    """
+    if destino is None and not no_lugar:
+        raise ValueError(f'{caminho}: informe o destino ou no_lugar=True para substituir o original')
+    with open(caminho, 'rb') as f:
+        dados = f.read()
+    estatisticas = {}
+    otimizado = otimizar_docx(dados, nivel, estatisticas)
+    with open(destino or caminho, 'wb') as f:
+        f.write(otimizado)
+    return estatisticas
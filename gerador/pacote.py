@@ -0,0 +1,129 @@
+"""
+Saída empacotada: vários documentos num único .zip ou .tar
+
+Cada documento entra no pacote assim que fica pronto, numa escrita sequencial,
+sem passar por arquivos soltos. Membros que já são comprimidos (.docx é um zip)
+vão como ZIP_STORED, sem recomprimir; no fim é gravado um índice (indice.json)
+com nome, tamanho e sha256 de cada membro. Se o bloco with termina com erro o
+pacote é descartado: sem índice e, quando o destino é um caminho, sem arquivo.
+
+    with PacoteSaida('propostas.zip') as pacote:
+        pacote.adicionar('PROPOSTA_COMERCIAL_IBVA.docx', dados, cliente='IBVA')
+"""
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import time
+import zipfile
+from datetime import datetime
+
+from gerador.manifesto import nome_livre
+
+FORMATOS_PACOTE = ('zip', 'tar')
+NOME_INDICE = 'indice.json'
+
+# Formatos que já são comprimidos: recomprimir só gasta CPU
+EXTENSOES_COMPRIMIDAS = ('.docx', '.xlsx', '.pptx', '.zip', '.gz', '.png', '.jpg', '.jpeg')
+
+def formato_pacote(caminho):
+    """'zip' ou 'tar' pela extensão do arquivo"""
+    nome = str(caminho).lower()
+    for formato in FORMATOS_PACOTE:
+        if nome.endswith(f'.{formato}'):
+            return formato
+    raise ValueError(f'{caminho}: pacote deve terminar em .zip ou .tar')
+
+class PacoteSaida:
+    """Pacote .zip/.tar escrito em sequência, com índice dos documentos"""
+
+    def __init__(self, destino, formato=None, compressao=zipfile.ZIP_DEFLATED):
+        self.formato = formato or formato_pacote(destino)
+        self.compressao = compressao
+        self.itens = []
+        self._nomes = set()
+        self._destino = destino
+        if self.formato == 'zip':
+            self._zip = zipfile.ZipFile(destino, 'w', compressao)
+            self._tar = None
+        elif self.formato == 'tar':
+            # 'w|' escreve em fluxo: serve também para stdout e sockets
+            if hasattr(destino, 'write'):
+                self._tar = tarfile.open(fileobj=destino, mode='w|')
+            else:
+                self._tar = tarfile.open(destino, mode='w|')
+            self._zip = None
+        else:
+            raise ValueError(f"Formato de pacote desconhecido: {self.formato} "
+                             f"(disponíveis: {', '.join(FORMATOS_PACOTE)})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        if tipo is None:
+            self.fechar()
+        else:
+            self.descartar()
+
+    def _nome_livre(self, nome):
+        """Evita membros repetidos (clientes com a mesma sigla): NOME_2.docx, NOME_3.docx..."""
+        return nome_livre(nome, self._nomes)
+
+    def _gravar(self, nome, dados):
+        momento = time.time()
+        if self._zip is not None:
+            info = zipfile.ZipInfo(nome, date_time=time.localtime(momento)[:6])
+            info.compress_type = (zipfile.ZIP_STORED if nome.lower().endswith(EXTENSOES_COMPRIMIDAS)
+                                  else self.compressao)
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, dados)
+        else:
+            info = tarfile.TarInfo(nome)
+            info.size = len(dados)
+            info.mtime = int(momento)
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(dados))
+
+    def adicionar(self, nome, dados, **extras):
+        """Grava um documento no pacote; `extras` vão para o índice. Retorna o nome usado"""
+        nome = self._nome_livre(nome)
+        self._nomes.add(nome)
+        self._gravar(nome, dados)
+        self.itens.append({'arquivo': nome, 'bytes': len(dados),
+                           'sha256': hashlib.sha256(dados).hexdigest(), **extras})
+        return nome
+
+    def fechar(self):
+        """Grava o índice e fecha o pacote"""
+        if self._zip is None and self._tar is None:
+            return
+        indice = {
+            'gerado_em': datetime.now().isoformat(timespec='seconds'),
+            'total': len(self.itens),
+            'documentos': self.itens,
+        }
+        self._gravar(self._nome_livre(NOME_INDICE),
+                     json.dumps(indice, ensure_ascii=False, indent=1).encode('utf-8'))
+        self._fechar_arquivo()
+
+    def descartar(self):
+        """Fecha sem gravar o índice e apaga o pacote parcial (erro no meio do lote)"""
+        if self._zip is None and self._tar is None:
+            return
+        self._fechar_arquivo()
+        if isinstance(self._destino, (str, os.PathLike)):
+            try:
+                os.remove(self._destino)
+            except FileNotFoundError:
+                pass
+
+    def _fechar_arquivo(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        else:
+            self._tar.close()
+            self._tar = None
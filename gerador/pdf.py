@@ -0,0 +1,336 @@
+"""
+Proposta em PDF
+
+Dois caminhos, ambos offline:
+
+- renderizar_pdf: layout próprio com reportlab sobre o mesmo conteúdo de
+  preparar_proposta (como o HTML e o Markdown). Não depende do .docx nem do
+  LibreOffice; é o usado por `render --formatos pdf`.
+- PoolLibreOffice: converte os .docx gerados com o LibreOffice headless.
+  Cada instância tem o próprio perfil e recebe os arquivos de uma fila em
+  lotes, então o soffice sobe uma vez por lote e não uma vez por arquivo
+  (usado por `convert`). Fica fiel ao .docx, ao custo de precisar do
+  LibreOffice instalado.
+
+reportlab é opcional: só é importado quando um PDF é pedido.
+"""
+
+import io
+import os
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from gerador import proposta
+
+TEMPO_LIMITE_SOFFICE = 300
+
+def _reportlab():
+    try:
+        import reportlab  # noqa: F401
+    except ImportError as e:
+        raise ImportError('Exportação em PDF requer reportlab (pip install reportlab)',
+                          name='reportlab') from e
+
+def _latin(texto):
+    """As fontes padrão do PDF (Helvetica) só cobrem o cp1252: ícones/emoji saem do texto"""
+    return re.sub(' {2,}', ' ', texto.encode('cp1252', 'ignore').decode('cp1252')).strip()
+
+def _cor(rgb):
+    from reportlab.lib import colors
+    return colors.HexColor(f'#{rgb}')
+
+@lru_cache(maxsize=None)
+def _estilos():
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    base = getSampleStyleSheet()['Normal']
+    azul, azul_escuro = _cor(proposta.AZUL), _cor(proposta.AZUL_ESCURO)
+
+    def estilo(nome, **opcoes):
+        return ParagraphStyle(nome, parent=base, **{'fontName': 'Helvetica', 'fontSize': 11, 'leading': 15,
+                                                    **opcoes})
+
+    return {
+        'titulo': estilo('titulo', fontName='Helvetica-Bold', fontSize=26, leading=32, alignment=TA_CENTER,
+                         textColor=azul, spaceAfter=8),
+        'subtitulo': estilo('subtitulo', fontSize=15, leading=20, alignment=TA_CENTER, textColor=azul_escuro),
+        'cliente': estilo('cliente', fontName='Helvetica-Bold', fontSize=18, leading=24, alignment=TA_CENTER,
+                          textColor=azul, spaceBefore=18),
+        'data': estilo('data', alignment=TA_CENTER, textColor=_cor(proposta.CINZA), spaceBefore=6),
+        'secao': estilo('secao', fontName='Helvetica-Bold', fontSize=16, leading=20, textColor=azul,
+                        spaceBefore=18, spaceAfter=8),
+        'subsecao': estilo('subsecao', fontName='Helvetica-Bold', fontSize=12, textColor=azul_escuro,
+                           spaceBefore=10, spaceAfter=4),
+        'corpo': estilo('corpo', alignment=TA_JUSTIFY, spaceAfter=6),
+        'destaque': estilo('destaque', fontName='Helvetica-Bold', alignment=TA_CENTER, textColor=azul,
+                           spaceBefore=6, spaceAfter=6),
+        'item': estilo('item', leftIndent=14, bulletIndent=2, spaceAfter=2),
+        'valor_modulo': estilo('valor_modulo', fontName='Helvetica-Bold', textColor=_cor(proposta.VERDE),
+                               spaceBefore=4, spaceAfter=8),
+        'nota': estilo('nota', fontName='Helvetica-Oblique', alignment=TA_JUSTIFY,
+                       textColor=_cor(proposta.MARROM), spaceAfter=8),
+        'caixa': estilo('caixa', alignment=TA_CENTER, textColor=azul_escuro, spaceAfter=4),
+        'caixa_grande': estilo('caixa_grande', fontName='Helvetica-Bold', fontSize=30, leading=36,
+                               alignment=TA_CENTER, textColor=azul_escuro, spaceBefore=6, spaceAfter=8),
+        'economia': estilo('economia', fontName='Helvetica-Bold', alignment=TA_CENTER,
+                           textColor=_cor(proposta.VERDE)),
+        'agradecimento': estilo('agradecimento', alignment=TA_JUSTIFY, textColor=_cor(proposta.BRANCO),
+                                spaceAfter=8),
+        'celula': estilo('celula', fontSize=9.5, leading=12),
+        'celula_total': estilo('celula_total', fontName='Helvetica-Bold', fontSize=9.5, leading=12),
+        'celula_cabecalho': estilo('celula_cabecalho', fontName='Helvetica-Bold', fontSize=9.5, leading=12,
+                                   textColor=_cor(proposta.BRANCO)),
+        'contato': estilo('contato', alignment=TA_CENTER),
+        'rodape': estilo('rodape', fontSize=9, alignment=TA_CENTER, textColor=_cor(proposta.CINZA_CLARO)),
+    }
+
+def renderizar_pdf(cliente=None):
+    """Proposta em PDF (reportlab), com o mesmo texto do .docx"""
+    _reportlab()
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (KeepTogether, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table,
+                                    TableStyle)
+
+    dados = proposta.preparar_proposta(cliente)
+    conteudo, campos, texto = dados['conteudo'], dados['campos'], dados['texto']
+    investimento = conteudo.investimento
+    estilos = _estilos()
+    largura = A4[0] - 2 * inch
+    historia = []
+
+    def p(valor, estilo, **opcoes):
+        historia.append(Paragraph(escape(_latin(valor)).replace('\n', '<br/>'), estilos[estilo], **opcoes))
+
+    def secao(chave):
+        p(texto(conteudo.secoes[chave].titulo), 'secao')
+
+    def itens(lista, marcador='•'):
+        for item in lista:
+            p(item, 'item', bulletText=marcador)
+
+    def caixa(paragrafos, fundo):
+        tabela = Table([[paragrafos]], colWidths=[largura])
+        tabela.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), _cor(fundo)),
+            ('LEFTPADDING', (0, 0), (-1, -1), 14), ('RIGHTPADDING', (0, 0), (-1, -1), 14),
+            ('TOPPADDING', (0, 0), (-1, -1), 12), ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ]))
+        historia.append(KeepTogether(tabela))
+        historia.append(Spacer(1, 10))
+
+    def na_caixa(valor, estilo):
+        return Paragraph(escape(_latin(valor)).replace('\n', '<br/>'), estilos[estilo])
+
+    def tabela(cabecalho, linhas, destaque_ultima=False):
+        celulas = [[na_caixa(titulo, 'celula_cabecalho') for titulo in cabecalho]]
+        celulas += [[na_caixa(celula, 'celula_total' if destaque_ultima and i == len(linhas) - 1 else 'celula')
+                     for celula in linha] for i, linha in enumerate(linhas)]
+        comandos = [
+            ('BACKGROUND', (0, 0), (-1, 0), _cor(proposta.ESPEC_TABELA['fundo_cabecalho'])),
+            ('GRID', (0, 0), (-1, -1), 0.5, _cor('C8D3E6')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]
+        if destaque_ultima:
+            comandos.append(('BACKGROUND', (0, -1), (-1, -1), _cor(proposta.AMARELO)))
+        resultado = Table(celulas, colWidths=[largura / len(cabecalho)] * len(cabecalho), repeatRows=1)
+        resultado.setStyle(TableStyle(comandos))
+        historia.append(resultado)
+        historia.append(Spacer(1, 10))
+
+    # Cabeçalho
+    p(texto(conteudo.cabecalho['titulo']), 'titulo')
+    p(texto(conteudo.cabecalho['subtitulo']), 'subtitulo')
+    p(campos['nome'], 'cliente')
+    p(texto(conteudo.cabecalho['data']), 'data')
+    historia.append(Spacer(1, 12))
+
+    secao('apresentacao')
+    p(texto(conteudo.apresentacao['texto']), 'corpo')
+    p(texto(conteudo.apresentacao['destaques']), 'destaque')
+
+    secao('funcionalidades')
+    for topico in conteudo.funcionalidades:
+        p(topico.titulo, 'subsecao')
+        itens(topico.itens)
+    historia.append(PageBreak())
+
+    secao('beneficios')
+    itens(texto(beneficio) for beneficio in conteudo.beneficios)
+    secao('tecnologias')
+    for tec in conteudo.tecnologias:
+        p(f'{tec.area}: {tec.descricao}', 'corpo')
+    historia.append(PageBreak())
+
+    secao('mercado')
+    tabela(conteudo.cabecalho_mercado, dados['mercado'], destaque_ultima=True)
+
+    if dados['modulos']:
+        secao('bonus')
+        p(texto(conteudo.bonus['chamada']), 'destaque')
+    for modulo in dados['modulos']:
+        p(modulo.titulo, 'subsecao')
+        itens(modulo.itens)
+        valor = proposta.formatar_moeda(modulo.valor_mercado, dados['idioma'])
+        p(texto(conteudo.bonus['rotulo_valor'], valor=valor), 'valor_modulo')
+    historia.append(PageBreak())
+
+    secao('nota_pessoal')
+    caixa([na_caixa(texto(paragrafo), 'nota') for paragrafo in conteudo.nota_pessoal], 'FFF3CD')
+
+    secao('investimento')
+    caixa([
+        na_caixa(texto(investimento['titulo']), 'subsecao'),
+        na_caixa(campos['valor_sistema'], 'caixa_grande'),
+        na_caixa(texto(investimento['pagamento_unico']), 'caixa'),
+        na_caixa(dados['inclui'], 'caixa'),
+        na_caixa(texto(investimento['manutencao']), 'subsecao'),
+        na_caixa(texto(investimento['periodo']), 'caixa'),
+    ], 'FFD600')
+    caixa([
+        na_caixa(texto(investimento['total_titulo']), 'subsecao'),
+        na_caixa(campos['total_investimento'], 'caixa_grande'),
+        na_caixa(texto(investimento['total_composicao']), 'caixa'),
+        na_caixa(texto(investimento['economia']), 'economia'),
+    ], 'E7F3FF')
+    historia.append(PageBreak())
+
+    secao('inclusos')
+    itens(dados['inclusos'])
+
+    secao('cronograma')
+    tabela(conteudo.cabecalho_cronograma, dados['cronograma'])
+
+    secao('pagamento')
+    itens(texto(linha) for linha in conteudo.pagamento)
+    historia.append(PageBreak())
+
+    secao('agradecimento')
+    caixa([na_caixa(texto(paragrafo), 'agradecimento') for paragrafo in conteudo.agradecimento],
+          proposta.ESPEC_TABELA['fundo_cabecalho'])
+
+    secao('contato')
+    p('\n'.join(texto(linha) for linha in conteudo.contato), 'contato')
+    historia.append(Spacer(1, 18))
+    p(texto(conteudo.rodape), 'rodape')
+
+    buffer = io.BytesIO()
+    titulo = f"{texto(conteudo.cabecalho['titulo']).title()} - {campos['sigla']}"
+    SimpleDocTemplate(buffer, pagesize=A4, leftMargin=inch, rightMargin=inch, topMargin=inch,
+                      bottomMargin=inch, title=_latin(titulo), author=_latin(campos['nome'])).build(historia)
+    return buffer.getvalue()
+
+# ==================== LIBREOFFICE ====================
+
+def localizar_soffice():
+    """Caminho do executável do LibreOffice, ou None se não estiver instalado"""
+    return shutil.which('soffice') or shutil.which('libreoffice')
+
+def converter_com_soffice(caminhos, pasta_saida, soffice=None, perfil=None):
+    """Converte .docx em PDF numa única execução do soffice; retorna os PDFs na mesma ordem"""
+    soffice = soffice or localizar_soffice()
+    if not soffice:
+        raise FileNotFoundError('LibreOffice (soffice) não encontrado no PATH')
+    os.makedirs(pasta_saida, exist_ok=True)
+    comando = [soffice, '--headless', '--norestore', '--nolockcheck']
+    if perfil:
+        # Perfil próprio: várias instâncias podem rodar ao mesmo tempo
+        comando.append(f'-env:UserInstallation=file://{os.path.abspath(perfil)}')
+    comando += ['--convert-to', 'pdf', '--outdir', pasta_saida, *caminhos]
+    pdfs = [os.path.join(pasta_saida, os.path.splitext(os.path.basename(c))[0] + '.pdf') for c in caminhos]
+    # PDF de uma rodada anterior não pode passar por conversão bem-sucedida
+    for pdf in pdfs:
+        try:
+            os.remove(pdf)
+        except FileNotFoundError:
+            pass
+    subprocess.run(comando, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                   timeout=TEMPO_LIMITE_SOFFICE)
+    faltando = [pdf for pdf in pdfs if not os.path.exists(pdf)]
+    if faltando:
+        raise RuntimeError(f"LibreOffice não gerou: {', '.join(faltando)}")
+    return pdfs
+
+class PoolLibreOffice:
+    """Instâncias do LibreOffice alimentadas por uma fila de conversões
+
+    Cada instância (uma thread com o próprio perfil) retira até `lote`
+    arquivos da fila por vez e converte todos numa só execução do soffice.
+    converter() devolve um Future com o caminho do PDF.
+    """
+
+    def __init__(self, instancias=2, lote=20, soffice=None):
+        if instancias < 1 or lote < 1:
+            raise ValueError(f'instancias e lote devem ser ao menos 1 (recebido: {instancias} e {lote})')
+        self.soffice = soffice or localizar_soffice()
+        if not self.soffice:
+            raise FileNotFoundError('LibreOffice (soffice) não encontrado no PATH')
+        self.lote = lote
+        self._fila = queue.Queue()
+        self._perfis = [tempfile.mkdtemp(prefix='gerador-soffice-') for _ in range(instancias)]
+        self._threads = [threading.Thread(target=self._trabalhar, args=(perfil,), daemon=True)
+                         for perfil in self._perfis]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def converter(self, caminho_docx, pasta_saida):
+        futuro = Future()
+        self._fila.put((caminho_docx, pasta_saida, futuro))
+        return futuro
+
+    def _proximo_lote(self):
+        tarefas = [self._fila.get()]
+        if tarefas[0] is None:
+            return None
+        while len(tarefas) < self.lote:
+            try:
+                tarefa = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            if tarefa is None:
+                self._fila.put(None)  # Devolve o sinal de parada para a próxima volta
+                break
+            tarefas.append(tarefa)
+        return tarefas
+
+    def _trabalhar(self, perfil):
+        while True:
+            tarefas = self._proximo_lote()
+            if tarefas is None:
+                return
+            por_pasta = {}
+            for caminho, pasta, futuro in tarefas:
+                por_pasta.setdefault(pasta, []).append((caminho, futuro))
+            for pasta, grupo in por_pasta.items():
+                try:
+                    pdfs = converter_com_soffice([c for c, _ in grupo], pasta, self.soffice, perfil)
+                except Exception as e:
+                    for _, futuro in grupo:
+                        futuro.set_exception(e)
+                else:
+                    for (_, futuro), pdf in zip(grupo, pdfs):
+                        futuro.set_result(pdf)
+
+    def fechar(self):
+        """Espera as conversões pendentes e encerra as instâncias"""
+        for _ in self._threads:
+            self._fila.put(None)
+        for thread in self._threads:
+            thread.join()
+        for perfil in self._perfis:
+            shutil.rmtree(perfil, ignore_errors=True)
+        self._threads = []
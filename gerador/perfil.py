@@ -0,0 +1,118 @@
+"""
+Perfil das etapas da proposta (ver proposta.ETAPAS)
+
+Para cada etapa registra o tempo, quantos blocos (parágrafos/tabelas) e
+elementos XML entraram no corpo do documento e a variação de memória medida
+pelo tracemalloc. Opcionalmente roda o cProfile em cada etapa e guarda as
+funções mais caras. O resultado sai em JSON:
+
+    perfil = PerfilEtapas()
+    montar_proposta(cliente, perfil=perfil)
+    perfil.salvar_json('perfil.json')
+
+`callback` recebe cada registro assim que a etapa termina (ex.: para enviar a
+um coletor de métricas sem esperar o documento inteiro).
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+class PerfilEtapas:
+    """Coleta tempo, elementos e memória por etapa"""
+
+    def __init__(self, callback=None, cprofile=False, memoria=True, limite_funcoes=10):
+        self.callback = callback
+        self.cprofile = cprofile
+        self.memoria = memoria
+        self.limite_funcoes = limite_funcoes
+        self.registros = []
+        self._iniciou_tracemalloc = False
+
+    @contextmanager
+    def etapa(self, nome, doc):
+        """Mede o bloco como a etapa `nome` do documento `doc`"""
+        corpo = doc.element.body
+        blocos = len(corpo)
+        elementos = _contar_elementos(corpo)
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+        memoria = tracemalloc.get_traced_memory()[0] if self.memoria else 0
+        perfilador = cProfile.Profile() if self.cprofile else None
+
+        if perfilador:
+            perfilador.enable()
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            if perfilador:
+                perfilador.disable()
+            registro = {
+                'etapa': nome,
+                'ms': round(segundos * 1000, 3),
+                'blocos': len(corpo) - blocos,
+                'elementos': _contar_elementos(corpo) - elementos,
+                'memoria_kb': (round((tracemalloc.get_traced_memory()[0] - memoria) / 1024, 1)
+                               if self.memoria else None),
+            }
+            if perfilador:
+                registro['funcoes'] = _funcoes_mais_caras(perfilador, self.limite_funcoes)
+            self.registros.append(registro)
+            if self.callback:
+                self.callback(registro)
+
+    def encerrar(self):
+        """Desliga o tracemalloc se foi o perfil que ligou"""
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+
+    def como_dict(self):
+        return {
+            'etapas': self.registros,
+            'total_ms': round(sum(r['ms'] for r in self.registros), 3),
+            'elementos': sum(r['elementos'] for r in self.registros),
+        }
+
+    def salvar_json(self, destino):
+        """Grava o perfil em `destino` (caminho, objeto de arquivo ou '-' para a saída padrão)"""
+        texto = json.dumps(self.como_dict(), ensure_ascii=False, indent=2)
+        if destino == '-':
+            print(texto)
+        elif hasattr(destino, 'write'):
+            destino.write(texto)
+        else:
+            with open(destino, 'w', encoding='utf-8') as f:
+                f.write(texto)
+
+    def imprimir(self, arquivo=None):
+        """Tabela resumida das etapas, da mais lenta para a mais rápida"""
+        arquivo = arquivo or sys.stdout
+        total = sum(r['ms'] for r in self.registros) or 1
+        print(f"{'etapa':<16}{'ms':>9}{'%':>7}{'blocos':>8}{'elementos':>11}{'memória (KB)':>14}",
+              file=arquivo)
+        for r in sorted(self.registros, key=lambda r: r['ms'], reverse=True):
+            memoria = f"{r['memoria_kb']:>14.1f}" if r['memoria_kb'] is not None else f"{'—':>14}"
+            print(f"{r['etapa']:<16}{r['ms']:>9.2f}{r['ms'] / total * 100:>6.1f}%"
+                  f"{r['blocos']:>8}{r['elementos']:>11}{memoria}", file=arquivo)
+
+def _contar_elementos(elemento):
+    return sum(1 for _ in elemento.iter())
+
+def _funcoes_mais_caras(perfilador, limite):
+    """Funções com maior tempo acumulado na etapa"""
+    estatisticas = pstats.Stats(perfilador).stats
+    ordenadas = sorted(estatisticas.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {'funcao': f'{os.path.basename(arquivo)}:{linha}({nome})', 'chamadas': chamadas,
+         'ms_proprio': round(proprio * 1000, 3), 'ms_acumulado': round(acumulado * 1000, 3)}
+        for (arquivo, linha, nome), (_, chamadas, proprio, acumulado, _) in ordenadas[:limite]
+    ]
@@ -0,0 +1,63 @@
+"""
+Preços da proposta calculados a partir das entradas
+
+Itens da tabela de mercado, total de mercado, manutenção ao longo de N meses,
+total do investimento e percentual de economia saem daqui, já formatados, para
+todos os formatos (.docx, HTML, Markdown, PDF); nenhum valor é digitado como
+texto. O cálculo é memorizado pela tupla de entradas (com o idioma, que muda a
+formatação): num lote, clientes com a mesma faixa de preço compartilham o
+mesmo resultado.
+"""
+
+from functools import lru_cache
+
+from gerador.conteudo import CAMINHO_PADRAO, carregar_conteudo
+from gerador.idiomas import IDIOMA_PADRAO, formatar_moeda, formatar_percentual, traduzir
+
+class Precos:
+    """Valores calculados de uma faixa de preço; `textos` traz os mesmos valores formatados"""
+    __slots__ = ('valor_sistema', 'valor_manutencao', 'meses', 'total_manutencao', 'total_investimento',
+                 'valor_mercado', 'economia', 'itens_mercado', 'textos')
+
+@lru_cache(maxsize=None)
+def itens_mercado(caminho=CAMINHO_PADRAO, idioma=IDIOMA_PADRAO):
+    """Linhas (item, detalhe, valor formatado) da tabela de mercado e o total de mercado"""
+    conteudo = carregar_conteudo(caminho, idioma)
+    linhas = []
+    for item in conteudo.mercado:
+        detalhe = item.detalhe
+        if item.quantidade is not None:
+            detalhe = detalhe.format(quantidade=f'{item.quantidade:g}',
+                                     valor_unitario=formatar_moeda(item.valor_unitario, idioma))
+        linhas.append((item.item, detalhe, formatar_moeda(item.valor, idioma)))
+    return tuple(linhas), conteudo.valor_mercado_total
+
+@lru_cache(maxsize=4096)
+def calcular_precos(valor_sistema, valor_manutencao, meses, caminho=CAMINHO_PADRAO, idioma=IDIOMA_PADRAO):
+    """Calcula (uma vez por combinação de entradas) os totais e a economia da proposta"""
+    linhas, valor_mercado = itens_mercado(caminho, idioma)
+    p = Precos()
+    p.valor_sistema = valor_sistema
+    p.valor_manutencao = valor_manutencao
+    p.meses = meses
+    p.total_manutencao = valor_manutencao * meses
+    p.total_investimento = valor_sistema + p.total_manutencao
+    p.valor_mercado = valor_mercado
+    p.economia = 1 - p.total_investimento / valor_mercado if valor_mercado else 0
+    p.itens_mercado = linhas
+    p.textos = {
+        'valor_sistema': formatar_moeda(valor_sistema, idioma),
+        'valor_manutencao': formatar_moeda(valor_manutencao, idioma),
+        'meses': str(meses),
+        'total_manutencao': formatar_moeda(p.total_manutencao, idioma),
+        'total_investimento': formatar_moeda(p.total_investimento, idioma),
+        'economia': formatar_percentual(p.economia, idioma),
+        'periodo': traduzir('/ano', idioma) if meses == 12 else '',
+        'valor_mercado': formatar_moeda(valor_mercado, idioma),
+    }
+    return p
+
+def precos_cliente(cliente):
+    """Preços de um cliente (dicionário já completado com CLIENTE_PADRAO)"""
+    return calcular_precos(cliente['valor_sistema'], cliente['valor_manutencao'], cliente['meses_manutencao'],
+                           idioma=cliente.get('idioma', IDIOMA_PADRAO))
@@ -0,0 +1,619 @@
+"""
+Geração da Proposta Comercial em formato Word (.docx)
+com formatação profissional e elegante
+
+Este módulo carrega python-docx e lxml; a linha de comando (gerador.cli) só o
+importa nos comandos que realmente montam documentos.
+"""
+
+import io
+import os
+from datetime import date
+
+from docx import Document
+from docx.shared import Pt, RGBColor, Inches, Twips
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.oxml import OxmlElement
+
+from gerador import graficos
+from gerador.conteudo import CAMPOS_CLIENTE, carregar_conteudo
+from gerador.idiomas import IDIOMA_PADRAO, formatar_data, formatar_mes_ano, traduzir
+from gerador.otimizacao import NIVEL_COMPRESSAO, salvar_otimizado
+from gerador.precos import formatar_moeda, itens_mercado, precos_cliente
+from gerador.tabelas import add_table_xml, largura_util
+
+# Dados do cliente usados quando o script roda sem manifesto
+CLIENTE_PADRAO = {
+    'nome': 'Igreja Batista Vilas do Atlântico',
+    'sigla': 'IBVA',
+    'data': date(2025, 10, 3),
+    'valor_sistema': 3000,
+    'valor_manutencao': 300,
+    'meses_manutencao': 12,
+    'modulos': ['financeiro', 'medico'],
+    'idioma': IDIOMA_PADRAO,
+}
+
+AZUL = RGBColor(23, 78, 166)
+AZUL_ESCURO = RGBColor(18, 58, 123)
+AMARELO = RGBColor(255, 214, 0)
+VERDE = RGBColor(40, 167, 69)
+CINZA = RGBColor(100, 100, 100)
+CINZA_CLARO = RGBColor(150, 150, 150)
+MARROM = RGBColor(133, 100, 4)
+BRANCO = RGBColor(255, 255, 255)
+
+CENTRO = WD_ALIGN_PARAGRAPH.CENTER
+JUSTIFICADO = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+# Estilos nomeados da proposta. São registrados uma vez no template e
+# aplicados por referência, em vez de repetir w:rPr em cada run.
+ESTILOS_PARAGRAFO = {
+    'CoverTitle': {'tamanho': 32, 'negrito': True, 'cor': AZUL, 'alinhamento': CENTRO, 'antes': 12, 'depois': 12},
+    'CoverSubtitle': {'tamanho': 16, 'cor': AZUL, 'alinhamento': CENTRO, 'antes': 12, 'depois': 12},
+    'CoverClient': {'tamanho': 20, 'negrito': True, 'cor': AMARELO, 'alinhamento': CENTRO, 'antes': 12, 'depois': 12},
+    'CoverDate': {'tamanho': 11, 'cor': CINZA, 'alinhamento': CENTRO},
+    'SectionTitle': {'tamanho': 18, 'negrito': True, 'cor': AZUL, 'antes': 18, 'depois': 12},
+    'Subsection': {'tamanho': 13, 'negrito': True, 'cor': AZUL_ESCURO, 'antes': 12, 'depois': 8},
+    'BodyJustified': {'tamanho': 11, 'alinhamento': JUSTIFICADO},
+    'BodySmall': {'tamanho': 10.5, 'alinhamento': JUSTIFICADO},
+    'Highlight': {'tamanho': 14, 'negrito': True, 'cor': AZUL, 'alinhamento': CENTRO},
+    'Callout': {'tamanho': 12, 'negrito': True, 'cor': AZUL, 'alinhamento': CENTRO},
+    'ModuleValue': {'negrito': True, 'cor': VERDE},
+    'FeatureItem': {'base': 'List Bullet', 'tamanho': 10.5, 'recuo': 0.3},
+    'BenefitItem': {'base': 'List Bullet', 'tamanho': 11, 'negrito': True, 'recuo': 0.3},
+    'TableHeader': {'tamanho': 11, 'negrito': True, 'cor': BRANCO},
+    'TableTotal': {'tamanho': 12, 'negrito': True, 'cor': AZUL_ESCURO},
+    'InfoBox': {'antes': 10, 'depois': 10, 'recuo': 0.2, 'recuo_direito': 0.2},
+    'NoteBox': {'tamanho': 11, 'cor': MARROM, 'alinhamento': JUSTIFICADO, 'antes': 12, 'depois': 12,
+                'recuo': 0.2, 'recuo_direito': 0.2},
+    'ThanksBox': {'tamanho': 11, 'cor': BRANCO, 'alinhamento': JUSTIFICADO, 'antes': 15, 'depois': 15,
+                  'recuo': 0.2, 'recuo_direito': 0.2},
+    'PriceBox': {'cor': AZUL_ESCURO, 'alinhamento': CENTRO, 'antes': 20, 'depois': 20},
+    'TotalBox': {'alinhamento': CENTRO, 'antes': 15, 'depois': 15},
+    'ContactText': {'tamanho': 11, 'alinhamento': CENTRO},
+    'FooterNote': {'tamanho': 9, 'cor': CINZA_CLARO, 'alinhamento': CENTRO},
+}
+
+ESTILOS_CARACTERE = {
+    'PriceLabel': {'tamanho': 14, 'negrito': True, 'cor': AZUL_ESCURO},
+    'PriceBig': {'tamanho': 36, 'negrito': True, 'cor': AZUL_ESCURO},
+    'PriceNote': {'tamanho': 11, 'cor': AZUL_ESCURO},
+    'PriceSmall': {'tamanho': 10, 'cor': AZUL_ESCURO},
+    'PriceMaintenance': {'tamanho': 16, 'negrito': True, 'cor': AZUL_ESCURO},
+    'TotalLabel': {'tamanho': 14, 'negrito': True, 'cor': AZUL},
+    'TotalBig': {'tamanho': 28, 'negrito': True, 'cor': AZUL_ESCURO},
+    'TotalNote': {'tamanho': 10, 'cor': CINZA},
+    'Savings': {'tamanho': 12, 'negrito': True, 'cor': VERDE},
+}
+
+# Tabelas de dados da proposta: cabeçalho azul com texto branco
+ESPEC_TABELA = {
+    'estilo': 'Light Grid Accent 1',
+    'fundo_cabecalho': '174ea6',
+    'estilo_cabecalho': 'TableHeader',
+}
+
+_template_bytes = None
+_ids_estilos = {}
+
+def _aplicar_fonte(fonte, spec):
+    """Copia tamanho, negrito e cor da especificação para a fonte do estilo"""
+    if 'tamanho' in spec:
+        fonte.size = Pt(spec['tamanho'])
+    if 'negrito' in spec:
+        fonte.bold = spec['negrito']
+    if 'cor' in spec:
+        fonte.color.rgb = spec['cor']
+
+def registrar_estilos(doc):
+    """Registra os estilos nomeados da proposta no documento"""
+    estilos = doc.styles
+    for nome, spec in ESTILOS_PARAGRAFO.items():
+        estilo = estilos.add_style(nome, WD_STYLE_TYPE.PARAGRAPH)
+        estilo.base_style = estilos[spec.get('base', 'Normal')]
+        _aplicar_fonte(estilo.font, spec)
+        formato = estilo.paragraph_format
+        if 'alinhamento' in spec:
+            formato.alignment = spec['alinhamento']
+        if 'antes' in spec:
+            formato.space_before = Pt(spec['antes'])
+        if 'depois' in spec:
+            formato.space_after = Pt(spec['depois'])
+        if 'recuo' in spec:
+            formato.left_indent = Inches(spec['recuo'])
+        if 'recuo_direito' in spec:
+            formato.right_indent = Inches(spec['recuo_direito'])
+    for nome, spec in ESTILOS_CARACTERE.items():
+        _aplicar_fonte(estilos.add_style(nome, WD_STYLE_TYPE.CHARACTER).font, spec)
+
+def carregar_template():
+    """Prepara o template uma única vez por processo: estilos nomeados e margens"""
+    global _template_bytes
+    if _template_bytes is None:
+        doc = Document()
+        registrar_estilos(doc)
+        for section in doc.sections:
+            section.top_margin = Inches(1)
+            section.bottom_margin = Inches(1)
+            section.left_margin = Inches(1)
+            section.right_margin = Inches(1)
+        _ids_estilos.update((estilo.name, estilo.style_id) for estilo in doc.styles)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        _template_bytes = buffer.getvalue()
+    return _template_bytes
+
+def style_id(name):
+    """Id do estilo no template, resolvido uma vez por processo
+    
+    Atribuir estilo pelo nome faz o python-docx percorrer todos os estilos do
+    documento a cada parágrafo; com o id a referência é gravada direto no XML.
+    """
+    if not _ids_estilos:
+        carregar_template()
+    return _ids_estilos[name]
+
+def add_styled_paragraph(container, text='', style=None):
+    """Adiciona parágrafo (no documento ou numa célula) com estilo nomeado"""
+    paragraph = container.add_paragraph(text)
+    if style:
+        paragraph._p.style = style_id(style)
+    return paragraph
+
+def add_styled_run(paragraph, text, style):
+    """Adiciona run com estilo de caractere nomeado"""
+    run = paragraph.add_run(text)
+    run._r.style = style_id(style)
+    return run
+
+def set_paragraph_style(paragraph, style):
+    """Aplica estilo nomeado a um parágrafo já existente"""
+    paragraph._p.style = style_id(style)
+
+def set_table_style(table, style):
+    """Aplica estilo de tabela pelo id"""
+    table._tbl.tblStyle_val = style_id(style)
+
+def novo_documento(template=None):
+    """Cria um documento a partir do template já carregado em memória"""
+    if template is None:
+        template = carregar_template()
+    return Document(io.BytesIO(template))
+
+def add_page_break(doc):
+    """Adiciona quebra de página"""
+    doc.add_page_break()
+
+def set_cell_background(cell, fill):
+    """Define cor de fundo de célula"""
+    shading_elm = OxmlElement('w:shd')
+    shading_elm.set(qn('w:fill'), fill)
+    cell._element.get_or_add_tcPr().append(shading_elm)
+
+def add_header(doc, cabecalho, campos):
+    """Adiciona cabeçalho com fundo azul"""
+    add_styled_paragraph(doc, cabecalho['titulo'].format_map(campos), 'CoverTitle')
+    doc.add_paragraph()
+    add_styled_paragraph(doc, cabecalho['subtitulo'].format_map(campos), 'CoverSubtitle')
+    doc.add_paragraph()
+    add_styled_paragraph(doc, campos['nome'], 'CoverClient')
+    doc.add_paragraph()
+    add_styled_paragraph(doc, cabecalho['data'].format_map(campos), 'CoverDate')
+    doc.add_paragraph('_' * 80)
+
+def add_section_title(doc, icon, title):
+    """Adiciona título de seção com ícone"""
+    add_styled_paragraph(doc, f'{icon} {title}', 'SectionTitle')
+
+def add_subsection_title(doc, title):
+    """Adiciona subtítulo"""
+    add_styled_paragraph(doc, title, 'Subsection')
+
+def add_info_box(doc, text, bg_color='F0F0F0'):
+    """Adiciona caixa de informação com fundo colorido"""
+    table = doc.add_table(rows=1, cols=1)
+    set_table_style(table, 'Light Grid')
+    cell = table.rows[0].cells[0]
+    cell.text = text
+    set_cell_background(cell, bg_color)
+    set_paragraph_style(cell.paragraphs[0], 'InfoBox')
+    
+    doc.add_paragraph()
+
+def textos_cliente(cliente):
+    """Devolve os campos variáveis do cliente já formatados para o documento"""
+    cliente = {**CLIENTE_PADRAO, **cliente}
+    data = cliente['data']
+    textos = {
+        'nome': cliente['nome'],
+        'sigla': cliente['sigla'],
+        'data': formatar_data(data, cliente['idioma']),
+        'mes_ano': formatar_mes_ano(data, cliente['idioma']),
+    }
+    # Valores calculados e formatados uma vez por faixa de preço (ver gerador.precos)
+    precos = precos_cliente(cliente)
+    textos.update((campo, precos.textos[campo]) for campo in CAMPOS_CLIENTE if campo in precos.textos)
+    return textos
+
+def grafico_investimento(cliente):
+    """Descrição do gráfico de barras mercado x proposta (ver gerador.graficos)"""
+    precos = precos_cliente(cliente)
+    idioma = cliente.get('idioma', IDIOMA_PADRAO)
+    return 'barras', {
+        'titulo': traduzir('Mercado x proposta', idioma),
+        'rotulos': [traduzir('Soluções de mercado', idioma),
+                    traduzir('Esta proposta (sistema + {meses} meses)', idioma).format(meses=precos.meses)],
+        'valores': [precos.valor_mercado, precos.total_investimento],
+        'textos': [precos.textos['valor_mercado'], precos.textos['total_investimento']],
+        'destaques': [1],
+    }
+
+def add_grafico(doc, tipo, dados):
+    """Gráfico do cache de gerador.graficos na largura útil da página"""
+    png = graficos.renderizar_grafico(tipo, dados)
+    doc.add_picture(io.BytesIO(png), width=Twips(largura_util(doc)))
+
+def preparar_proposta(cliente=None, textos=None):
+    """Resolve o conteúdo da proposta para um cliente, sem depender do formato
+    
+    Devolve o modelo de conteúdo, os módulos escolhidos, os campos formatados,
+    a função `texto` que preenche trechos do conteúdo e as linhas já montadas
+    das tabelas e listas. É a base comum dos renderizadores docx, HTML e Markdown.
+    `textos` substitui os valores formatados do cliente (usado para montar o
+    esqueleto com marcadores); a estrutura continua vindo de `cliente`.
+    """
+    cliente = {**CLIENTE_PADRAO, **(cliente or {})}
+    if textos is None:
+        textos = textos_cliente(cliente)
+    idioma = cliente['idioma']
+    conteudo = carregar_conteudo(idioma=idioma)
+    modulos = [conteudo.modulos[chave] for chave in cliente['modulos']]
+    linhas_mercado, valor_mercado = itens_mercado(idioma=idioma)
+    campos = {
+        **textos,
+        'valor_mercado': formatar_moeda(valor_mercado, idioma),
+        'versao': conteudo.versao,
+    }
+    
+    def texto(modelo, **extras):
+        """Preenche um trecho do conteúdo com os dados do cliente"""
+        return modelo.format_map({**campos, **extras})
+    
+    mercado = list(linhas_mercado)
+    mercado.append((conteudo.rotulo_total_mercado, '', campos['valor_mercado']))
+    
+    investimento = conteudo.investimento
+    if len(modulos) > 1:
+        inclui = texto(investimento['inclui']['varios'], quantidade=len(modulos))
+    elif modulos:
+        inclui = texto(investimento['inclui']['um'])
+    else:
+        inclui = texto(investimento['inclui']['nenhum'])
+    
+    inclusos = [
+        *conteudo.inclusos_sistema,
+        *[texto(conteudo.incluso_modulo, nome=modulo.nome) for modulo in modulos],
+        *conteudo.inclusos_servicos
+    ]
+    
+    etapa_modulo = conteudo.etapa_modulo
+    etapa_final = conteudo.etapa_final
+    cronograma = [
+        *[(etapa.fase, etapa.atividade, etapa.prazo) for etapa in conteudo.etapas],
+        *[(texto(etapa_modulo.fase, n=i), texto(etapa_modulo.atividade, atividade=modulo.atividade),
+           texto(etapa_modulo.prazo)) for i, modulo in enumerate(modulos, start=1)],
+        (texto(etapa_final.fase, inicio=len(modulos) + 1), texto(etapa_final.atividade),
+         texto(etapa_final.prazo))
+    ]
+    
+    return {
+        'conteudo': conteudo,
+        'idioma': idioma,
+        'modulos': modulos,
+        'campos': campos,
+        'texto': texto,
+        'mercado': mercado,
+        'inclui': inclui,
+        'inclusos': inclusos,
+        'cronograma': cronograma,
+        'grafico': grafico_investimento(cliente) if graficos.disponivel() else None,
+    }
+
+# Etapas da proposta, na ordem em que entram no documento (ver montar_proposta)
+ETAPAS = []
+
+def etapa(nome):
+    """Registra uma função (doc, proposta) como etapa da proposta"""
+    def registrar(funcao):
+        ETAPAS.append((nome, funcao))
+        return funcao
+    return registrar
+
+def add_secao(doc, proposta, chave):
+    """Título de seção vindo do conteúdo"""
+    secao = proposta['conteudo'].secoes[chave]
+    add_section_title(doc, secao.icone, proposta['texto'](secao.titulo))
+
+@etapa('cabecalho')
+def etapa_cabecalho(doc, proposta):
+    add_header(doc, proposta['conteudo'].cabecalho, proposta['campos'])
+    
+    doc.add_paragraph()
+
+@etapa('apresentacao')
+def etapa_apresentacao(doc, proposta):
+    conteudo = proposta['conteudo']
+    texto = proposta['texto']
+    add_secao(doc, proposta, 'apresentacao')
+    
+    add_styled_paragraph(doc, texto(conteudo.apresentacao['texto']), 'BodyJustified')
+    
+    # Stats
+    doc.add_paragraph()
+    add_styled_paragraph(doc, texto(conteudo.apresentacao['destaques']), 'Highlight')
+    
+    doc.add_paragraph()
+
+@etapa('funcionalidades')
+def etapa_funcionalidades(doc, proposta):
+    add_secao(doc, proposta, 'funcionalidades')
+    
+    for topico in proposta['conteudo'].funcionalidades:
+        add_subsection_title(doc, topico.titulo)
+        for item in topico.itens:
+            add_styled_paragraph(doc, item, 'FeatureItem')
+    
+    add_page_break(doc)
+
+@etapa('beneficios')
+def etapa_beneficios(doc, proposta):
+    conteudo = proposta['conteudo']
+    texto = proposta['texto']
+    add_secao(doc, proposta, 'beneficios')
+    
+    for beneficio in conteudo.beneficios:
+        add_styled_paragraph(doc, texto(beneficio), 'BenefitItem')
+    
+    # Tecnologias
+    add_secao(doc, proposta, 'tecnologias')
+    
+    tech_text = '\n\n'.join(f'{tec.area}: {tec.descricao}' for tec in conteudo.tecnologias)
+    add_styled_paragraph(doc, tech_text, 'BodySmall')
+    
+    add_page_break(doc)
+
+@etapa('mercado')
+def etapa_mercado(doc, proposta):
+    add_secao(doc, proposta, 'mercado')
+    
+    # Criar tabela (última linha em negrito, com fundo amarelo)
+    add_table_xml(doc, proposta['mercado'], {
+        **ESPEC_TABELA,
+        'cabecalho': proposta['conteudo'].cabecalho_mercado,
+        'destaque_ultima': {'fundo': 'FFD600', 'estilo': 'TableTotal'},
+    })
+    
+    # Gráfico mercado x proposta (só com matplotlib instalado)
+    if proposta['grafico']:
+        doc.add_paragraph()
+        add_grafico(doc, *proposta['grafico'])
+    
+    doc.add_paragraph()
+
+@etapa('bonus')
+def etapa_bonus(doc, proposta):
+    conteudo = proposta['conteudo']
+    texto = proposta['texto']
+    if proposta['modulos']:
+        add_secao(doc, proposta, 'bonus')
+        
+        add_styled_paragraph(doc, texto(conteudo.bonus['chamada']), 'Callout')
+    
+    for modulo in proposta['modulos']:
+        add_subsection_title(doc, modulo.titulo)
+        for item in modulo.itens:
+            add_styled_paragraph(doc, item, 'List Bullet')
+        
+        valor = formatar_moeda(modulo.valor_mercado, proposta['idioma'])
+        add_styled_paragraph(doc, texto(conteudo.bonus['rotulo_valor'], valor=valor), 'ModuleValue')
+    
+    add_page_break(doc)
+
+@etapa('nota_pessoal')
+def etapa_nota_pessoal(doc, proposta):
+    add_secao(doc, proposta, 'nota_pessoal')
+    
+    nota_table = doc.add_table(rows=1, cols=1)
+    cell = nota_table.rows[0].cells[0]
+    set_cell_background(cell, 'FFF3CD')
+    
+    nota_text = '\n\n'.join(proposta['texto'](paragrafo) for paragrafo in proposta['conteudo'].nota_pessoal)
+    
+    para = cell.paragraphs[0]
+    para.text = nota_text
+    set_paragraph_style(para, 'NoteBox')
+    
+    doc.add_paragraph()
+
+@etapa('investimento')
+def etapa_investimento(doc, proposta):
+    campos = proposta['campos']
+    texto = proposta['texto']
+    investimento = proposta['conteudo'].investimento
+    add_secao(doc, proposta, 'investimento')
+    
+    # Caixa de preço
+    price_table = doc.add_table(rows=1, cols=1)
+    price_cell = price_table.rows[0].cells[0]
+    set_cell_background(price_cell, 'FFD600')
+    
+    price_para = price_cell.paragraphs[0]
+    set_paragraph_style(price_para, 'PriceBox')
+    
+    # Título
+    add_styled_run(price_para, f"{texto(investimento['titulo'])}\n\n", 'PriceLabel')
+    
+    # Preço principal
+    add_styled_run(price_para, f"{campos['valor_sistema']}\n\n", 'PriceBig')
+    
+    # Descrição
+    add_styled_run(price_para, f"{texto(investimento['pagamento_unico'])}\n", 'PriceNote')
+    
+    add_styled_run(price_para, f"{proposta['inclui']}\n\n", 'PriceSmall')
+    
+    # Linha divisória (cor herdada do estilo PriceBox)
+    price_para.add_run('_' * 50 + '\n\n')
+    
+    # Manutenção
+    add_styled_run(price_para, f"{texto(investimento['manutencao'])}\n", 'PriceMaintenance')
+    add_styled_run(price_para, texto(investimento['periodo']), 'PriceNote')
+    
+    doc.add_paragraph()
+    
+    # Caixa de total
+    total_table = doc.add_table(rows=1, cols=1)
+    total_cell = total_table.rows[0].cells[0]
+    set_cell_background(total_cell, 'E7F3FF')
+    
+    total_para = total_cell.paragraphs[0]
+    set_paragraph_style(total_para, 'TotalBox')
+    
+    add_styled_run(total_para, f"{texto(investimento['total_titulo'])}\n\n", 'TotalLabel')
+    add_styled_run(total_para, f"{campos['total_investimento']}\n\n", 'TotalBig')
+    add_styled_run(total_para, f"{texto(investimento['total_composicao'])}\n\n", 'TotalNote')
+    add_styled_run(total_para, texto(investimento['economia']), 'Savings')
+    
+    doc.add_paragraph()
+    
+    add_page_break(doc)
+
+@etapa('inclusos')
+def etapa_inclusos(doc, proposta):
+    add_secao(doc, proposta, 'inclusos')
+    
+    for item in proposta['inclusos']:
+        add_styled_paragraph(doc, item, 'FeatureItem')
+
+@etapa('cronograma')
+def etapa_cronograma(doc, proposta):
+    conteudo = proposta['conteudo']
+    add_secao(doc, proposta, 'cronograma')
+    
+    add_table_xml(doc, proposta['cronograma'], {**ESPEC_TABELA, 'cabecalho': conteudo.cabecalho_cronograma})
+    
+    doc.add_paragraph()
+    
+    # Formas de pagamento
+    add_secao(doc, proposta, 'pagamento')
+    
+    pagamento_text = '\n\n'.join(proposta['texto'](linha) for linha in conteudo.pagamento)
+    add_styled_paragraph(doc, pagamento_text, 'BodyJustified')
+    
+    add_page_break(doc)
+
+@etapa('agradecimento')
+def etapa_agradecimento(doc, proposta):
+    add_secao(doc, proposta, 'agradecimento')
+    
+    agradecimento_table = doc.add_table(rows=1, cols=1)
+    agr_cell = agradecimento_table.rows[0].cells[0]
+    set_cell_background(agr_cell, '174ea6')
+    
+    agr_text = '\n\n'.join(proposta['texto'](paragrafo) for paragrafo in proposta['conteudo'].agradecimento)
+    
+    agr_para = agr_cell.paragraphs[0]
+    agr_para.text = agr_text
+    set_paragraph_style(agr_para, 'ThanksBox')
+    
+    doc.add_paragraph()
+
+@etapa('contato')
+def etapa_contato(doc, proposta):
+    conteudo = proposta['conteudo']
+    texto = proposta['texto']
+    add_secao(doc, proposta, 'contato')
+    
+    contato_text = '\n'.join(texto(linha) for linha in conteudo.contato)
+    add_styled_paragraph(doc, contato_text, 'ContactText')
+    
+    doc.add_paragraph()
+    doc.add_paragraph('_' * 80)
+    
+    # Rodapé
+    add_styled_paragraph(doc, texto(conteudo.rodape), 'FooterNote')
+
+def montar_proposta(cliente=None, template=None, textos=None, perfil=None):
+    """Monta o documento da proposta para um cliente e o retorna sem salvar
+    
+    O texto vem do modelo de conteúdo (gerador/conteudo_proposta.json), já
+    resolvido por preparar_proposta; cada seção é uma etapa registrada em
+    ETAPAS. Com `perfil` (ex.: gerador.perfil.PerfilEtapas) cada etapa roda
+    dentro de perfil.etapa(nome, doc), que mede tempo, elementos e memória.
+    """
+    
+    proposta = preparar_proposta(cliente, textos)
+    
+    # Margens e estilos nomeados já vêm prontos no template (ver carregar_template)
+    doc = novo_documento(template)
+    
+    for nome, funcao in ETAPAS:
+        if perfil is None:
+            funcao(doc, proposta)
+        else:
+            with perfil.etapa(nome, doc):
+                funcao(doc, proposta)
+    
+    return doc
+
+def proposta_em_bytes(cliente=None, perfil=None, nivel_compressao=NIVEL_COMPRESSAO):
+    """Gera a proposta em memória e retorna os bytes do .docx
+    
+    Sem `perfil` sai do esqueleto compilado (ver gerador.esqueleto), como no
+    modo lote; com perfil o documento é montado etapa por etapa. Nos dois
+    casos o pacote passa por gerador.otimizacao.
+    """
+    cliente = {**CLIENTE_PADRAO, **(cliente or {})}
+    if perfil is None:
+        from gerador import esqueleto
+        return esqueleto.renderizar(cliente, nivel_compressao)
+    return salvar_otimizado(montar_proposta(cliente, perfil=perfil), nivel=nivel_compressao)
+
+def escrever_proposta(destino, cliente=None, perfil=None, nivel_compressao=NIVEL_COMPRESSAO):
+    """Grava a proposta em `destino` e retorna o tamanho em bytes
+    
+    `destino` pode ser um caminho ou um objeto de arquivo aberto para escrita
+    (BytesIO, resposta HTTP, membro de um zip).
+    """
+    dados = proposta_em_bytes(cliente, perfil, nivel_compressao)
+    if hasattr(destino, 'write'):
+        destino.write(dados)
+    else:
+        pasta = os.path.dirname(destino)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(destino, 'wb') as f:
+            f.write(dados)
+    return len(dados)
+
+def create_proposta(cliente=None, perfil=None, caminho=None, nivel_compressao=NIVEL_COMPRESSAO):
+    """Cria o documento da proposta
+    
+    Sem `caminho` o arquivo vai para a pasta atual com o nome do cliente
+    (ex.: PROPOSTA_COMERCIAL_IBVA.docx).
+    """
+    from gerador.manifesto import nome_arquivo
+    
+    cliente = {**CLIENTE_PADRAO, **(cliente or {})}
+    filename = caminho or nome_arquivo(cliente)
+    tamanho = escrever_proposta(filename, cliente, perfil, nivel_compressao)
+    
+    print(f'✅ Proposta criada com sucesso!')
+    print(f'📄 Arquivo salvo em: {filename}')
+    print(f'📊 Tamanho: {tamanho / 1024:.0f} KB')
+    print(f'🎨 Formatação: Profissional e elegante')
+    idioma = cliente['idioma']
+    print(f"💰 Valor proposto: {formatar_moeda(cliente['valor_sistema'], idioma)} + "
+          f"{formatar_moeda(cliente['valor_manutencao'], idioma)}/mês")
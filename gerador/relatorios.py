@@ -0,0 +1,336 @@
+"""
+Relatórios mensais de uso, conflitos e inventário a partir das exportações do banco
+
+Os dados vêm de gerador.dados (SQLite ou CSVs) e o documento é escrito com
+gerador.streaming: as agregações do mês são feitas numa passada sobre o cursor
+e as listagens longas (inventário) vão direto do cursor para a tabela. Os
+indicadores (giro de estoque, horários de pico, tempo de aprovação) vêm de
+gerador.estatisticas quando o NumPy está instalado, e o gráfico de uso diário
+de gerador.graficos quando o matplotlib está. Números, meses e datas seguem o
+`idioma` pedido (gerador.idiomas); os rótulos do relatório são em português.
+"""
+
+import os
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+
+from gerador.conflitos import INTERVALO_MINIMO, STATUS_CONFIRMADOS, analisar_conflitos
+from gerador.dados import abrir_fonte, ler_numero
+from gerador.estatisticas import calcular_estatisticas, numpy_disponivel
+from gerador import graficos
+from gerador.idiomas import (IDIOMA_PADRAO, formatar_dia_mes, formatar_mes_ano, formatar_numero,
+                             formatar_percentual)
+from gerador.otimizacao import NIVEL_COMPRESSAO
+from gerador.streaming import DocumentoStream, pico_memoria_mb
+
+LIMITE_ESTOQUE_BAIXO = 0.2
+MAXIMO_ITENS = 20
+MAXIMO_HORARIOS = 6
+
+ESPEC_TABELA = {
+    'estilo': 'Light Grid Accent 1',
+    'fundo_cabecalho': '174ea6',
+    'estilo_cabecalho': 'TableHeader',
+}
+ESPEC_TOTAL = {**ESPEC_TABELA, 'destaque_ultima': {'fundo': 'FFD600', 'estilo': 'TableTotal'}}
+
+def periodo_do_mes(ano, mes):
+    """Intervalo [início, fim) do mês"""
+    inicio = date(ano, mes, 1)
+    fim = date(ano + 1, 1, 1) if mes == 12 else date(ano, mes + 1, 1)
+    return inicio, fim
+
+def _formatador(idioma):
+    """formatar_numero(valor, casas) com o idioma do relatório"""
+    return lambda valor, casas=0: formatar_numero(valor, idioma, casas)
+
+def formatar_horario(momento, idioma=IDIOMA_PADRAO):
+    return f'{formatar_dia_mes(momento, idioma)} {momento:%H:%M}' if momento else '—'
+
+def _horas(requisicao):
+    inicio, fim = requisicao['start_datetime'], requisicao['end_datetime']
+    if not inicio or not fim or fim <= inicio:
+        return 0.0
+    return (fim - inicio).total_seconds() / 3600
+
+def _descrever(requisicao):
+    return requisicao.get('event_name') or requisicao.get('department') or str(requisicao.get('id'))
+
+def analisar_requisicoes(requisicoes):
+    """Agrega o uso do mês numa passada sobre as requisições
+
+    Conflitos e quase-conflitos entre as requisições confirmadas saem de
+    gerador.conflitos (varredura por local).
+    """
+    por_local = defaultdict(lambda: [0, 0.0])
+    por_departamento = defaultdict(lambda: [0, 0])
+    por_status = Counter()
+    por_dia = defaultdict(lambda: [0, 0.0])
+    confirmadas = []
+
+    for requisicao in requisicoes:
+        local = requisicao.get('location') or 'Sem local'
+        status = (requisicao.get('status') or 'SEM STATUS').upper()
+        uso = por_local[local]
+        uso[0] += 1
+        uso[1] += _horas(requisicao)
+        departamento = por_departamento[requisicao.get('department') or 'Sem departamento']
+        departamento[0] += 1
+        departamento[1] += ler_numero(requisicao.get('expected_audience'))
+        por_status[status] += 1
+        if requisicao.get('date'):
+            dia = por_dia[requisicao['date']]
+            dia[0] += 1
+            dia[1] += _horas(requisicao)
+        if status in STATUS_CONFIRMADOS:
+            confirmadas.append(requisicao)
+
+    agenda = analisar_conflitos(confirmadas)
+    return {
+        'total': sum(por_status.values()),
+        'por_local': dict(por_local),
+        'por_departamento': dict(por_departamento),
+        'por_status': por_status,
+        'por_dia': dict(por_dia),
+        'conflitos': agenda['conflitos'],
+        'quase': agenda['quase'],
+    }
+
+def analisar_itens(itens):
+    """Quantidade e número de requisições por item no mês"""
+    quantidades = Counter()
+    requisicoes = defaultdict(set)
+    for item in itens:
+        nome = item.get('item_name') or str(item.get('inventory_id'))
+        quantidades[nome] += ler_numero(item.get('quantity_requested'))
+        requisicoes[nome].add(item.get('request_id'))
+    return [(nome, quantidade, len(requisicoes[nome])) for nome, quantidade in quantidades.most_common()]
+
+def _estoque_baixo(inventario, idioma=IDIOMA_PADRAO):
+    """Gera as linhas do inventário abaixo do limite de estoque, sem materializar a tabela"""
+    numero = _formatador(idioma)
+    for item in inventario:
+        total = ler_numero(item.get('quantity_total'))
+        disponivel = ler_numero(item.get('quantity_available'))
+        if total and disponivel / total <= LIMITE_ESTOQUE_BAIXO:
+            yield (item.get('name'), item.get('category') or 'GERAL', numero(disponivel),
+                   numero(total), formatar_percentual(disponivel / total, idioma))
+
+def _resumo_inventario(inventario):
+    """Itens, quantidade disponível e total por categoria"""
+    categorias = defaultdict(lambda: [0, 0, 0])
+    for item in inventario:
+        resumo = categorias[item.get('category') or 'GERAL']
+        resumo[0] += 1
+        resumo[1] += ler_numero(item.get('quantity_available'))
+        resumo[2] += ler_numero(item.get('quantity_total'))
+    return categorias
+
+def _linhas_pares(pares, idioma=IDIOMA_PADRAO):
+    """Linhas (local, reserva, outra reserva, minutos) das tabelas de conflitos"""
+    for local, a, b, minutos in pares:
+        yield (local, f"{_descrever(a)} ({formatar_horario(a['start_datetime'], idioma)}–"
+                      f"{a['end_datetime']:%H:%M})",
+               f"{_descrever(b)} ({formatar_horario(b['start_datetime'], idioma)}–{b['end_datetime']:%H:%M})",
+               f'{round(minutos)} min')
+
+def grafico_uso_diario(por_dia, inicio, fim, idioma=IDIOMA_PADRAO):
+    """Descrição do gráfico de linhas com requisições e horas reservadas por dia do período"""
+    dias = [inicio + timedelta(days=n) for n in range((fim - inicio).days)]
+    return 'linha', {
+        'titulo': 'Uso por dia',
+        'rotulos': [formatar_dia_mes(dia, idioma) for dia in dias],
+        'series': [('Requisições', [por_dia.get(dia, (0, 0.0))[0] for dia in dias]),
+                   ('Horas reservadas', [round(por_dia.get(dia, (0, 0.0))[1], 2) for dia in dias])],
+    }
+
+def escrever_conflitos(doc, conflitos, quase, periodo, idioma=IDIOMA_PADRAO):
+    """Seção "Conflitos e quase-conflitos" (ver gerador.conflitos)"""
+    minimo = round(INTERVALO_MINIMO.total_seconds() / 60)
+    doc.paragrafo('⚠️ Conflitos e Quase-Conflitos de Horário', 'SectionTitle')
+    doc.paragrafo(f"Reservas confirmadas ({', '.join(STATUS_CONFIRMADOS)}) no mesmo local. Conflito: "
+                  f'horários sobrepostos. Quase-conflito: menos de {minimo} minutos entre o fim de '
+                  'uma e o início da outra, a mesma regra usada pelo sistema ao aprovar.', 'BodyJustified')
+
+    doc.paragrafo('Conflitos', 'Subsection')
+    if conflitos:
+        doc.tabela(_linhas_pares(conflitos, idioma),
+                   {**ESPEC_TABELA, 'cabecalho': ('Local', 'Reserva', 'Conflita com', 'Sobreposição')})
+    else:
+        doc.paragrafo(f'✅ Nenhum conflito de horário entre reservas confirmadas {periodo}.', 'Highlight')
+
+    doc.paragrafo('Quase-conflitos', 'Subsection')
+    if quase:
+        doc.tabela(_linhas_pares(quase, idioma),
+                   {**ESPEC_TABELA, 'cabecalho': ('Local', 'Termina', 'Começa em seguida', 'Intervalo')})
+    else:
+        doc.paragrafo(f'✅ Todas as reservas {periodo} têm ao menos {minimo} minutos de intervalo.',
+                      'Highlight')
+
+def escrever_indicadores(doc, indicadores, periodo, idioma=IDIOMA_PADRAO):
+    """Seção "Indicadores" (ver gerador.estatisticas)"""
+    numero = _formatador(idioma)
+    doc.paragrafo('📈 Indicadores', 'SectionTitle')
+    doc.paragrafo(f"Calculados sobre {numero(indicadores['requisicoes'])} requisições e "
+                  f"{numero(indicadores['movimentacoes'])} movimentações de itens {periodo}.",
+                  'BodyJustified')
+
+    doc.paragrafo('Giro e utilização do estoque por categoria', 'Subsection')
+    categorias = indicadores['categorias']
+    if categorias:
+        doc.tabela([(categoria, numero(n), numero(total), numero(requisitado),
+                     f'{numero(giro, 2)}×', formatar_percentual(utilizacao, idioma, 1))
+                    for categoria, n, total, requisitado, giro, utilizacao in categorias],
+                   {**ESPEC_TABELA, 'cabecalho': ('Categoria', 'Itens', 'Estoque', 'Requisitado', 'Giro',
+                                                  'Utilização')})
+        doc.paragrafo('Giro: quantidade requisitada em reservas confirmadas sobre o estoque total. '
+                      'Utilização: horas-item reservadas sobre horas-item disponíveis no período.', 'BodySmall')
+    else:
+        doc.paragrafo('Inventário vazio na exportação.', 'BodySmall')
+
+    doc.paragrafo('Horários de pico', 'Subsection')
+    horarios = sorted((linha for linha in indicadores['horarios'] if linha[1] or linha[2]),
+                      key=lambda linha: (-linha[2], linha[0]))[:MAXIMO_HORARIOS]
+    if horarios:
+        doc.tabela([(f'{hora:02d}:00–{hora:02d}:59', numero(iniciadas), numero(ocupacao, 2))
+                    for hora, iniciadas, ocupacao in horarios],
+                   {**ESPEC_TABELA, 'cabecalho': ('Horário', 'Reservas iniciadas', 'Reservas simultâneas '
+                                                  '(média por dia)')})
+    else:
+        doc.paragrafo(f'Nenhuma reserva com horário {periodo}.', 'BodySmall')
+
+    doc.paragrafo('Tempo de aprovação', 'Subsection')
+    if indicadores['latencias']:
+        doc.tabela([(departamento, numero(n), numero(media, 1), numero(mediana, 1),
+                     numero(p90, 1))
+                    for departamento, n, media, mediana, p90 in
+                    indicadores['latencias'] + [indicadores['latencia_total']]],
+                   {**ESPEC_TOTAL, 'cabecalho': ('Departamento', 'Aprovadas', 'Média (h)', 'Mediana (h)',
+                                                 'p90 (h)')})
+    else:
+        doc.paragrafo(f'Nenhuma requisição com data de criação e de aprovação {periodo}.', 'BodySmall')
+
+def escrever_relatorio(doc, fonte, ano, mes, estatisticas=None, com_graficos=None, idioma=IDIOMA_PADRAO):
+    """Escreve as seções do relatório mensal num DocumentoStream e devolve os totais
+
+    `estatisticas`: inclui a seção de indicadores (None: só se o NumPy estiver instalado).
+    `com_graficos`: inclui o gráfico de uso diário (None: só se o matplotlib estiver instalado).
+    """
+    numero = _formatador(idioma)
+    inicio, fim = periodo_do_mes(ano, mes)
+    mes_ano = formatar_mes_ano(inicio, idioma)
+    uso = analisar_requisicoes(fonte.requisicoes(inicio, fim))
+    itens = analisar_itens(fonte.itens_requisitados(inicio, fim))
+
+    # ==================== CAPA ====================
+    doc.paragrafo('RELATÓRIO MENSAL', 'CoverTitle')
+    doc.paragrafo('Uso de espaços, conflitos de agenda e inventário', 'CoverSubtitle')
+    doc.paragrafo(mes_ano, 'CoverClient')
+    agora = datetime.now()
+    doc.paragrafo(f'Gerado em {formatar_dia_mes(agora, idioma)}/{agora.year} {agora:%H:%M}', 'CoverDate')
+    doc.paragrafo()
+
+    # ==================== RESUMO ====================
+    doc.paragrafo('📊 Resumo do Mês', 'SectionTitle')
+    doc.paragrafo(f"{uso['total']} requisições em {len(uso['por_local'])} local(is), "
+                  f"{len(uso['conflitos'])} conflito(s) de horário, {len(uso['quase'])} quase-conflito(s) "
+                  f"e {len(itens)} item(ns) de inventário requisitados.", 'BodyJustified')
+    doc.tabela([(status, numero(quantidade)) for status, quantidade in uso['por_status'].most_common()]
+               + [('TOTAL', numero(uso['total']))],
+               {**ESPEC_TOTAL, 'cabecalho': ('Status', 'Requisições')})
+
+    # ==================== USO POR LOCAL ====================
+    doc.paragrafo()
+    doc.paragrafo('🏛️ Uso dos Espaços', 'SectionTitle')
+    locais = {local: (0, 0.0) for local in (linha['name'] for linha in fonte.linhas('locations')
+                                            if str(linha.get('is_active', '1')).lower() not in ('0', 'false'))}
+    locais.update({local: tuple(valores) for local, valores in uso['por_local'].items()})
+    ordenados = sorted(locais.items(), key=lambda item: (-item[1][1], item[0]))
+    doc.tabela([(local, numero(quantidade), numero(horas, 1))
+                for local, (quantidade, horas) in ordenados]
+               + [('TOTAL', numero(uso['total']),
+                   numero(sum(horas for _, horas in locais.values()), 1))],
+               {**ESPEC_TOTAL, 'cabecalho': ('Local', 'Requisições', 'Horas reservadas')})
+    sem_uso = sum(1 for _, (quantidade, _) in ordenados if not quantidade)
+    if sem_uso:
+        doc.paragrafo(f'{sem_uso} local(is) ativo(s) sem nenhuma reserva no mês.', 'BodySmall')
+
+    if com_graficos is None:
+        com_graficos = graficos.disponivel()
+    if com_graficos:
+        doc.paragrafo()
+        doc.imagem(graficos.renderizar_grafico(*grafico_uso_diario(uso['por_dia'], inicio, fim, idioma)))
+
+    doc.paragrafo()
+    doc.paragrafo('Por departamento', 'Subsection')
+    doc.tabela([(departamento, numero(quantidade), numero(publico))
+                for departamento, (quantidade, publico) in
+                sorted(uso['por_departamento'].items(), key=lambda item: -item[1][0])],
+               {**ESPEC_TABELA, 'cabecalho': ('Departamento', 'Requisições', 'Público esperado')})
+
+    # ==================== CONFLITOS ====================
+    doc.quebra_pagina()
+    escrever_conflitos(doc, uso['conflitos'], uso['quase'], 'neste mês', idioma)
+
+    # ==================== INVENTÁRIO ====================
+    doc.paragrafo()
+    doc.paragrafo('📦 Inventário', 'SectionTitle')
+    doc.paragrafo(f'Itens mais requisitados em {mes_ano}', 'Subsection')
+    if itens:
+        doc.tabela([(nome, numero(quantidade), numero(vezes))
+                    for nome, quantidade, vezes in itens[:MAXIMO_ITENS]],
+                   {**ESPEC_TABELA, 'cabecalho': ('Item', 'Quantidade', 'Requisições')})
+    else:
+        doc.paragrafo('Nenhum item de inventário requisitado no mês.', 'BodySmall')
+
+    doc.paragrafo()
+    doc.paragrafo('Estoque por categoria', 'Subsection')
+    categorias = _resumo_inventario(fonte.linhas('inventory'))
+    linhas = [(categoria, numero(n), numero(disponivel), numero(total))
+              for categoria, (n, disponivel, total) in sorted(categorias.items())]
+    linhas.append(('TOTAL', *(numero(sum(valores[i] for valores in categorias.values()))
+                              for i in range(3))))
+    doc.tabela(linhas, {**ESPEC_TOTAL, 'cabecalho': ('Categoria', 'Itens', 'Disponível', 'Total')})
+
+    doc.paragrafo()
+    doc.paragrafo(f'Estoque baixo (até {round(100 * LIMITE_ESTOQUE_BAIXO)}% disponível)', 'Subsection')
+    doc.tabela(_estoque_baixo(fonte.linhas('inventory'), idioma),
+               {**ESPEC_TABELA, 'cabecalho': ('Item', 'Categoria', 'Disponível', 'Total', '%')})
+
+    if estatisticas is None:
+        estatisticas = numpy_disponivel()
+    if estatisticas:
+        doc.quebra_pagina()
+        escrever_indicadores(doc, calcular_estatisticas(fonte, inicio, fim), 'neste mês', idioma)
+
+    doc.paragrafo()
+    doc.paragrafo(f'Relatório gerado automaticamente | {mes_ano}', 'FooterNote')
+    return {'requisicoes': uso['total'], 'conflitos': len(uso['conflitos']), 'quase': len(uso['quase']),
+            'itens': len(itens)}
+
+def nome_relatorio(ano, mes):
+    return f'RELATORIO_MENSAL_{ano}_{mes:02d}.docx'
+
+def gerar_relatorio_mensal(origem, ano, mes, pasta_saida='relatorios', verboso=True, estatisticas=None,
+                           com_graficos=None, nivel_compressao=NIVEL_COMPRESSAO, idioma=IDIOMA_PADRAO):
+    """Gera o relatório de um mês a partir de uma exportação (SQLite ou pasta de CSVs)"""
+    os.makedirs(pasta_saida, exist_ok=True)
+    caminho = os.path.join(pasta_saida, nome_relatorio(ano, mes))
+    inicio = time.perf_counter()
+    fonte = abrir_fonte(origem)
+    try:
+        with DocumentoStream(caminho, nivel_compressao=nivel_compressao) as doc:
+            totais = escrever_relatorio(doc, fonte, ano, mes, estatisticas, com_graficos, idioma)
+    finally:
+        fonte.fechar()
+    totais.update(arquivo=caminho, segundos=time.perf_counter() - inicio)
+
+    if verboso:
+        print(f"✅ Relatório de {formatar_mes_ano(date(ano, mes, 1), idioma)} salvo em: {caminho}")
+        print(f"📊 {totais['requisicoes']} requisições | {totais['conflitos']} conflito(s) | "
+              f"{totais['quase']} quase-conflito(s) | {totais['itens']} item(ns) requisitados")
+        memoria = pico_memoria_mb()
+        rss = f' | pico de memória {memoria:.0f} MB' if memoria is not None else ''
+        print(f"⏱️ {totais['segundos']:.2f} s | {os.path.getsize(caminho) / 1024:.0f} KB{rss}")
+    return totais
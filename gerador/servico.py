@@ -0,0 +1,337 @@
+"""
+Serviço local de geração de documentos (HTTP sobre TCP ou socket Unix)
+
+Mantém python-docx, o template e os esqueletos carregados num pool de workers,
+então o frontend/backend pede uma proposta ou relatório e recebe os bytes do
+.docx sem abrir um processo Python por documento.
+
+    POST /proposta    corpo JSON com os dados do cliente (vazio = cliente padrão)
+    POST /relatorio   {"exportacao": "arquivo.db ou pasta", "mes": "AAAA-MM", "idioma": "pt_BR"}
+                      (dentro da pasta de --exportacoes; sem ela a rota fica desligada)
+    GET  /metricas    requisições, fila, rejeições e latências p50/p99 por rota
+    GET  /saude
+
+No máximo `workers` documentos são gerados ao mesmo tempo e no máximo `fila`
+pedidos esperam por uma vaga; além disso o serviço responde 503 com
+Retry-After em vez de acumular trabalho (backpressure). A resposta é escrita em
+blocos, esperando o cliente consumir cada um (writer.drain).
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from http import HTTPStatus
+from urllib.parse import quote
+
+from gerador.idiomas import IDIOMA_PADRAO, validar_idioma
+from gerador.lote import cpus_disponiveis
+
+TIPO_DOCX = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+TAMANHO_MAXIMO_CORPO = 1024 * 1024
+TAMANHO_BLOCO = 64 * 1024
+JANELA_LATENCIAS = 2048
+TEMPO_LIMITE_LEITURA = 30
+
+class Sobrecarga(Exception):
+    """Fila cheia: o pedido é recusado em vez de esperar"""
+
+class ErroHTTP(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+# ---------------------------------------------------------------------------
+# Trabalho feito nos workers (funções de módulo para poderem ir ao pool)
+
+def _aquecer_worker():
+    """Carrega o template e compila o esqueleto padrão antes do primeiro pedido"""
+    from gerador import proposta
+    proposta.carregar_template()
+    proposta.proposta_em_bytes()
+
+def relatorio_em_bytes(origem, ano, mes, idioma=IDIOMA_PADRAO):
+    """Bytes do .docx do relatório mensal, gerado em memória"""
+    import io
+    from gerador.dados import abrir_fonte
+    from gerador.relatorios import escrever_relatorio
+    from gerador.streaming import DocumentoStream
+
+    buffer = io.BytesIO()
+    fonte = abrir_fonte(origem)
+    try:
+        with DocumentoStream(buffer) as doc:
+            escrever_relatorio(doc, fonte, ano, mes, idioma=idioma)
+    finally:
+        fonte.fechar()
+    return buffer.getvalue()
+
+# ---------------------------------------------------------------------------
+
+def percentil(valores, p):
+    """Percentil pelo método do posto mais próximo; None sem amostras"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posto = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(posto) - 1]
+
+class ServicoDocumentos:
+    """Pool de workers com limite de concorrência, fila limitada e métricas"""
+
+    def __init__(self, workers=None, fila=None, threads=False, exportacoes=None):
+        self.workers = workers or cpus_disponiveis()
+        self.fila = self.workers * 4 if fila is None else fila
+        self.threads = threads
+        self.exportacoes = os.path.realpath(exportacoes) if exportacoes else None
+        self._executor = None
+        self._vagas = None
+        self._em_espera = 0
+        self._em_execucao = 0
+        self._inicio = time.monotonic()
+        self._latencias = {}
+        self._contadores = {'atendidas': 0, 'rejeitadas': 0, 'erros': 0}
+
+    def iniciar(self):
+        """Cria o pool e aquece todos os workers"""
+        self._vagas = asyncio.Semaphore(self.workers)
+        if self.threads:
+            _aquecer_worker()
+            self._executor = ThreadPoolExecutor(self.workers)
+        else:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_aquecer_worker)
+            # Sobe todos os processos agora, não no primeiro pico de pedidos
+            for futuro in [self._executor.submit(int) for _ in range(self.workers)]:
+                futuro.result()
+
+    def encerrar(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def executar(self, funcao, *args):
+        """Roda `funcao` no pool respeitando o limite de concorrência e a fila"""
+        if self._vagas.locked() and self._em_espera >= self.fila:
+            raise Sobrecarga()
+        self._em_espera += 1
+        try:
+            await self._vagas.acquire()
+        finally:
+            self._em_espera -= 1
+        self._em_execucao += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, funcao, *args)
+        finally:
+            self._em_execucao -= 1
+            self._vagas.release()
+
+    def registrar(self, rota, status, segundos):
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self._contadores['rejeitadas'] += 1
+        elif status >= 400:
+            self._contadores['erros'] += 1
+        else:
+            self._contadores['atendidas'] += 1
+            self._latencias.setdefault(rota, deque(maxlen=JANELA_LATENCIAS)).append(segundos)
+
+    def metricas(self):
+        rotas = {}
+        for rota, amostras in self._latencias.items():
+            rotas[rota] = {
+                'amostras': len(amostras),
+                'p50_ms': round(percentil(amostras, 50) * 1000, 2),
+                'p99_ms': round(percentil(amostras, 99) * 1000, 2),
+            }
+        return {
+            **self._contadores,
+            'workers': self.workers,
+            'executando': self._em_execucao,
+            'na_fila': self._em_espera,
+            'fila_maxima': self.fila,
+            'executor': 'threads' if self.threads else 'processos',
+            'ativo_ha_s': round(time.monotonic() - self._inicio, 1),
+            'latencias': rotas,
+        }
+
+    # -- rotas --------------------------------------------------------------
+
+    async def rota_proposta(self, corpo):
+        from gerador import proposta
+        from gerador.manifesto import nome_arquivo, normalizar_cliente
+
+        dados = _ler_json(corpo) if corpo.strip() else {}
+        if dados:
+            cliente = {**proposta.CLIENTE_PADRAO, **normalizar_cliente(dados, '(corpo do pedido)')}
+        else:
+            cliente = dict(proposta.CLIENTE_PADRAO)
+        conteudo = await self.executar(proposta.proposta_em_bytes, cliente)
+        return HTTPStatus.OK, TIPO_DOCX, conteudo, nome_arquivo(cliente)
+
+    def caminho_exportacao(self, origem):
+        """Caminho da exportação pedida, que precisa estar dentro da pasta de --exportacoes"""
+        if not self.exportacoes:
+            raise ErroHTTP(HTTPStatus.FORBIDDEN, 'Relatórios desligados: inicie o serviço com --exportacoes PASTA')
+        if not isinstance(origem, str) or not origem:
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, 'Campo "exportacao" obrigatório')
+        caminho = os.path.realpath(os.path.join(self.exportacoes, origem))
+        if os.path.commonpath([self.exportacoes, caminho]) != self.exportacoes:
+            raise ErroHTTP(HTTPStatus.FORBIDDEN, f'Exportação fora da pasta de exportações: {origem}')
+        return caminho
+
+    async def rota_relatorio(self, corpo):
+        from gerador.relatorios import nome_relatorio
+
+        dados = _ler_json(corpo)
+        origem = self.caminho_exportacao(dados.get('exportacao'))
+        mes = dados.get('mes') or date.today().strftime('%Y-%m')
+        try:
+            ano, mes = (int(parte) for parte in mes.split('-'))
+        except ValueError:
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, f'Mês inválido: {mes!r} (use AAAA-MM)') from None
+        idioma = dados.get('idioma', IDIOMA_PADRAO)
+        try:
+            validar_idioma(idioma)
+        except ValueError as e:
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, str(e)) from None
+        conteudo = await self.executar(relatorio_em_bytes, origem, ano, mes, idioma)
+        return HTTPStatus.OK, TIPO_DOCX, conteudo, nome_relatorio(ano, mes)
+
+    async def atender(self, metodo, caminho, corpo):
+        """Despacha o pedido; devolve (status, tipo, corpo, nome do arquivo)"""
+        rotas = {
+            ('POST', '/proposta'): self.rota_proposta,
+            ('POST', '/relatorio'): self.rota_relatorio,
+        }
+        if metodo == 'GET' and caminho == '/metricas':
+            return HTTPStatus.OK, 'application/json', _json(self.metricas()), None
+        if metodo == 'GET' and caminho == '/saude':
+            return HTTPStatus.OK, 'application/json', _json({'ok': True}), None
+        if (metodo, caminho) not in rotas:
+            if any(rota == caminho for _, rota in rotas):
+                raise ErroHTTP(HTTPStatus.METHOD_NOT_ALLOWED, f'Use POST em {caminho}')
+            raise ErroHTTP(HTTPStatus.NOT_FOUND, f'Rota desconhecida: {caminho}')
+        return await rotas[(metodo, caminho)](corpo)
+
+    # -- conexão ------------------------------------------------------------
+
+    async def conexao(self, reader, writer):
+        inicio = time.perf_counter()
+        caminho = None
+        try:
+            try:
+                metodo, caminho, corpo = await asyncio.wait_for(_ler_pedido(reader), TEMPO_LIMITE_LEITURA)
+                status, tipo, conteudo, nome = await self.atender(metodo, caminho, corpo)
+            except Sobrecarga:
+                status, tipo, nome = HTTPStatus.SERVICE_UNAVAILABLE, 'application/json', None
+                conteudo = _json({'erro': 'Fila cheia, tente novamente', 'na_fila': self._em_espera})
+            except ErroHTTP as e:
+                status, tipo, conteudo, nome = e.status, 'application/json', _json({'erro': str(e)}), None
+            except (ValueError, OSError) as e:
+                status, tipo, conteudo, nome = (HTTPStatus.BAD_REQUEST, 'application/json',
+                                                _json({'erro': str(e)}), None)
+            except Exception as e:
+                status, tipo, conteudo, nome = (HTTPStatus.INTERNAL_SERVER_ERROR, 'application/json',
+                                                _json({'erro': str(e)}), None)
+            await _responder(writer, status, tipo, conteudo, nome)
+            if caminho not in (None, '/metricas', '/saude'):
+                self.registrar(caminho, status, time.perf_counter() - inicio)
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass  # Cliente desistiu; nada a responder
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+def _json(dados):
+    return json.dumps(dados, ensure_ascii=False, default=str).encode('utf-8')
+
+def _ler_json(corpo):
+    try:
+        dados = json.loads(corpo or b'{}')
+    except ValueError as e:
+        raise ErroHTTP(HTTPStatus.BAD_REQUEST, f'JSON inválido: {e}') from None
+    if not isinstance(dados, dict):
+        raise ErroHTTP(HTTPStatus.BAD_REQUEST, 'Esperado um objeto JSON')
+    return dados
+
+async def _ler_pedido(reader):
+    """Linha de pedido, cabeçalhos e corpo (Content-Length) de um pedido HTTP/1.1"""
+    linha = (await reader.readline()).decode('latin-1').split()
+    if len(linha) != 3:
+        raise ErroHTTP(HTTPStatus.BAD_REQUEST, 'Pedido HTTP malformado')
+    metodo, alvo, _ = linha
+    cabecalhos = {}
+    while True:
+        cabecalho = (await reader.readline()).decode('latin-1').strip()
+        if not cabecalho:
+            break
+        nome, _, valor = cabecalho.partition(':')
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    tamanho = int(cabecalhos.get('content-length') or 0)
+    if tamanho > TAMANHO_MAXIMO_CORPO:
+        raise ErroHTTP(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Corpo do pedido grande demais')
+    corpo = await reader.readexactly(tamanho) if tamanho else b''
+    return metodo.upper(), alvo.split('?', 1)[0], corpo
+
+def content_disposition(nome):
+    """Cabeçalho de anexo: filename ASCII para clientes antigos e filename* em UTF-8 (RFC 5987)"""
+    ascii_ = unicodedata.normalize('NFKD', nome).encode('ascii', 'ignore').decode('ascii')
+    ascii_ = ''.join(c if c.isprintable() and c not in '"\\' else '_' for c in ascii_) or 'documento.docx'
+    return f"attachment; filename=\"{ascii_}\"; filename*=UTF-8''{quote(nome, safe='')}"
+
+async def _responder(writer, status, tipo, conteudo, nome=None):
+    cabecalhos = [
+        f'HTTP/1.1 {status.value} {status.phrase}',
+        f'Content-Type: {tipo}',
+        f'Content-Length: {len(conteudo)}',
+        'Connection: close',
+    ]
+    if nome:
+        cabecalhos.append(f'Content-Disposition: {content_disposition(nome)}')
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        cabecalhos.append('Retry-After: 1')
+    writer.write(('\r\n'.join(cabecalhos) + '\r\n\r\n').encode('latin-1'))
+    visao = memoryview(conteudo)
+    for inicio in range(0, len(visao), TAMANHO_BLOCO):
+        writer.write(visao[inicio:inicio + TAMANHO_BLOCO])
+        await writer.drain()
+    await writer.drain()
+
+async def servir(host='127.0.0.1', porta=8765, unix=None, workers=None, fila=None, threads=False,
+                 exportacoes=None):
+    """Sobe o serviço e atende até receber SIGINT/SIGTERM (Ctrl+C)"""
+    servico = ServicoDocumentos(workers, fila, threads, exportacoes)
+    servico.iniciar()
+    try:
+        if unix:
+            if os.path.exists(unix):
+                os.unlink(unix)
+            servidor = await asyncio.start_unix_server(servico.conexao, path=unix)
+            endereco = unix
+        else:
+            servidor = await asyncio.start_server(servico.conexao, host, porta)
+            endereco = f'http://{host}:{porta}'
+        print(f'🚀 Serviço de documentos em {endereco} '
+              f'({servico.workers} worker(s), fila de {servico.fila})', flush=True)
+
+        parar = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sinal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sinal, parar.set)
+            except NotImplementedError:
+                pass  # Windows: Ctrl+C chega como KeyboardInterrupt
+        async with servidor:
+            await parar.wait()
+        print('👋 Serviço encerrado', flush=True)
+    finally:
+        servico.encerrar()
+        if unix and os.path.exists(unix):
+            os.unlink(unix)
@@ -0,0 +1,230 @@
+"""
+Escrita de .docx em streaming para relatórios grandes
+
+O doc.save() do python-docx mantém a árvore inteira em memória e serializa tudo
+no fim. Aqui as partes fixas são copiadas do template e o word/document.xml é
+escrito direto no zip, pedaço por pedaço, à medida que as seções são produzidas:
+a memória fica estável seja qual for o tamanho do relatório. As partes sem uso
+do template e os estilos não referenciados ficam de fora (gerador.otimizacao).
+
+Uso:
+
+    with DocumentoStream('relatorio.docx') as doc:
+        doc.paragrafo('Relatório anual', 'SectionTitle')
+        doc.tabela(linhas_do_banco(), {'cabecalho': ('Item', 'Qtd')})
+        doc.imagem(png)
+"""
+
+import hashlib
+import io
+import os
+import re
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml.shape import CT_Inline
+from docx.shared import Twips
+from lxml import etree
+
+from gerador.otimizacao import (NIVEL_COMPRESSAO, descartavel, estilos_referenciados, gravar_parte,
+                                limpar_referencias, podar_estilos)
+from gerador.tabelas import iterar_tabela_xml, largura_util
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PARTE_DOCUMENTO = 'word/document.xml'
+PARTE_TIPOS = '[Content_Types].xml'
+PARTE_RELACOES = 'word/_rels/document.xml.rels'
+PARTE_RELACOES_PACOTE = '_rels/.rels'
+PARTE_ESTILOS = 'word/styles.xml'
+PARTE_NUMERACAO = 'word/numbering.xml'
+# Gravadas só no fechar: dependem das imagens, das partes descartadas e dos estilos usados
+ADIADAS = (PARTE_TIPOS, PARTE_RELACOES, PARTE_RELACOES_PACOTE, PARTE_ESTILOS)
+RELACAO_IMAGEM = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+TAMANHO_BUFFER = 64 * 1024
+QUEBRA_PAGINA = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+def pico_memoria_mb(filhos=False):
+    """Pico de memória residente (RSS) do processo, ou dos filhos já encerrados, em MB"""
+    if resource is None:
+        return None
+    uso = resource.getrusage(resource.RUSAGE_CHILDREN if filhos else resource.RUSAGE_SELF)
+    # ru_maxrss vem em KB no Linux e em bytes no macOS
+    return uso.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+def _dividir_corpo(xml):
+    """Separa o document.xml do template em abertura (até <w:body>) e fechamento (sectPr)"""
+    inicio = xml.index('<w:body>') + len('<w:body>')
+    fim = re.search(r'<w:sectPr[ >]', xml).start()
+    return xml[:inicio], xml[fim:]
+
+class DocumentoStream:
+    """Documento .docx gravado de forma incremental
+
+    As partes do template (numeração, tema...) são copiadas como estão; só o
+    corpo do documento é gerado. Os estilos são referenciados pelo nome, como
+    em add_styled_paragraph, e resolvidos para ids uma vez cada; no fechar o
+    styles.xml é gravado só com os que foram usados. Se uma exceção interrompe
+    o bloco with, o documento não é completado e o arquivo parcial é apagado.
+    """
+
+    def __init__(self, destino, template=None, compressao=zipfile.ZIP_DEFLATED,
+                 nivel_compressao=NIVEL_COMPRESSAO):
+        if template is None:
+            from gerador import proposta
+            template = proposta.carregar_template()
+
+        modelo = Document(io.BytesIO(template))
+        self._estilos = modelo.styles
+        self._ids = {}
+        self.largura = largura_util(modelo)
+        self.bytes_corpo = 0
+
+        self._adiadas = {}
+        self._removidas = set()
+        self._referencias = set()
+        self._imagens = {}
+        self._figuras = 0
+
+        self._destino = destino
+        self._zip = zipfile.ZipFile(destino, 'w', compressao, compresslevel=nivel_compressao)
+        with zipfile.ZipFile(io.BytesIO(template)) as z:
+            for info in z.infolist():
+                if info.filename == PARTE_DOCUMENTO:
+                    abertura, self._fechamento = _dividir_corpo(z.read(info).decode('utf-8'))
+                elif descartavel(info.filename):
+                    self._removidas.add(info.filename)
+                elif info.filename in ADIADAS:
+                    self._adiadas[info.filename] = (info, z.read(info).decode('utf-8'))
+                else:
+                    dados = z.read(info)
+                    if info.filename == PARTE_NUMERACAO:
+                        self._referencias |= estilos_referenciados(dados)
+                    gravar_parte(self._zip, info, dados)
+
+        self._parte = self._zip.open(PARTE_DOCUMENTO, 'w', force_zip64=True)
+        self._buffer = []
+        self._tamanho = 0
+        self.escrever(abertura)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        if tipo is None:
+            self.fechar()
+        else:
+            self.descartar()
+
+    def style_id(self, nome):
+        """Id do estilo no template (ex.: 'Light Grid Accent 1' -> 'LightGrid-Accent1')"""
+        if nome not in self._ids:
+            self._ids[nome] = self._estilos[nome].style_id
+        return self._ids[nome]
+
+    def escrever(self, xml):
+        """Acrescenta XML ao corpo, descarregando no zip a cada TAMANHO_BUFFER caracteres"""
+        self._buffer.append(xml)
+        self._tamanho += len(xml)
+        if self._tamanho >= TAMANHO_BUFFER:
+            self._descarregar()
+
+    def _descarregar(self):
+        dados = ''.join(self._buffer).encode('utf-8')
+        self._parte.write(dados)
+        self.bytes_corpo += len(dados)
+        self._buffer = []
+        self._tamanho = 0
+
+    def paragrafo(self, texto='', estilo=None):
+        """Parágrafo com estilo nomeado (equivalente a add_styled_paragraph)"""
+        ppr = f'<w:pPr><w:pStyle w:val="{self.style_id(estilo)}"/></w:pPr>' if estilo else ''
+        run = f'<w:r><w:t xml:space="preserve">{escape(str(texto))}</w:t></w:r>' if texto != '' else ''
+        self.escrever(f'<w:p>{ppr}{run}</w:p>')
+
+    def quebra_pagina(self):
+        self.escrever(QUEBRA_PAGINA)
+
+    def tabela(self, linhas, espec=None, colunas=None):
+        """Tabela gravada linha a linha; `linhas` pode ser um gerador (ex.: cursor do banco)"""
+        for pedaco in iterar_tabela_xml(linhas, espec, self.largura, self.style_id, colunas):
+            self.escrever(pedaco)
+
+    def imagem(self, png, largura=None, estilo=None):
+        """Imagem PNG num parágrafo próprio
+
+        A imagem é guardada pelo sha256 do conteúdo: repetida no documento, entra
+        uma vez só no pacote e as demais ocorrências apontam para ela. `largura`
+        em twips (padrão: largura útil); a altura segue a proporção do PNG.
+        """
+        from gerador.graficos import tamanho_png
+        chave = hashlib.sha256(png).hexdigest()[:16]
+        if chave not in self._imagens:
+            self._imagens[chave] = (f'rIdImagem{len(self._imagens) + 1}', png)
+        relacao = self._imagens[chave][0]
+
+        pixels_largura, pixels_altura = tamanho_png(png)
+        cx = Twips(largura or self.largura)
+        cy = int(cx * pixels_altura / pixels_largura)
+        self._figuras += 1
+        inline = CT_Inline.new_pic_inline(self._figuras, relacao, f'grafico-{chave}.png', cx, cy)
+        ppr = f'<w:pPr><w:pStyle w:val="{self.style_id(estilo)}"/></w:pPr>' if estilo else ''
+        self.escrever(f'<w:p>{ppr}<w:r><w:drawing>{etree.tostring(inline, encoding="unicode")}'
+                      '</w:drawing></w:r></w:p>')
+
+    def _gravar_imagens(self):
+        """Grava as imagens em word/media e as registra nos tipos e nas relações"""
+        relacoes = []
+        for chave, (relacao, png) in self._imagens.items():
+            self._zip.writestr(f'word/media/grafico-{chave}.png', png)
+            relacoes.append(f'<Relationship Id="{relacao}" Type="{RELACAO_IMAGEM}" '
+                            f'Target="media/grafico-{chave}.png"/>')
+
+        info, tipos = self._adiadas[PARTE_TIPOS]
+        if self._imagens and 'Extension="png"' not in tipos:
+            tipos = tipos.replace('</Types>', '<Default Extension="png" ContentType="image/png"/></Types>')
+        self._adiadas[PARTE_TIPOS] = (info, tipos)
+        info, xml = self._adiadas[PARTE_RELACOES]
+        self._adiadas[PARTE_RELACOES] = (info, xml.replace('</Relationships>',
+                                                           ''.join(relacoes) + '</Relationships>'))
+
+    def _gravar_adiadas(self):
+        """Tipos e relações sem as partes descartadas; estilos só com os usados"""
+        for nome, (info, xml) in self._adiadas.items():
+            dados = xml.encode('utf-8')
+            if nome == PARTE_ESTILOS:
+                dados = podar_estilos(dados, self._referencias | set(self._ids.values()))
+            else:
+                dados = limpar_referencias(nome, dados, self._removidas)
+            gravar_parte(self._zip, info, dados)
+        self._adiadas.clear()
+
+    def fechar(self):
+        """Grava o sectPr do template, as imagens, as partes adiadas e fecha o zip"""
+        if self._zip is None:
+            return
+        self.escrever(self._fechamento)
+        self._descarregar()
+        self._parte.close()
+        self._gravar_imagens()
+        self._gravar_adiadas()
+        self._zip.close()
+        self._zip = None
+
+    def descartar(self):
+        """Fecha sem completar o documento e apaga o arquivo parcial (erro no meio da escrita)"""
+        if self._zip is None:
+            return
+        self._parte.close()
+        self._zip.close()
+        self._zip = None
+        if isinstance(self._destino, (str, os.PathLike)):
+            try:
+                os.remove(self._destino)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,142 @@
+"""
+Construção rápida de tabelas direto em XML (w:tbl)
+
+O caminho do python-docx (add_table + row.cells[i].text + OxmlElement('w:shd'))
+reconstrói a lista de linhas e de células a cada acesso, o que fica quadrático
+em tabelas grandes. Aqui a tabela inteira é escrita como texto numa passada e
+convertida em elemento com um único parse do lxml.
+
+Especificação aceita (todas as chaves são opcionais):
+
+    {
+        'estilo': 'Light Grid Accent 1',       # estilo de tabela
+        'cabecalho': ('Item', 'Valor'),        # primeira linha
+        'fundo_cabecalho': '174ea6',           # cor de fundo do cabeçalho
+        'estilo_cabecalho': 'TableHeader',     # estilo de parágrafo do cabeçalho
+        'estilo_celula': None,                 # estilo de parágrafo das demais células
+        'destaque_ultima': {'fundo': 'FFD600', 'estilo': 'TableTotal'},
+    }
+"""
+
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu
+from docx.table import Table
+
+TBL_LOOK = ('<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+            'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>')
+
+def _runs(texto):
+    """Converte texto em runs; quebras de linha e tabulações viram w:br e w:tab"""
+    texto = '' if texto is None else str(texto)
+    if not texto:
+        return ''
+    partes = []
+    for i, linha in enumerate(texto.split('\n')):
+        if i:
+            partes.append('<w:br/>')
+        for j, trecho in enumerate(linha.split('\t')):
+            if j:
+                partes.append('<w:tab/>')
+            if trecho:
+                partes.append(f'<w:t xml:space="preserve">{escape(trecho)}</w:t>')
+    return f"<w:r>{''.join(partes)}</w:r>"
+
+def _abrir_celulas(larguras, fundo, estilo):
+    """Prefixos de cada célula de uma linha (tcPr + pPr), calculados uma vez por tipo de linha"""
+    shd = f'<w:shd w:val="clear" w:color="auto" w:fill="{fundo}"/>' if fundo else ''
+    ppr = f'<w:pPr><w:pStyle w:val="{estilo}"/></w:pPr>' if estilo else ''
+    return [f'<w:tc><w:tcPr><w:tcW w:w="{largura}" w:type="dxa"/>{shd}</w:tcPr><w:p>{ppr}'
+            for largura in larguras]
+
+def _linha(prefixos, valores, partes):
+    """Escreve uma w:tr em `partes`"""
+    if len(valores) != len(prefixos):
+        raise ValueError(f'Linha com {len(valores)} valores numa tabela de {len(prefixos)} colunas: {tuple(valores)!r}')
+    partes.append('<w:tr>')
+    for prefixo, valor in zip(prefixos, valores):
+        partes.append(prefixo)
+        partes.append(_runs(valor))
+        partes.append('</w:p></w:tc>')
+    partes.append('</w:tr>')
+
+def iterar_tabela_xml(linhas, espec, largura_total, style_id=lambda nome: nome.replace(' ', ''),
+                      colunas=None):
+    """Gera o XML de uma tabela (w:tbl) em pedaços, uma linha por vez
+
+    `linhas` pode ser qualquer iterável de tuplas (inclusive um gerador: nada é
+    materializado); `largura_total` vem em twips e `style_id` converte os nomes
+    de estilo da especificação em ids do documento. Sem cabeçalho e sem
+    `colunas`, o número de colunas vem da primeira linha; sem cabeçalho e sem
+    linhas, a tabela sai com uma linha vazia.
+    """
+    espec = espec or {}
+    cabecalho = espec.get('cabecalho')
+    linhas = iter(linhas)
+    primeira = next(linhas, None)
+    if not colunas:
+        colunas = len(cabecalho) if cabecalho else len(primeira or ()) or 1
+    larguras = [largura_total // colunas] * colunas
+
+    partes = [f'<w:tbl {nsdecls("w")}><w:tblPr>']
+    if espec.get('estilo'):
+        partes.append(f'<w:tblStyle w:val="{style_id(espec["estilo"])}"/>')
+    partes.append(f'<w:tblW w:w="0" w:type="auto"/>{TBL_LOOK}</w:tblPr><w:tblGrid>')
+    partes.extend(f'<w:gridCol w:w="{largura}"/>' for largura in larguras)
+    partes.append('</w:tblGrid>')
+
+    def estilo(nome):
+        return style_id(nome) if nome else None
+
+    if cabecalho:
+        _linha(_abrir_celulas(larguras, espec.get('fundo_cabecalho'), estilo(espec.get('estilo_cabecalho'))),
+               cabecalho, partes)
+    yield ''.join(partes)
+
+    comum = _abrir_celulas(larguras, None, estilo(espec.get('estilo_celula')))
+    destaque = espec.get('destaque_ultima')
+    # Uma linha de atraso: só se sabe qual é a última quando o iterável acaba
+    anterior = primeira
+    for valores in linhas:
+        partes = []
+        _linha(comum, anterior, partes)
+        yield ''.join(partes)
+        anterior = valores
+
+    partes = []
+    if anterior is not None:
+        if destaque:
+            prefixos = _abrir_celulas(larguras, destaque.get('fundo'),
+                                      estilo(destaque.get('estilo', espec.get('estilo_celula'))))
+        else:
+            prefixos = comum
+        _linha(prefixos, anterior, partes)
+    elif not cabecalho:
+        # O Word recusa w:tbl sem nenhuma w:tr
+        _linha(comum, ('',) * colunas, partes)
+    partes.append('</w:tbl>')
+    yield ''.join(partes)
+
+def montar_tabela_xml(linhas, espec, largura_total, style_id=lambda nome: nome.replace(' ', '')):
+    """Gera o XML completo de uma tabela (w:tbl) numa única string"""
+    espec = espec or {}
+    linhas = list(linhas)
+    colunas = None
+    if not espec.get('cabecalho'):
+        colunas = max((len(linha) for linha in linhas), default=1)
+    return ''.join(iterar_tabela_xml(linhas, espec, largura_total, style_id, colunas))
+
+def largura_util(doc):
+    """Largura útil da página (entre margens) em twips"""
+    secao = doc.sections[-1]
+    return Emu(secao.page_width - secao.left_margin - secao.right_margin).twips
+
+def add_table_xml(doc, linhas, espec=None):
+    """Adiciona ao fim do documento uma tabela montada direto em XML e retorna a Table"""
+    # Cada nome de estilo é resolvido uma vez por tabela, não uma vez por célula
+    tbl = parse_xml(montar_tabela_xml(linhas, espec, largura_util(doc),
+                                      lambda nome: doc.styles[nome].style_id))
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
@@ -0,0 +1,145 @@
+"""Acervo: guardar e restaurar .docx, deltas, PNGs e deduplicação"""
+
+import io
+import os
+import random
+import struct
+import zipfile
+import zlib
+
+import pytest
+
+from gerador.acervo import BRUTO, COMPLETO, DELTA, PNG, Acervo, expandir_png, recompor_png
+
+def chunk(tipo, corpo):
+    return struct.pack('>I', len(corpo)) + tipo + corpo + struct.pack('>I', zlib.crc32(tipo + corpo))
+
+def png(semente, largura=64, altura=64, nivel=6, mem_level=9, estrategia=zlib.Z_FILTERED, apagar_linha=None):
+    """PNG RGB sintético; com os parâmetros padrão, comprimido como o libpng do matplotlib"""
+    sorteio = random.Random(semente)
+    linhas = [b'\x00' + bytes(sorteio.choice((0, 128, 255)) for _ in range(3 * largura)) for _ in range(altura)]
+    if apagar_linha is not None:
+        linhas[apagar_linha] = bytes(1 + 3 * largura)
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, zlib.MAX_WBITS, mem_level, estrategia)
+    idat = compressor.compress(b''.join(linhas)) + compressor.flush()
+    cabecalho = struct.pack('>IIBBBBB', largura, altura, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', cabecalho)
+            + chunk(b'tEXt', b'Software\x00teste') + chunk(b'IDAT', idat) + chunk(b'IEND', b''))
+
+def documento_xml(valores):
+    paragrafos = ''.join(f'<w:p><w:r><w:t>Item {i}: R$ {valor},00</w:t></w:r></w:p>' for i, valor in enumerate(valores))
+    return f'<?xml version="1.0"?><w:document><w:body>{paragrafos}</w:body></w:document>'.encode()
+
+ESTILOS = b'<?xml version="1.0"?><w:styles>' + b''.join(
+    f'<w:style w:styleId="Estilo{i}"><w:name w:val="Estilo {i}"/></w:style>'.encode() for i in range(300)) + b'</w:styles>'
+
+def docx(valores, semente_grafico=0, grafico=None):
+    """Bytes de um .docx mínimo com as partes que o gerador produz"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml', b'<Types/>')
+        z.writestr('word/document.xml', documento_xml(valores))
+        z.writestr('word/styles.xml', ESTILOS)
+        z.writestr(zipfile.ZipInfo('word/media/image1.png', (2024, 3, 4, 10, 30, 0)),
+                   grafico if grafico is not None else png(semente_grafico))
+    return buffer.getvalue()
+
+def partes(dados):
+    with zipfile.ZipFile(io.BytesIO(dados)) as z:
+        return [(info.filename, info.date_time, z.read(info)) for info in z.infolist()]
+
+def tipo_objeto(acervo, chave):
+    with open(acervo._caminho_objeto(chave), 'rb') as f:
+        return f.read(2)
+
+def chave(manifesto, nome):
+    return next(parte[1] for parte in manifesto['partes'] if parte[0] == nome)
+
+VALORES = list(range(1000, 3000, 7))
+
+def test_guardar_e_restaurar_partes_identicas(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    originais = [docx(VALORES), docx(VALORES[:-1] + [1]), docx(VALORES + [5], semente_grafico=1)]
+    for dados in originais:
+        acervo.guardar(dados, 'PROPOSTA.docx')
+
+    assert [m['versao'] for m in acervo.versoes('PROPOSTA.docx')] == [1, 2, 3]
+    for versao, dados in enumerate(originais, 1):
+        assert partes(acervo.restaurar_bytes('PROPOSTA.docx', versao)) == partes(dados)
+    # Um acervo novo na mesma pasta lê o que foi gravado
+    assert partes(Acervo(str(tmp_path)).restaurar_bytes('PROPOSTA.docx')) == partes(originais[-1])
+
+def test_versoes_seguintes_viram_delta(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    primeira = acervo.guardar(docx(VALORES), 'PROPOSTA.docx')
+    segunda = acervo.guardar(docx(VALORES[:-1] + [1]), 'PROPOSTA.docx')
+
+    assert tipo_objeto(acervo, chave(primeira, 'word/document.xml'))[:1] == COMPLETO
+    assert tipo_objeto(acervo, chave(segunda, 'word/document.xml'))[:1] == DELTA
+    assert acervo.ler_parte(chave(segunda, 'word/document.xml')) == documento_xml(VALORES[:-1] + [1])
+
+def test_base_ausente_falha_em_vez_de_restaurar_errado(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    primeira = acervo.guardar(docx(VALORES), 'PROPOSTA.docx')
+    segunda = acervo.guardar(docx(VALORES[:-1] + [1]), 'PROPOSTA.docx')
+    base = chave(primeira, 'word/document.xml')
+    assert chave(segunda, 'word/document.xml') != base
+    os.remove(acervo._caminho_objeto(base))
+
+    with pytest.raises(FileNotFoundError):
+        Acervo(str(tmp_path)).restaurar_bytes('PROPOSTA.docx', 2)
+
+def test_objeto_corrompido_nao_confere(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    manifesto = acervo.guardar(docx(VALORES), 'PROPOSTA.docx')
+    caminho = acervo._caminho_objeto(chave(manifesto, '[Content_Types].xml'))
+    with open(caminho, 'wb') as f:
+        f.write(BRUTO + b'<Tipos/>')
+
+    with pytest.raises(ValueError, match='não confere'):
+        acervo.restaurar_bytes('PROPOSTA.docx')
+
+def test_png_reproduzivel_guarda_pixels():
+    original = png(3)
+    expandido = expandir_png(original)
+    assert expandido is not None
+    assert len(expandido) > len(original)
+    assert recompor_png(expandido) == original
+
+def test_png_com_outra_compressao_fica_como_veio(tmp_path):
+    # O nível 1 não está entre os parâmetros tentados: recomprimir não reproduz o arquivo
+    diferente = png(3, nivel=1, mem_level=8, estrategia=zlib.Z_DEFAULT_STRATEGY)
+    assert expandir_png(diferente) is None
+    assert expandir_png(b'nao e png') is None
+
+    acervo = Acervo(str(tmp_path))
+    manifesto = acervo.guardar(docx(VALORES, grafico=diferente), 'PROPOSTA.docx')
+    assert tipo_objeto(acervo, chave(manifesto, 'word/media/image1.png'))[:1] != PNG
+    assert partes(acervo.restaurar_bytes('PROPOSTA.docx')) == partes(docx(VALORES, grafico=diferente))
+
+def test_grafico_novo_vira_delta_dos_pixels(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    acervo.guardar(docx(VALORES, semente_grafico=1), 'PROPOSTA.docx')
+    # Mesmo gráfico com uma linha de pixels apagada
+    alterado = png(1, apagar_linha=40)
+    manifesto = acervo.guardar(docx(VALORES, grafico=alterado), 'PROPOSTA.docx')
+
+    assert tipo_objeto(acervo, chave(manifesto, 'word/media/image1.png')) == PNG + DELTA
+    assert acervo.ler_parte(chave(manifesto, 'word/media/image1.png')) == alterado
+
+def test_conteudo_igual_e_guardado_uma_vez(tmp_path):
+    acervo = Acervo(str(tmp_path))
+    primeira = acervo.guardar(docx(VALORES), 'PROPOSTA_IBVA.docx')
+    objetos = acervo.estatisticas()['objetos']
+
+    # Mesmo documento de novo: nenhuma versão nem objeto novo
+    assert acervo.guardar(docx(VALORES), 'PROPOSTA_IBVA.docx') == primeira
+    assert acervo.estatisticas()['objetos'] == objetos
+
+    # Outro documento com as mesmas partes fixas só acrescenta o document.xml
+    outro = acervo.guardar(docx(VALORES[:-1] + [1]), 'PROPOSTA_IBJ.docx')
+    assert chave(outro, 'word/styles.xml') == chave(primeira, 'word/styles.xml')
+    assert chave(outro, 'word/media/image1.png') == chave(primeira, 'word/media/image1.png')
+    estatisticas = acervo.estatisticas()
+    assert estatisticas['objetos'] == objetos + 1
+    assert (estatisticas['documentos'], estatisticas['versoes']) == (2, 2)
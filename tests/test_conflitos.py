@@ -0,0 +1,85 @@
+"""Varredura de conflitos de agenda comparada com a checagem de todos os pares"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from gerador.conflitos import INTERVALO_MINIMO, STATUS_CONFIRMADOS, analisar_conflitos
+
+INICIO = datetime(2024, 3, 4, 8, 0)
+STATUS = ('APTO', 'EXECUTADO', 'FINALIZADO', 'apto', 'PENDENTE', 'REJEITADO', 'CANCELADO', None)
+
+def todos_os_pares(requisicoes):
+    """Referência O(n²): cada par de reservas confirmadas do mesmo local"""
+    validas = [r for r in requisicoes
+               if (r.get('status') or '').upper() in STATUS_CONFIRMADOS and r['start_datetime'] < r['end_datetime']]
+    conflitos, quase = set(), set()
+    for i, a in enumerate(validas):
+        for b in validas[i + 1:]:
+            if (a.get('location') or 'Sem local') != (b.get('location') or 'Sem local'):
+                continue
+            local = a.get('location') or 'Sem local'
+            par = frozenset((a['id'], b['id']))
+            if a['start_datetime'] < b['end_datetime'] and b['start_datetime'] < a['end_datetime']:
+                sobreposicao = min(a['end_datetime'], b['end_datetime']) - max(a['start_datetime'], b['start_datetime'])
+                conflitos.add((local, par, sobreposicao.total_seconds() / 60))
+            else:
+                primeira, segunda = sorted((a, b), key=lambda r: r['start_datetime'])
+                intervalo = segunda['start_datetime'] - primeira['end_datetime']
+                if intervalo < INTERVALO_MINIMO:
+                    quase.add((local, par, intervalo.total_seconds() / 60))
+    return conflitos, quase
+
+def varredura(requisicoes):
+    resultado = analisar_conflitos(requisicoes)
+    conflitos = {(local, frozenset((a['id'], b['id'])), minutos) for local, a, b, minutos in resultado['conflitos']}
+    quase = {(local, frozenset((a['id'], b['id'])), minutos) for local, a, b, minutos in resultado['quase']}
+    # Nenhum par pode aparecer duas vezes
+    assert len(conflitos) == len(resultado['conflitos'])
+    assert len(quase) == len(resultado['quase'])
+    return conflitos, quase
+
+def reserva(id_, inicio, duracao, local='Templo', status='APTO'):
+    return {'id': id_, 'location': local, 'status': status,
+            'start_datetime': INICIO + timedelta(minutes=inicio),
+            'end_datetime': INICIO + timedelta(minutes=inicio + duracao)}
+
+def reservas_aleatorias(semente, quantidade):
+    sorteio = random.Random(semente)
+    # Horários em múltiplos de 5 minutos numa manhã: muitos empates e intervalos de 0, 10, 15 e 20 minutos
+    return [reserva(i, 5 * sorteio.randrange(48), 5 * sorteio.randrange(0, 13),
+                    sorteio.choice(('Templo', 'Salão', 'Sala 1', None)), sorteio.choice(STATUS))
+            for i in range(quantidade)]
+
+@pytest.mark.parametrize('semente', range(30))
+def test_varredura_igual_a_todos_os_pares(semente):
+    requisicoes = reservas_aleatorias(semente, 60)
+    assert varredura(requisicoes) == todos_os_pares(requisicoes)
+
+def test_limite_de_15_minutos():
+    requisicoes = [
+        reserva(1, 0, 60),
+        reserva(2, 60, 30),          # encosta em 1: intervalo 0 -> quase-conflito
+        reserva(3, 90 + 14, 30),     # 14 min depois de 2 -> quase-conflito
+        reserva(4, 134 + 15, 30),    # exatamente 15 min depois de 3 -> sem problema
+        reserva(5, 170, 10),         # sobrepõe 4 em 9 minutos
+    ]
+    conflitos, quase = varredura(requisicoes)
+    assert conflitos == {('Templo', frozenset((4, 5)), 9.0)}
+    assert quase == {('Templo', frozenset((1, 2)), 0.0), ('Templo', frozenset((2, 3)), 14.0)}
+    assert (conflitos, quase) == todos_os_pares(requisicoes)
+
+def test_so_status_confirmados():
+    requisicoes = [reserva(i, 0, 60, status=status) for i, status in enumerate(STATUS)]
+    conflitos, quase = varredura(requisicoes)
+    confirmadas = {i for i, status in enumerate(STATUS) if (status or '').upper() in STATUS_CONFIRMADOS}
+    assert confirmadas == {0, 1, 2, 3}
+    assert {id_ for _, par, _ in conflitos for id_ in par} == confirmadas
+    assert len(conflitos) == 6 and not quase
+
+def test_locais_diferentes_nao_conflitam():
+    requisicoes = [reserva(1, 0, 60, 'Templo'), reserva(2, 30, 60, 'Salão'), reserva(3, 65, 10, 'Salão')]
+    conflitos, quase = varredura(requisicoes)
+    assert conflitos == {('Salão', frozenset((2, 3)), 10.0)}
+    assert not quase
@@ -0,0 +1,50 @@
+"""Validação do modelo de conteúdo da proposta"""
+
+import copy
+import json
+
+import pytest
+
+from gerador.conteudo import CAMINHO_PADRAO, ConteudoInvalido, validar
+
+@pytest.fixture(scope='module')
+def dados():
+    with open(CAMINHO_PADRAO, encoding='utf-8') as f:
+        return json.load(f)
+
+def alterado(dados, alterar):
+    copia = copy.deepcopy(dados)
+    alterar(copia)
+    return copia
+
+def test_conteudo_padrao_e_valido(dados):
+    conteudo = validar(dados)
+    assert conteudo.modulos and conteudo.etapas
+
+def test_campo_com_erro_de_digitacao(dados):
+    def alterar(d):
+        d['agradecimento'][0] += ' {nome_clinete}'
+    with pytest.raises(ConteudoInvalido, match=r'conteudo\.agradecimento\[0\]: campo \{nome_clinete\}'):
+        validar(alterado(dados, alterar))
+
+def test_campo_extra_so_vale_no_proprio_trecho(dados):
+    def alterar(d):
+        d['secoes']['bonus']['titulo'] = 'Módulo {n}'
+    with pytest.raises(ConteudoInvalido, match=r'conteudo\.secoes\.bonus\.titulo'):
+        validar(alterado(dados, alterar))
+
+def test_detalhe_de_mercado_so_aceita_quantidade_e_valor_unitario(dados):
+    def alterar(d):
+        d['mercado']['itens'][0]['detalhe'] = 'Para a {sigla}'
+    with pytest.raises(ConteudoInvalido, match=r'conteudo\.mercado\.itens\[0\]\.detalhe'):
+        validar(alterado(dados, alterar))
+
+def test_chave_mal_formada(dados):
+    def alterar(d):
+        d['rodape'] = 'Versão {versao'
+    with pytest.raises(ConteudoInvalido, match='conteudo.rodape: chaves mal formadas'):
+        validar(alterado(dados, alterar))
+
+def test_campo_obrigatorio_ausente(dados):
+    with pytest.raises(ConteudoInvalido, match='conteudo.rodape: campo obrigatório ausente'):
+        validar(alterado(dados, lambda d: d.pop('rodape')))
@@ -0,0 +1,74 @@
+"""Esqueleto compilado: marcadores preenchidos igual ao documento montado do zero"""
+
+import io
+import os
+import re
+import zipfile
+
+import pytest
+
+from gerador import esqueleto, proposta
+from gerador.otimizacao import salvar_otimizado
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GERADOR_CACHE', str(tmp_path))
+    esqueleto.recarregar()
+    yield tmp_path
+    esqueleto.recarregar()
+
+def documento(dados):
+    with zipfile.ZipFile(io.BytesIO(dados)) as z:
+        return z.read('word/document.xml').decode('utf-8')
+
+def textos(xml):
+    return [re.sub('&amp;', '&', t) for t in re.findall(r'<w:t(?: [^>]*)?>([^<]*)</w:t>', xml)]
+
+@pytest.mark.parametrize('cliente', [
+    {},
+    {'nome': 'Igreja & Missão <Central>', 'sigla': 'IMC', 'valor_sistema': 4599.9, 'modulos': []},
+    {'idioma': 'en', 'modulos': ['financeiro']},
+])
+def test_mesmo_texto_que_o_documento_montado(cliente):
+    cliente = {**proposta.CLIENTE_PADRAO, **cliente}
+    direto = documento(salvar_otimizado(proposta.montar_proposta(cliente)))
+    compilado = documento(esqueleto.renderizar(cliente))
+    assert textos(compilado) == textos(direto)
+    assert '{{' not in compilado
+
+def test_marcadores_escapados():
+    xml = documento(esqueleto.renderizar({'nome': 'A & B <C>', 'sigla': 'AB'}))
+    assert 'A &amp; B &lt;C&gt;' in xml
+    assert 'A & B' not in xml
+
+def test_espaco_nas_pontas_preservado():
+    xml = documento(esqueleto.renderizar({'nome': '  Igreja Teste ', 'sigla': 'IT'}))
+    assert '<w:t xml:space="preserve">  Igreja Teste </w:t>' in xml
+    # O nome no meio de um parágrafo não muda as pontas do texto
+    assert re.search(r'<w:t>[^<]+da   Igreja Teste \.', xml)
+
+    sem_espaco = documento(esqueleto.renderizar({'nome': 'Igreja Teste', 'sigla': 'IT'}))
+    assert '<w:t>Igreja Teste</w:t>' in sem_espaco
+
+def test_fatiar_separa_texto_campos_e_atributo():
+    segmentos = esqueleto._fatiar('<w:p><w:t>Olá {{nome}}</w:t><w:t xml:space="preserve"> {{sigla}}</w:t></w:p>')
+    assert segmentos == ['<w:p><w:t', ('Olá ', 'nome', ''), '>Olá ', 'nome',
+                         '</w:t><w:t xml:space="preserve"> ', 'sigla', '</w:t></w:p>']
+    assert esqueleto._espaco(segmentos[1], {'nome': 'X '}) == esqueleto.ESPACO_PRESERVADO
+    assert esqueleto._espaco(segmentos[1], {'nome': 'X'}) == ''
+
+def test_esqueleto_fica_no_cache_e_versoes_antigas_saem(cache):
+    antigo = cache / 'esqueleto-0000000000000000-pt_BR-financeiro_medico.docx'
+    antigo.write_bytes(b'velho')
+    outro_idioma = cache / 'esqueleto-0000000000000000-en-sem_modulos.docx'
+    outro_idioma.write_bytes(b'velho')
+
+    primeiro = esqueleto.renderizar({})
+    nomes = os.listdir(cache)
+    assert f'esqueleto-{esqueleto.versao_template()}-pt_BR-financeiro_medico.docx' in nomes
+    assert antigo.name not in nomes
+    assert outro_idioma.name in nomes  # Cada idioma limpa só os seus
+
+    # Outro processo (memória vazia) lê o esqueleto do disco e gera o mesmo documento
+    esqueleto.recarregar()
+    assert documento(esqueleto.renderizar({})) == documento(primeiro)
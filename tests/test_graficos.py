@@ -0,0 +1,47 @@
+"""Cache de gráficos em memória e em disco"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from gerador import graficos
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GERADOR_CACHE', str(tmp_path))
+    monkeypatch.setattr(graficos, '_memoria', graficos.OrderedDict())
+    monkeypatch.setattr(graficos, '_gravados', 0)
+    monkeypatch.setattr(graficos, 'estatisticas', {'renderizados': 0, 'memoria': 0, 'disco': 0})
+    return tmp_path / 'graficos'
+
+def barras(valor):
+    return 'barras', {'rotulos': ['Mercado', 'Proposta'], 'valores': [50900, valor]}
+
+def test_mesma_descricao_renderiza_uma_vez(cache):
+    png = graficos.renderizar_grafico(*barras(3000))
+    assert png.startswith(b'\x89PNG')
+    assert graficos.renderizar_grafico(*barras(3000)) is png
+    graficos._memoria.clear()
+    assert graficos.renderizar_grafico(*barras(3000)) == png
+    assert graficos.estatisticas == {'renderizados': 1, 'memoria': 1, 'disco': 1}
+    assert [nome.startswith(f'grafico-{graficos.versao_graficos()}-') for nome in os.listdir(cache)] == [True]
+
+def test_poda_outras_versoes_e_os_menos_usados(cache, monkeypatch):
+    monkeypatch.setattr(graficos, 'MAXIMO_DISCO', 4)
+    cache.mkdir()
+    (cache / 'grafico-versaoantiga-abc.png').write_bytes(b'png antigo')
+    (cache / 'abc.png').write_bytes(b'formato antigo')
+
+    graficos.renderizar_grafico(*barras(1000))
+    assert len(os.listdir(cache)) == 1
+
+    for valor in range(2000, 7000, 1000):
+        graficos.renderizar_grafico(*barras(valor))
+        time.sleep(0.01)  # mtimes distintos
+    # Com limite 4 a poda roda a cada gravação e os mais antigos saem primeiro
+    def nome(valor):
+        return f'grafico-{graficos.versao_graficos()}-{graficos.chave_grafico(*barras(valor))}.png'
+    assert sorted(os.listdir(cache)) == sorted(nome(valor) for valor in range(3000, 7000, 1000))
@@ -0,0 +1,73 @@
+"""Idiomas: formatação de números e datas e catálogos gettext"""
+
+import datetime
+import gettext
+
+import pytest
+
+from gerador import idiomas
+from gerador.idiomas import (caminho_catalogo, compilar_mo, escrever_po, formatar_data, formatar_dia_mes,
+                             formatar_mes_ano, formatar_moeda, formatar_numero, formatar_percentual,
+                             ler_po, mensagens, traduzir, validar_idioma)
+
+DATA = datetime.date(2025, 10, 3)
+
+@pytest.mark.parametrize('idioma, esperado', [
+    ('pt_BR', ('1.234.567', '1.234,57', 'R$ 3.000', 'R$ 2.999,90', '87%', '87,5%')),
+    ('es', ('1.234.567', '1.234,57', 'R$ 3.000', 'R$ 2.999,90', '87 %', '87,5 %')),
+    ('en', ('1,234,567', '1,234.57', 'R$3,000', 'R$2,999.90', '87%', '87.5%')),
+])
+def test_numeros(idioma, esperado):
+    assert (formatar_numero(1234567, idioma), formatar_numero(1234.567, idioma, 2),
+            formatar_moeda(3000, idioma), formatar_moeda(2999.9, idioma),
+            formatar_percentual(0.87, idioma), formatar_percentual(0.875, idioma, 1)) == esperado
+
+def test_moeda_arredonda_centavos():
+    assert formatar_moeda(2999.999) == 'R$ 3.000'
+    assert formatar_moeda(0.1 + 0.2) == 'R$ 0,30'
+
+@pytest.mark.parametrize('idioma, esperado', [
+    ('pt_BR', ('03 de Outubro de 2025', 'Outubro 2025', '03/10')),
+    ('es', ('3 de octubre de 2025', 'octubre de 2025', '03/10')),
+    ('en', ('October 3, 2025', 'October 2025', '10/03')),
+])
+def test_datas(idioma, esperado):
+    assert (formatar_data(DATA, idioma), formatar_mes_ano(DATA, idioma), formatar_dia_mes(DATA, idioma)) == esperado
+
+def test_idioma_desconhecido():
+    assert validar_idioma('es') == 'es'
+    with pytest.raises(ValueError, match='pt_BR, es, en'):
+        validar_idioma('fr')
+
+def test_mo_compilado_lido_pelo_gettext(tmp_path):
+    caminho = tmp_path / 'gerador.mo'
+    compilar_mo({'Proposta': 'Propuesta', 'Ação "já"\n': 'Acción «ya»\n', 'Sem tradução': ''}, str(caminho))
+    with open(caminho, 'rb') as f:
+        traducoes = gettext.GNUTranslations(f)
+    assert traducoes.gettext('Proposta') == 'Propuesta'
+    assert traducoes.gettext('Ação "já"\n') == 'Acción «ya»\n'
+    assert traducoes.gettext('Sem tradução') == 'Sem tradução'
+    assert traducoes.charset() == 'UTF-8'
+
+def test_po_grava_e_le_as_mesmas_traducoes(tmp_path):
+    caminho = str(tmp_path / 'es' / 'gerador.po')
+    primeira = mensagens()[0]
+    escrever_po(caminho, 'es', {primeira: 'Traducción "con" comillas\ny salto'})
+    lidas = ler_po(caminho)
+    assert lidas[primeira] == 'Traducción "con" comillas\ny salto'
+    assert set(lidas) == {'', *mensagens()}
+    assert 'Language: es' in lidas['']
+
+@pytest.mark.parametrize('idioma', ['es', 'en'])
+def test_catalogos_do_repositorio_compilados(idioma, tmp_path):
+    # O .mo versionado tem que corresponder ao .po (python -m gerador.idiomas depois de editar)
+    compilado = tmp_path / 'gerador.mo'
+    compilar_mo(ler_po(caminho_catalogo(idioma, 'po')), str(compilado))
+    with open(caminho_catalogo(idioma), 'rb') as f:
+        assert f.read() == compilado.read_bytes()
+
+def test_traduzir_usa_o_catalogo_do_idioma():
+    idiomas.recarregar()
+    assert traduzir('Mercado x proposta') == 'Mercado x proposta'
+    assert traduzir('Mercado x proposta', 'en') != 'Mercado x proposta'
+    assert idiomas.versao_catalogo('en') != idiomas.versao_catalogo('es')
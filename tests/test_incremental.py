@@ -0,0 +1,64 @@
+"""Geração incremental: propostas sem mudanças não são refeitas"""
+
+import os
+
+import pytest
+
+from gerador import esqueleto, incremental
+from gerador.lote import gerar_lote
+from gerador.proposta import CLIENTE_PADRAO
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GERADOR_CACHE', str(tmp_path / 'cache'))
+    esqueleto.recarregar()
+    yield
+    esqueleto.recarregar()
+
+def clientes():
+    return [{**CLIENTE_PADRAO, 'nome': 'Igreja Um', 'sigla': 'IU'},
+            {**CLIENTE_PADRAO, 'nome': 'Igreja Dois', 'sigla': 'ID', 'modulos': ['financeiro']}]
+
+def pulados(resultados):
+    return [os.path.basename(r['arquivo']) for r in resultados if r.get('pulado')]
+
+def test_segunda_rodada_nao_refaz_nada(tmp_path):
+    saida = str(tmp_path / 'saida')
+    primeira, _ = gerar_lote(clientes(), saida, verboso=False)
+    assert pulados(primeira) == []
+    estados = {r['arquivo']: os.stat(r['arquivo']).st_mtime_ns for r in primeira}
+
+    segunda, _ = gerar_lote(clientes(), saida, verboso=False)
+    assert pulados(segunda) == ['PROPOSTA_COMERCIAL_IU.docx', 'PROPOSTA_COMERCIAL_ID.docx']
+    assert {r['arquivo']: os.stat(r['arquivo']).st_mtime_ns for r in segunda} == estados
+    assert os.path.exists(os.path.join(saida, incremental.NOME_MANIFESTO))
+
+def test_so_o_cliente_alterado_e_refeito(tmp_path):
+    saida = str(tmp_path / 'saida')
+    gerar_lote(clientes(), saida, verboso=False)
+    alterados = clientes()
+    alterados[1]['valor_sistema'] = 4500
+
+    resultados, _ = gerar_lote(alterados, saida, verboso=False)
+    assert pulados(resultados) == ['PROPOSTA_COMERCIAL_IU.docx']
+    # E a rodada seguinte já conhece a nova assinatura
+    assert len(pulados(gerar_lote(alterados, saida, verboso=False)[0])) == 2
+
+def test_arquivo_mexido_ou_apagado_e_refeito(tmp_path):
+    saida = str(tmp_path / 'saida')
+    resultados, _ = gerar_lote(clientes(), saida, verboso=False)
+    with open(resultados[0]['arquivo'], 'ab') as f:
+        f.write(b'editado')
+    os.remove(resultados[1]['arquivo'])
+
+    assert pulados(gerar_lote(clientes(), saida, verboso=False)[0]) == []
+
+def test_nivel_de_compressao_entra_na_assinatura(tmp_path):
+    saida = str(tmp_path / 'saida')
+    gerar_lote(clientes(), saida, verboso=False)
+    assert pulados(gerar_lote(clientes(), saida, verboso=False, nivel_compressao=1)[0]) == []
+
+def test_forcar_refaz_tudo(tmp_path):
+    saida = str(tmp_path / 'saida')
+    gerar_lote(clientes(), saida, verboso=False)
+    assert pulados(gerar_lote(clientes(), saida, verboso=False, forcar=True)[0]) == []
@@ -0,0 +1,22 @@
+"""Sigla e validação de clientes do manifesto"""
+
+import pytest
+
+from gerador.manifesto import gerar_sigla, normalizar_cliente
+
+@pytest.mark.parametrize('nome, sigla', [
+    ('Igreja Batista Vida Abundante', 'IBVA'),
+    ('Igreja Batista de Vila Alta', 'IBVA'),
+    ('igreja batista vida abundante', 'IBVA'),
+    ('3ª igreja batista', '3IB'),
+])
+def test_gerar_sigla(nome, sigla):
+    assert gerar_sigla(nome) == sigla
+
+def test_sigla_informada_tem_prioridade():
+    assert normalizar_cliente({'nome': 'igreja x', 'sigla': 'IGX'})['sigla'] == 'IGX'
+    assert normalizar_cliente({'nome': 'igreja x', 'sigla': '  '})['sigla'] == 'IX'
+
+def test_sem_sigla_possivel_e_erro():
+    with pytest.raises(ValueError, match='sigla.*linha 3'):
+        normalizar_cliente({'nome': '— ...'}, '(linha 3)')
@@ -0,0 +1,108 @@
+"""Otimização do .docx: partes descartáveis, estilos sem uso e runs juntados"""
+
+import io
+import zipfile
+
+import pytest
+from docx import Document
+
+from gerador.otimizacao import juntar_runs, otimizar_arquivo, otimizar_docx, podar_estilos
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+def salvo(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def parte(dados, nome):
+    with zipfile.ZipFile(io.BytesIO(dados)) as z:
+        return z.read(nome).decode('utf-8')
+
+def documento():
+    doc = Document()
+    doc.add_paragraph('Título', 'Heading 1')
+    paragrafo = doc.add_paragraph()
+    paragrafo.add_run('Olá ')
+    paragrafo.add_run('mundo')
+    paragrafo.add_run('!').bold = True
+    return doc
+
+def test_estilos_sem_uso_saem_e_usados_ficam():
+    estatisticas = {}
+    dados = otimizar_docx(salvo(documento()), estatisticas=estatisticas)
+    estilos = parte(dados, 'word/styles.xml')
+
+    assert 'w:styleId="Heading1"' in estilos
+    assert 'w:styleId="Normal"' in estilos  # Padrão e base do Heading 1
+    assert 'w:styleId="Heading1Char"' in estilos  # Ligado por w:link
+    assert 'w:styleId="Heading9"' not in estilos
+    assert '<w:latentStyles' not in estilos
+    antes, depois = estatisticas['estilos']
+    assert depois < antes
+    # O documento continua abrindo com os estilos certos
+    assert Document(io.BytesIO(dados)).paragraphs[0].style.name == 'Heading 1'
+
+def test_estilo_citado_fora_do_document_xml_fica():
+    estilos = (f'<w:styles {W}><w:style w:styleId="Normal" w:default="1"/>'
+               '<w:style w:styleId="Base"/><w:style w:styleId="Nota"><w:basedOn w:val="Base"/></w:style>'
+               '<w:style w:styleId="Sobra"/></w:styles>').encode()
+    podado = podar_estilos(estilos, {'Nota'}).decode('utf-8')
+    assert all(f'w:styleId="{id_}"' in podado for id_ in ('Normal', 'Base', 'Nota'))
+    assert 'Sobra' not in podado
+
+def test_runs_de_mesma_formatacao_viram_um():
+    xml = (f'<w:document {W}><w:body><w:p>'
+           '<w:r><w:t>Olá</w:t></w:r><w:r><w:t xml:space="preserve"> mundo</w:t></w:r>'
+           '<w:r><w:rPr><w:b/></w:rPr><w:t>!</w:t></w:r><w:r><w:rPr><w:b/></w:rPr><w:t>!</w:t></w:r>'
+           '</w:p></w:body></w:document>').encode()
+    juntado, removidos = juntar_runs(xml)
+    assert removidos == 2
+    texto = juntado.decode('utf-8')
+    assert '<w:t xml:space="preserve">Olá mundo</w:t>' in texto
+    assert '<w:t>!!</w:t>' in texto
+
+def test_runs_do_documento_juntados():
+    estatisticas = {}
+    dados = otimizar_docx(salvo(documento()), estatisticas=estatisticas)
+    assert estatisticas['runs_juntados'] == 1
+    assert [run.text for run in Document(io.BytesIO(dados)).paragraphs[1].runs] == ['Olá mundo', '!']
+
+def com_custom_xml(vinculado):
+    """O template padrão do python-docx já traz customXml/ e webSettings.xml"""
+    buffer = io.BytesIO()
+    vinculo = '<w:sdt><w:sdtPr><w:dataBinding w:xpath="/a"/></w:sdtPr></w:sdt>' if vinculado else ''
+    with zipfile.ZipFile(io.BytesIO(salvo(documento()))) as origem, zipfile.ZipFile(buffer, 'w') as z:
+        for info in origem.infolist():
+            dados = origem.read(info)
+            if info.filename == 'word/document.xml':
+                dados = dados.replace(b'</w:body>', vinculo.encode() + b'</w:body>')
+            z.writestr(info, dados)
+    return buffer.getvalue()
+
+def test_custom_xml_so_fica_com_data_binding():
+    estatisticas = {}
+    otimizar_docx(com_custom_xml(False), estatisticas=estatisticas)
+    assert {'customXml/item1.xml', 'word/webSettings.xml'} <= set(estatisticas['partes_removidas'])
+
+    dados = otimizar_docx(com_custom_xml(True), estatisticas=estatisticas)
+    assert 'customXml/item1.xml' not in estatisticas['partes_removidas']
+    assert 'word/webSettings.xml' in estatisticas['partes_removidas']
+    assert parte(dados, 'customXml/item1.xml') == parte(com_custom_xml(True), 'customXml/item1.xml')
+    assert 'customXml/item1.xml' in parte(dados, 'word/_rels/document.xml.rels')
+
+def test_compressao_fora_da_faixa():
+    with pytest.raises(ValueError, match='compressão'):
+        otimizar_docx(salvo(documento()), nivel=10)
+
+def test_otimizar_arquivo_pede_destino(tmp_path):
+    original = tmp_path / 'proposta.docx'
+    original.write_bytes(salvo(documento()))
+    with pytest.raises(ValueError, match='no_lugar'):
+        otimizar_arquivo(str(original))
+
+    destino = tmp_path / 'menor.docx'
+    estatisticas = otimizar_arquivo(str(original), str(destino))
+    assert destino.stat().st_size == estatisticas['depois'] < original.stat().st_size
+    otimizar_arquivo(str(original), no_lugar=True)
+    assert original.stat().st_size == estatisticas['depois']
@@ -0,0 +1,47 @@
+"""Pacote .zip/.tar de saída do lote"""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from gerador.pacote import NOME_INDICE, PacoteSaida, formato_pacote
+
+def test_zip_com_indice_e_nomes_repetidos(tmp_path):
+    destino = tmp_path / 'propostas.zip'
+    with PacoteSaida(str(destino)) as pacote:
+        assert pacote.adicionar('PROPOSTA_IBVA.docx', b'primeira', cliente='IBVA') == 'PROPOSTA_IBVA.docx'
+        assert pacote.adicionar('PROPOSTA_IBVA.docx', b'segunda', cliente='IBVA') == 'PROPOSTA_IBVA_2.docx'
+
+    with zipfile.ZipFile(destino) as z:
+        assert z.namelist() == ['PROPOSTA_IBVA.docx', 'PROPOSTA_IBVA_2.docx', NOME_INDICE]
+        assert z.getinfo('PROPOSTA_IBVA.docx').compress_type == zipfile.ZIP_STORED
+        assert z.read('PROPOSTA_IBVA_2.docx') == b'segunda'
+        indice = json.loads(z.read(NOME_INDICE))
+    assert indice['total'] == 2
+    assert [item['arquivo'] for item in indice['documentos']] == ['PROPOSTA_IBVA.docx', 'PROPOSTA_IBVA_2.docx']
+    assert indice['documentos'][0]['cliente'] == 'IBVA'
+
+def test_tar_em_fluxo():
+    buffer = io.BytesIO()
+    with PacoteSaida(buffer, 'tar') as pacote:
+        pacote.adicionar('a.docx', b'conteudo')
+    with tarfile.open(fileobj=io.BytesIO(buffer.getvalue())) as tar:
+        assert tar.getnames() == ['a.docx', NOME_INDICE]
+        assert tar.extractfile('a.docx').read() == b'conteudo'
+
+@pytest.mark.parametrize('extensao', ['zip', 'tar'])
+def test_erro_no_meio_apaga_o_pacote(tmp_path, extensao):
+    destino = tmp_path / f'propostas.{extensao}'
+    with pytest.raises(RuntimeError):
+        with PacoteSaida(str(destino)) as pacote:
+            pacote.adicionar('a.docx', b'conteudo')
+            raise RuntimeError('worker falhou')
+    assert not destino.exists()
+
+def test_formato_pela_extensao():
+    assert formato_pacote('saida/PROPOSTAS.ZIP') == 'zip'
+    with pytest.raises(ValueError):
+        formato_pacote('propostas.rar')
@@ -0,0 +1,38 @@
+"""Conversão de .docx em PDF pelo LibreOffice"""
+
+import os
+import stat
+
+import pytest
+
+from gerador.pdf import PoolLibreOffice, converter_com_soffice
+
+def soffice_falso(pasta, gera_pdf):
+    """Script no lugar do soffice: sai com 0 e, se `gera_pdf`, grava os PDFs pedidos"""
+    script = pasta / 'soffice'
+    corpo = '#!/bin/sh\nexit 0\n'
+    if gera_pdf:
+        corpo = ('#!/bin/sh\nwhile [ "$1" != "--outdir" ]; do shift; done\nsaida=$2; shift 2\n'
+                 'for docx in "$@"; do nome=$(basename "$docx" .docx); echo pdf > "$saida/$nome.pdf"; done\n')
+    script.write_text(corpo)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+@pytest.mark.parametrize('instancias, lote', [(0, 20), (2, 0), (-1, 1)])
+def test_pool_sem_instancias_e_erro(instancias, lote):
+    with pytest.raises(ValueError):
+        PoolLibreOffice(instancias, lote, soffice='soffice')
+
+def test_pdf_antigo_nao_conta_como_convertido(tmp_path):
+    (tmp_path / 'PROPOSTA.pdf').write_text('rodada anterior')
+    with pytest.raises(RuntimeError, match='não gerou'):
+        converter_com_soffice([str(tmp_path / 'PROPOSTA.docx')], str(tmp_path), soffice_falso(tmp_path, False))
+    assert not (tmp_path / 'PROPOSTA.pdf').exists()
+
+def test_pool_converte_em_lotes(tmp_path):
+    soffice = soffice_falso(tmp_path, True)
+    with PoolLibreOffice(2, 3, soffice=soffice) as pool:
+        futuros = [pool.converter(str(tmp_path / f'P{i}.docx'), str(tmp_path / 'pdf')) for i in range(7)]
+        pdfs = [futuro.result(timeout=30) for futuro in futuros]
+    assert pdfs == [os.path.join(str(tmp_path / 'pdf'), f'P{i}.pdf') for i in range(7)]
+    assert all(os.path.exists(pdf) for pdf in pdfs)
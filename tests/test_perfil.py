@@ -0,0 +1,36 @@
+"""PerfilEtapas: um registro por etapa da proposta"""
+
+import io
+import json
+
+from gerador.perfil import PerfilEtapas
+from gerador.proposta import CLIENTE_PADRAO, ETAPAS, montar_proposta
+
+def test_um_registro_por_etapa_na_ordem():
+    recebidos = []
+    perfil = PerfilEtapas(callback=recebidos.append)
+    doc = montar_proposta(CLIENTE_PADRAO, perfil=perfil)
+    perfil.encerrar()
+
+    assert [r['etapa'] for r in perfil.registros] == [nome for nome, _ in ETAPAS]
+    assert recebidos == perfil.registros
+    assert all(r['ms'] >= 0 and r['memoria_kb'] is not None for r in perfil.registros)
+    # Os blocos de todas as etapas são o corpo inteiro, menos o sectPr do template
+    assert sum(r['blocos'] for r in perfil.registros) == len(doc.element.body) - 1
+
+def test_json_e_tabela():
+    perfil = PerfilEtapas(cprofile=True, memoria=False, limite_funcoes=3)
+    montar_proposta(CLIENTE_PADRAO, perfil=perfil)
+
+    saida = io.StringIO()
+    perfil.salvar_json(saida)
+    dados = json.loads(saida.getvalue())
+    assert len(dados['etapas']) == len(ETAPAS)
+    assert dados['elementos'] == sum(r['elementos'] for r in perfil.registros) > 0
+    assert all(r['memoria_kb'] is None and len(r['funcoes']) <= 3 for r in dados['etapas'])
+
+    tabela = io.StringIO()
+    perfil.imprimir(tabela)
+    linhas = tabela.getvalue().splitlines()
+    assert linhas[0].startswith('etapa')
+    assert len(linhas) == len(ETAPAS) + 1
@@ -0,0 +1,27 @@
+"""Proposta gerada em memória e em arquivo"""
+
+import io
+import zipfile
+
+import pytest
+
+from gerador.proposta import create_proposta, proposta_em_bytes
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GERADOR_CACHE', str(tmp_path / 'cache'))
+
+def test_resumo_no_idioma_do_cliente(tmp_path, capsys):
+    caminho = tmp_path / 'PROPOSTA.docx'
+    create_proposta({'idioma': 'en', 'valor_sistema': 3000, 'valor_manutencao': 299.9}, caminho=str(caminho))
+    saida = capsys.readouterr().out
+    assert '💰 Valor proposto: R$3,000 + R$299.90/mês' in saida
+    assert zipfile.is_zipfile(caminho)
+
+def test_bytes_iguais_ao_arquivo(tmp_path, capsys):
+    caminho = tmp_path / 'PROPOSTA.docx'
+    create_proposta({'nome': 'Igreja Teste', 'sigla': 'IT'}, caminho=str(caminho))
+    dados = proposta_em_bytes({'nome': 'Igreja Teste', 'sigla': 'IT'})
+    with zipfile.ZipFile(io.BytesIO(dados)) as z, zipfile.ZipFile(caminho) as arquivo:
+        assert z.namelist() == arquivo.namelist()
+        assert z.read('word/document.xml') == arquivo.read('word/document.xml')
@@ -0,0 +1,42 @@
+"""Relatório mensal a partir da exportação de exemplo"""
+
+import io
+import os
+import re
+import zipfile
+
+import pytest
+
+from gerador.dados import abrir_fonte
+from gerador.relatorios import escrever_relatorio
+from gerador.streaming import DocumentoStream
+
+EXPORTACAO = os.path.join(os.path.dirname(__file__), '..', 'gerador', 'exemplo_exportacao')
+
+def textos_relatorio(idioma):
+    buffer = io.BytesIO()
+    fonte = abrir_fonte(EXPORTACAO)
+    try:
+        with DocumentoStream(buffer) as doc:
+            totais = escrever_relatorio(doc, fonte, 2025, 10, estatisticas=False, com_graficos=False,
+                                        idioma=idioma)
+    finally:
+        fonte.fechar()
+    with zipfile.ZipFile(buffer) as z:
+        xml = z.read('word/document.xml').decode('utf-8')
+    return totais, re.findall(r'<w:t[^>]*>([^<]*)</w:t>', xml)
+
+@pytest.mark.parametrize('idioma, mes, horas', [('pt_BR', 'Outubro 2025', '21,3'),
+                                               ('es', 'octubre de 2025', '21,3'),
+                                               ('en', 'October 2025', '21.3')])
+def test_numeros_e_meses_no_idioma(idioma, mes, horas):
+    totais, textos = textos_relatorio(idioma)
+    assert totais == {'requisicoes': 10, 'conflitos': 2, 'quase': 1, 'itens': 6}
+    assert mes in textos
+    assert horas in textos
+
+def test_horarios_dos_conflitos_no_formato_do_idioma():
+    _, textos = textos_relatorio('en')
+    assert any('(10/24 19:00–22:00)' in texto for texto in textos)
+    _, textos = textos_relatorio('pt_BR')
+    assert any('(24/10 19:00–22:00)' in texto for texto in textos)
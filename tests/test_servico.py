@@ -0,0 +1,92 @@
+"""Serviço HTTP: backpressure, validação dos pedidos e cabeçalhos"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from gerador import proposta, servico
+from gerador.servico import ServicoDocumentos, content_disposition
+
+@pytest.fixture
+def liberar(monkeypatch):
+    """Pedidos de proposta ficam presos até o evento ser liberado"""
+    evento = threading.Event()
+    monkeypatch.setattr(servico, '_aquecer_worker', lambda: None)
+    monkeypatch.setattr(proposta, 'proposta_em_bytes', lambda cliente: evento.wait(10) and b'docx')
+    yield evento
+    evento.set()
+
+async def pedir(porta, metodo='POST', caminho='/proposta', corpo=b''):
+    reader, writer = await asyncio.open_connection('127.0.0.1', porta)
+    writer.write(f'{metodo} {caminho} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(corpo)}\r\n\r\n'.encode()
+                 + corpo)
+    await writer.drain()
+    resposta = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    cabecalhos, _, conteudo = resposta.partition(b'\r\n\r\n')
+    linhas = cabecalhos.decode('latin-1').split('\r\n')
+    return int(linhas[0].split()[1]), linhas[1:], conteudo
+
+def rodar(servico_, teste):
+    async def principal():
+        servico_.iniciar()
+        servidor = await asyncio.start_server(servico_.conexao, '127.0.0.1', 0)
+        try:
+            async with servidor:
+                return await teste(servidor.sockets[0].getsockname()[1])
+        finally:
+            servico_.encerrar()
+    return asyncio.run(principal())
+
+def test_fila_cheia_responde_503(liberar):
+    servico_ = ServicoDocumentos(workers=1, fila=1, threads=True)
+
+    async def teste(porta):
+        pedidos = [asyncio.create_task(pedir(porta)) for _ in range(2)]
+        while servico_.metricas()['na_fila'] < 1:
+            await asyncio.sleep(0.01)
+        status, cabecalhos, conteudo = await pedir(porta)
+        liberar.set()
+        return (status, cabecalhos, json.loads(conteudo)), await asyncio.gather(*pedidos)
+
+    (status, cabecalhos, erro), atendidos = rodar(servico_, teste)
+    assert status == 503
+    assert 'Retry-After: 1' in cabecalhos
+    assert erro['na_fila'] == 1
+    assert [status for status, _, _ in atendidos] == [200, 200]
+    assert [conteudo for _, _, conteudo in atendidos] == [b'docx', b'docx']
+    metricas = servico_.metricas()
+    assert (metricas['atendidas'], metricas['rejeitadas']) == (2, 1)
+
+@pytest.mark.parametrize('cliente', [{'nome': 'X', 'modulos': 5}, {'nome': 'X', 'modulos': [['financeiro']]},
+                                     {'nome': 'X', 'modulos': ['nao_existe']}, {'nome': 7}, [1, 2]])
+def test_pedido_invalido_responde_400(liberar, cliente):
+    async def teste(porta):
+        return await pedir(porta, corpo=json.dumps(cliente).encode())
+
+    status, _, conteudo = rodar(ServicoDocumentos(workers=1, threads=True), teste)
+    assert status == 400
+    assert 'erro' in json.loads(conteudo)
+
+def test_rotas_desconhecidas_e_relatorio_desligado(liberar):
+    async def teste(porta):
+        return [(await pedir(porta, *pedido))[0] for pedido in
+                [('GET', '/nada'), ('GET', '/proposta'), ('POST', '/relatorio', b'{"exportacao": "x"}'),
+                 ('GET', '/saude')]]
+
+    assert rodar(ServicoDocumentos(workers=1, threads=True), teste) == [404, 405, 403, 200]
+
+def test_relatorio_fora_da_pasta_de_exportacoes(liberar, tmp_path):
+    async def teste(porta):
+        return (await pedir(porta, 'POST', '/relatorio', b'{"exportacao": "../../etc"}'))[0]
+
+    assert rodar(ServicoDocumentos(workers=1, threads=True, exportacoes=str(tmp_path)), teste) == 403
+
+def test_content_disposition_sem_quebra_de_linha():
+    cabecalho = content_disposition('PROPOSTA_ÇÃO "x".docx')
+    assert cabecalho == ('attachment; filename="PROPOSTA_CAO _x_.docx"; '
+                         "filename*=UTF-8''PROPOSTA_%C3%87%C3%83O%20%22x%22.docx")
+    assert '\r' not in content_disposition('a\r\nSet-Cookie: x')
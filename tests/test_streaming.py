@@ -0,0 +1,65 @@
+"""DocumentoStream: documento gravado em pedaços abre no python-docx"""
+
+import io
+import struct
+import zipfile
+import zlib
+
+import pytest
+from docx import Document
+
+from gerador.streaming import TAMANHO_BUFFER, DocumentoStream
+
+def png(largura=4, altura=2):
+    """PNG RGB mínimo (todo preto)"""
+    def chunk(tipo, corpo):
+        return struct.pack('>I', len(corpo)) + tipo + corpo + struct.pack('>I', zlib.crc32(tipo + corpo))
+    pixels = zlib.compress(bytes(1 + 3 * largura) * altura)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', largura, altura, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', pixels) + chunk(b'IEND', b''))
+
+def test_paragrafos_e_tabela_grandes(tmp_path):
+    destino = tmp_path / 'relatorio.docx'
+    linhas = ((f'Item {i}', str(i)) for i in range(2000))
+    with DocumentoStream(str(destino)) as doc:
+        doc.paragrafo('Relatório & anexos', 'SectionTitle')
+        doc.tabela(linhas, {'cabecalho': ('Item', 'Qtd'), 'estilo': 'Light Grid Accent 1'})
+        doc.quebra_pagina()
+        doc.paragrafo('Fim')
+    assert doc.bytes_corpo > TAMANHO_BUFFER
+
+    lido = Document(str(destino))
+    assert lido.paragraphs[0].text == 'Relatório & anexos'
+    assert lido.paragraphs[0].style.name == 'SectionTitle'
+    assert lido.paragraphs[-1].text == 'Fim'
+    tabela = lido.tables[0]
+    assert len(tabela.rows) == 2001
+    assert (tabela.cell(0, 0).text, tabela.cell(2000, 1).text) == ('Item', '1999')
+
+def test_estilos_sem_uso_ficam_de_fora():
+    buffer = io.BytesIO()
+    with DocumentoStream(buffer) as doc:
+        doc.paragrafo('Título', 'SectionTitle')
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as z:
+        estilos = z.read('word/styles.xml').decode('utf-8')
+    assert 'w:styleId="SectionTitle"' in estilos
+    assert 'w:styleId="TableTotal"' not in estilos
+
+def test_imagem_repetida_entra_uma_vez():
+    grafico = png()
+    buffer = io.BytesIO()
+    with DocumentoStream(buffer) as doc:
+        doc.imagem(grafico)
+        doc.imagem(grafico)
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as z:
+        midias = [nome for nome in z.namelist() if nome.startswith('word/media/')]
+    assert len(midias) == 1
+    assert len(Document(io.BytesIO(buffer.getvalue())).inline_shapes) == 2
+
+def test_erro_no_meio_apaga_o_arquivo(tmp_path):
+    destino = tmp_path / 'relatorio.docx'
+    with pytest.raises(RuntimeError):
+        with DocumentoStream(str(destino)) as doc:
+            doc.paragrafo('Começo')
+            raise RuntimeError('banco caiu')
+    assert not destino.exists()
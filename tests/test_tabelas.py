@@ -0,0 +1,63 @@
+"""Tabelas escritas direto em WordprocessingML"""
+
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.table import Table
+
+from gerador.tabelas import add_table_xml, iterar_tabela_xml, montar_tabela_xml
+
+ESPEC = {
+    'estilo': 'Light Grid Accent 1',
+    'cabecalho': ('Item', 'Valor'),
+    'fundo_cabecalho': '174ea6',
+    'estilo_cabecalho': 'TableHeader',
+    'destaque_ultima': {'fundo': 'FFD600', 'estilo': 'TableTotal'},
+}
+
+def tabela(xml):
+    return Table(parse_xml(xml), None)
+
+def linhas_de(xml):
+    return [[celula.text for celula in linha.cells] for linha in tabela(xml).rows]
+
+def test_cabecalho_linhas_e_destaque():
+    xml = montar_tabela_xml([('Sistema', 'R$ 3.000'), ('TOTAL', 'R$ 3.000')], ESPEC, 9000)
+    assert linhas_de(xml) == [['Item', 'Valor'], ['Sistema', 'R$ 3.000'], ['TOTAL', 'R$ 3.000']]
+    assert xml.count('w:fill="174ea6"') == 2
+    assert xml.count('w:fill="FFD600"') == 2
+    assert xml.count('<w:gridCol w:w="4500"/>') == 2
+    assert '<w:tblStyle w:val="LightGridAccent1"/>' in xml
+
+def test_texto_escapado_com_quebras_e_tabulacoes():
+    xml = montar_tabela_xml([('A & B <c>', 'linha 1\nlinha 2\tfim')], {}, 9000)
+    assert 'A &amp; B &lt;c&gt;' in xml
+    assert '<w:br/>' in xml and '<w:tab/>' in xml
+    assert linhas_de(xml)[0][0] == 'A & B <c>'
+
+def test_gerador_em_pedacos_sem_materializar():
+    def linhas():
+        for i in range(1000):
+            yield f'Item {i}', str(i)
+    pedacos = list(iterar_tabela_xml(linhas(), {'cabecalho': ('Item', 'Valor')}, 9000))
+    # Abertura com cabeçalho, uma linha por pedaço e o fechamento com a última
+    assert len(pedacos) == 1001
+    assert len(tabela(''.join(pedacos)).rows) == 1001
+
+def test_tabela_vazia_tem_uma_linha():
+    xml = ''.join(iterar_tabela_xml(iter(()), {}, 9000, colunas=3))
+    assert linhas_de(xml) == [['', '', '']]
+    assert linhas_de(montar_tabela_xml([], {}, 9000)) == [['']]
+
+def test_so_cabecalho_sem_linhas():
+    assert linhas_de(montar_tabela_xml([], {'cabecalho': ('Item', 'Valor')}, 9000)) == [['Item', 'Valor']]
+
+def test_linha_com_colunas_a_mais_e_erro():
+    with pytest.raises(ValueError, match='3 valores numa tabela de 2 colunas'):
+        montar_tabela_xml([('a', 'b', 'c')], ESPEC, 9000)
+
+def test_add_table_xml_resolve_estilos_do_documento():
+    doc = Document()
+    table = add_table_xml(doc, [('a', '1')], {'estilo': 'Light Grid Accent 1', 'cabecalho': ('Item', 'Valor')})
+    assert table.style.name == 'Light Grid Accent 1'
+    assert doc.tables[0].rows[1].cells[0].text == 'a'